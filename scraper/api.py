@@ -164,7 +164,7 @@ def get_raw_venue(venue_id: str):
                     "date": event.date,
                     "venue": event.venue,
                     "venue_id": event.source,
-                    "category": scraper._categorize(event.title, event.venue or ""),
+                    "category": event.category or scraper.categorize(event.title, event.venue),
                     "ticket_url": event.ticketUrl,
                     "status": status,
                     "reason": reason,
@@ -271,7 +271,7 @@ def scrape_venue(venue_id: str) -> ScrapeResponse:
 
                 if not is_duplicate:
                     # source is already set to matched venue_id by the scraper
-                    category = scraper._categorize(event.title, event.venue or "")
+                    category = event.category or scraper.categorize(event.title, event.venue)
                     new_events.append({
                         "id": event.id,
                         "title": event.title,
@@ -0,0 +1,30 @@
+# scraper/artifacts.py
+"""
+Atomic, skip-if-unchanged writes for generated artifacts.
+"""
+import os
+import tempfile
+from pathlib import Path
+
+
+def write_atomic(path: Path, raw: bytes) -> None:
+    """Replace path with raw via a temp file and rename."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(raw)
+        # mkstemp creates 0600; published files need to stay world-readable
+        os.chmod(tmp, path.stat().st_mode & 0o777 if path.exists() else 0o644)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def write_if_changed(path: Path, raw: bytes) -> bool:
+    """Atomically write raw unless path already holds it; returns whether it wrote."""
+    if path.exists() and path.read_bytes() == raw:
+        return False
+    write_atomic(path, raw)
+    return True
@@ -0,0 +1,142 @@
+# scraper/artist_index.py
+"""
+Inverted index from artist name to upcoming events and past shows.
+
+Every event contributes its headliner (the title, minus tour/support tails)
+and each of its supportingArtists. Names are keyed through the same
+normalize_text used for dedup, so "Leila's Rose" and "LEILAS ROSE" land on
+one entry. The index is updated in place as events come and go, so callers
+can answer "has this act played here before?" or "other dates for this act"
+with dict lookups instead of scanning titles. No runner builds it yet.
+"""
+import re
+from collections import defaultdict
+from pathlib import Path
+
+from feed_json import load_feed
+from history_store import HistoryStore
+from matching import normalize_text
+from models import Event, HistoricalShow, ScraperOutput, ShowHistory
+
+# Anything after these separators is usually a tour name or support list. A bare
+# "with" is not one: it is part of names like "Dancing with the Stars Live".
+HEADLINER_SPLIT = re.compile(r'\s+(?:-|–|—|w/|featuring|feat\.?|ft\.?)\s+|:\s+', re.IGNORECASE)
+# "An Evening with Bonnie Raitt": the act follows the "with"
+BILLING_PREFIX = re.compile(r'^(?:an?\s+)?(?:evening|night|afternoon)\s+with\s+', re.IGNORECASE)
+# "Band with Special Guests": the "with" starts an unnamed support slot
+SUPPORT_SUFFIX = re.compile(r'\s+with\s+(?:very\s+)?special\s+guests?\b.*$', re.IGNORECASE)
+
+
+def artist_key(name: str) -> str:
+    """Normalize an artist name for lookups."""
+    return " ".join(normalize_text(name).split())
+
+
+def headliner(title: str) -> str:
+    """Best-effort headliner name from an event title."""
+    if not title:
+        return ""
+    title = SUPPORT_SUFFIX.sub("", BILLING_PREFIX.sub("", title.strip()))
+    return HEADLINER_SPLIT.split(title, maxsplit=1)[0].strip()
+
+
+def artists_for(title: str, supporting_artists: list[str] | None) -> set[str]:
+    """Normalized artist keys for a title plus its supporting acts."""
+    keys = {artist_key(headliner(title))}
+    for artist in supporting_artists or []:
+        keys.add(artist_key(artist))
+    keys.discard("")
+    return keys
+
+
+class ArtistIndex:
+    """Maps normalized artist name -> event IDs and history entries."""
+
+    def __init__(self):
+        self._events: dict[str, set[str]] = defaultdict(set)
+        self._event_artists: dict[str, set[str]] = {}  # event id -> artist keys
+        self._shows: dict[str, list[HistoricalShow]] = defaultdict(list)
+        self._venues: dict[str, set[str]] = defaultdict(set)  # artist -> venues played
+        self._show_keys: set[tuple[str, str, str]] = set()
+
+    @classmethod
+    def build(cls, events: list[Event], shows: list[HistoricalShow]) -> "ArtistIndex":
+        index = cls()
+        for event in events:
+            index.add_event(event)
+        for show in shows:
+            index.add_show(show)
+        return index
+
+    @classmethod
+    def from_files(cls, events_path: Path, history_path: Path) -> "ArtistIndex":
+        """Build from events.json and history (missing files are treated as empty).
+
+        history_path may be a history.json file or a history store directory.
+        """
+        events = load_feed(events_path, ScraperOutput, ScraperOutput(events=[], lastUpdated="", sources=[])).events
+        if history_path.is_dir():
+            shows = list(HistoryStore(history_path).iter_shows())
+        else:
+            shows = load_feed(history_path, ShowHistory, ShowHistory(shows=[], lastUpdated="")).shows
+        return cls.build(events, shows)
+
+    def add_event(self, event: Event) -> None:
+        """Index an event, replacing any previous entry with the same ID."""
+        self.remove_event(event.id)
+        keys = artists_for(event.title, event.supportingArtists)
+        self._event_artists[event.id] = keys
+        for key in keys:
+            self._events[key].add(event.id)
+
+    def remove_event(self, event_id: str) -> None:
+        for key in self._event_artists.pop(event_id, ()):
+            ids = self._events.get(key)
+            if ids is None:
+                continue
+            ids.discard(event_id)
+            if not ids:
+                del self._events[key]
+
+    def add_show(self, show: HistoricalShow) -> bool:
+        """Index a past show. Returns False if it was already indexed."""
+        show_key = (show.date, show.title, show.venue)
+        if show_key in self._show_keys:
+            return False
+        self._show_keys.add(show_key)
+        for key in artists_for(show.title, show.supportingArtists):
+            self._shows[key].append(show)
+            self._venues[key].add(show.venue)
+        return True
+
+    def archive_event(self, event: Event) -> None:
+        """Move an event from the upcoming side of the index to history."""
+        self.remove_event(event.id)
+        self.add_show(HistoricalShow(
+            date=event.date,
+            title=event.title,
+            venue=event.venue,
+            supportingArtists=event.supportingArtists,
+        ))
+
+    def events_for(self, artist: str) -> set[str]:
+        """Upcoming event IDs featuring this artist."""
+        return set(self._events.get(artist_key(artist), ()))
+
+    def shows_for(self, artist: str) -> list[HistoricalShow]:
+        """Past shows featuring this artist, in insertion order."""
+        return list(self._shows.get(artist_key(artist), ()))
+
+    def has_played(self, artist: str, venue: str | None = None) -> bool:
+        """Whether the artist appears in history (optionally at a specific venue)."""
+        venues = self._venues.get(artist_key(artist))
+        if not venues:
+            return False
+        return venue is None or venue in venues
+
+    def __contains__(self, artist: str) -> bool:
+        key = artist_key(artist)
+        return key in self._events or key in self._shows
+
+    def __len__(self) -> int:
+        return len(self._events.keys() | self._shows.keys())
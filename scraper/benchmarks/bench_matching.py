@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmarks for the dedup/matching hot path.
+
+Times normalize_text, find_existing_event and VenueMatcher.match over a
+synthetic workload and prints throughput plus p50/p90/p99 latency.
+
+Usage:
+    python benchmarks/bench_matching.py
+    python benchmarks/bench_matching.py --events 5000 --candidates 10
+    python benchmarks/bench_matching.py --save baseline.json
+    python benchmarks/bench_matching.py --baseline baseline.json --tolerance 0.2
+"""
+import argparse
+import json
+import sys
+from dataclasses import asdict
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from matching import normalize_text, find_existing_event
+from venue_matcher import VenueMatcher
+from benchmarks.harness import BenchResult, compare, measure
+from benchmarks.workloads import StaticVenueSource, build_matching_workload
+
+
+def run_benchmarks(n_events: int, candidates: int, repeat: int, seed: int) -> list[BenchResult]:
+    workload = build_matching_workload(n_events=n_events, candidates_per_slot=candidates, seed=seed)
+
+    titles = [(e.title,) for e in workload.events]
+    for rows in workload.candidates.values():
+        titles.extend((row["title"],) for row in rows)
+
+    matcher = VenueMatcher(StaticVenueSource(workload.venues))
+    return [
+        measure("normalize_text", normalize_text, titles, repeat),
+        measure(
+            "find_existing_event",
+            find_existing_event,
+            [(e, workload.candidates_for(e)) for e in workload.events],
+            repeat,
+        ),
+        measure("VenueMatcher.match", matcher.match, [(n,) for n in workload.venue_names], repeat),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=2000, help="scraped events to match (N)")
+    parser.add_argument("--candidates", type=int, default=5, help="existing rows per (venue, date) (M)")
+    parser.add_argument("--repeat", type=int, default=3, help="passes over the workload")
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--save", type=Path, help="write results as JSON")
+    parser.add_argument("--baseline", type=Path, help="compare against a saved JSON run")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed p50 slowdown vs baseline")
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.events, args.candidates, args.repeat, args.seed)
+
+    print(f"Matching benchmark - {args.events} events x {args.candidates} candidates, {args.repeat} passes")
+    for result in results:
+        print(result.format())
+
+    if args.save:
+        args.save.write_text(json.dumps([asdict(r) for r in results], indent=2))
+        print(f"\nSaved results to {args.save}")
+
+    if args.baseline and not compare(results, args.baseline, args.tolerance):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
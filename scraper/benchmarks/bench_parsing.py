@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Per-venue HTML parse benchmark across parser backends.
+
+Runs each venue's parse_events over its saved fixture page with every
+installed backend (see scrapers/parsing.py) and reports the time to build
+the whole-page soup, the soup scoped to the scraper's container_selectors,
+and the full parse, plus the speedup over html.parser.
+
+Usage:
+    python benchmarks/bench_parsing.py
+    python benchmarks/bench_parsing.py --repeat 50 --fixtures tests/fixtures
+"""
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.harness import measure
+from scrapers.parsing import available_parsers, make_soup
+from scrapers.theslowdown import SlowdownScraper
+from scrapers.waitingroom import WaitingRoomScraper
+from scrapers.reverblounge import ReverbLoungeScraper
+
+FIXTURES_DIR = Path(__file__).parent.parent / "tests" / "fixtures"
+
+# fixture file stem -> scraper factory
+VENUE_FIXTURES = {
+    "theslowdown_sample": SlowdownScraper,
+    "waitingroom_sample": WaitingRoomScraper,
+    "reverblounge_sample": ReverbLoungeScraper,
+}
+
+
+def bench_venue(name: str, html: str, factory, parsers: list[str], repeat: int) -> list[tuple[str, float, float, float]]:
+    """Returns (parser, whole soup ms, scoped soup ms, parse_events ms) p50s per backend."""
+    rows = []
+    for parser in parsers:
+        scraper = factory()
+        scraper.parser = parser
+        whole = measure(f"{name} soup [{parser}]", make_soup, [(html, parser)], repeat)
+        scoped = measure(
+            f"{name} scoped soup [{parser}]", make_soup, [(html, parser, scraper.container_selectors)], repeat
+        )
+        full = measure(f"{name} parse [{parser}]", scraper.parse_events, [(html,)], repeat)
+        rows.append((parser, whole.p50_us / 1000, scoped.p50_us / 1000, full.p50_us / 1000))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--fixtures", type=Path, default=FIXTURES_DIR)
+    args = parser.parse_args()
+
+    parsers = available_parsers()
+    print(f"Parser benchmark - backends: {', '.join(parsers)}, {args.repeat} runs each (p50)")
+
+    for stem, factory in VENUE_FIXTURES.items():
+        path = args.fixtures / f"{stem}.html"
+        if not path.exists():
+            print(f"\n{stem}: fixture missing, skipped")
+            continue
+        html = path.read_text(encoding="utf-8")
+        rows = bench_venue(stem, html, factory, parsers, args.repeat)
+        baseline = next((full for p, _, _, full in rows if p == "html.parser"), None)
+
+        print(f"\n{stem} ({len(html) / 1024:.0f} KB)")
+        for backend, whole_ms, scoped_ms, full_ms in rows:
+            speedup = f"{baseline / full_ms:.2f}x" if baseline and full_ms else "-"
+            print(
+                f"  {backend:<12} soup {whole_ms:>7.2f} ms   scoped {scoped_ms:>7.2f} ms   "
+                f"parse_events {full_ms:>7.2f} ms   {speedup}"
+            )
+
+
+if __name__ == "__main__":
+    main()
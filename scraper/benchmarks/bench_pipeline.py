@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Offline end-to-end benchmark: every venue scraper plus the sync engine.
+
+Replays a fixture bundle recorded with http_fixtures.py, so no request
+leaves the machine. Each scraper's full scrape() is timed, including
+pagination, detail pages and Ticketmaster JSON. Then the sync engine's
+upsert_events is timed against an in-memory database, once into an empty
+database (every event is new) and once more over the same events (every
+event unchanged).
+
+The per-host rate limit is disabled by default since there is nobody to
+be polite to. Browser-driven scrapers (Astro, OhMyOmaha) are skipped
+because Playwright traffic is not in the bundle. Events are synced
+regardless of date, so an old bundle still exercises the whole path.
+
+Usage:
+    python http_fixtures.py record tests/fixtures/http/2026-10-19 --on-demand
+    python benchmarks/bench_pipeline.py --bundle tests/fixtures/http/2026-10-19
+    python benchmarks/bench_pipeline.py --bundle ... --save pipeline.json
+    python benchmarks/bench_pipeline.py --bundle ... --baseline pipeline.json
+"""
+import argparse
+import json
+import os
+import sys
+from dataclasses import asdict
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config import get_scrapers
+from http_fixtures import HttpReplayer
+from known_ids import KnownEventIds
+from scrapers.base import BaseScraper
+from scrapers.opa import OPAScraper
+from venue_matcher import VenueMatcher
+from benchmarks.harness import BenchResult, compare, measure
+from benchmarks.memory_db import MemoryDB
+from benchmarks.workloads import VENUES
+
+BROWSER_SCRAPERS = {"astrotheater", "ohmyomaha"}
+
+
+def load_sync_engine(db: MemoryDB):
+    """Import run_scrape_supabase wired to db instead of a real client, or None if it can't load."""
+    os.environ.setdefault("SUPABASE_URL", "http://offline.invalid")
+    os.environ.setdefault("SUPABASE_SERVICE_KEY", "offline.replay.key")
+    try:
+        import run_scrape_supabase
+    except Exception as e:
+        print(f"Sync stage skipped: {e}")
+        return None
+    run_scrape_supabase.supabase = db
+    return run_scrape_supabase
+
+
+def offline_scrapers(db: MemoryDB) -> list:
+    matcher = VenueMatcher(db)
+    scrapers = get_scrapers(
+        supabase_client=db,
+        venue_matcher=matcher,
+        api_keys={"ticketmaster": "offline"},
+        include_on_demand=True,
+    )
+    return [s for s in scrapers if s.id not in BROWSER_SCRAPERS]
+
+
+def scrape_fresh(scraper):
+    # OPA shares a class-level page cache between its two venues; clear it so
+    # every timed run does the same work
+    OPAScraper._cache = None
+    OPAScraper._price_cache = {}
+    return scraper.scrape()
+
+
+def run_benchmarks(bundle: Path, repeat: int) -> tuple[list[BenchResult], dict[str, int], dict[str, str], list[str]]:
+    results: list[BenchResult] = []
+    counts: dict[str, int] = {}
+    failures: dict[str, str] = {}
+    scraped: list[tuple[str, list]] = []
+
+    with HttpReplayer(bundle) as replayer:
+        for scraper in offline_scrapers(MemoryDB({"venues": VENUES})):
+            try:
+                events = scrape_fresh(scraper)
+            except Exception as e:
+                failures[scraper.id] = str(e)  # Usually a page missing from the bundle
+                continue
+            counts[scraper.id] = len(events)
+            scraped.append((scraper.id, events))
+            results.append(measure(f"scrape {scraper.id}", scrape_fresh, [(scraper,)], repeat))
+
+        engine = load_sync_engine(MemoryDB())
+        if engine:
+            def sync_all(db: MemoryDB):
+                engine.supabase = db
+                known_ids = KnownEventIds(db)
+                for scraper_id, events in scraped:
+                    engine.upsert_events(events, scraper_id, known_ids=known_ids)
+
+            warm = MemoryDB({"venues": VENUES})
+            sync_all(warm)
+            results.append(measure("sync new events", lambda: sync_all(MemoryDB({"venues": VENUES})), [()], repeat))
+            results.append(measure("sync unchanged events", sync_all, [(warm,)], repeat))
+
+    return results, counts, failures, replayer.misses
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--bundle", type=Path, required=True, help="fixture bundle recorded by http_fixtures.py")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--interval", type=float, default=0.0, help="per-host request spacing in seconds")
+    parser.add_argument("--save", type=Path, help="write results as JSON")
+    parser.add_argument("--baseline", type=Path, help="compare against a saved JSON run")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed p50 slowdown vs baseline")
+    args = parser.parse_args()
+
+    BaseScraper.page_interval = args.interval
+    results, counts, failures, misses = run_benchmarks(args.bundle, args.repeat)
+
+    print(f"Pipeline benchmark - bundle {args.bundle}, {args.repeat} runs each")
+    for result in results:
+        venue = result.name.removeprefix("scrape ")
+        suffix = f"  {counts[venue]} events" if venue in counts else ""
+        print(result.format() + suffix)
+    for scraper_id, error in failures.items():
+        print(f"  x {scraper_id}: {error}")
+    if misses:
+        print(f"\n{len(misses)} requests not in bundle (re-record to cover them):")
+        for key in sorted(set(misses)):
+            print(f"  {key}")
+
+    if args.save:
+        args.save.write_text(json.dumps([asdict(r) for r in results], indent=2))
+        print(f"\nSaved results to {args.save}")
+
+    if args.baseline and not compare(results, args.baseline, args.tolerance):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+# scraper/benchmarks/harness.py
+"""
+Minimal timing harness shared by the benchmark scripts.
+
+Each call of the function under test is timed individually so we can report
+percentiles as well as overall throughput.
+"""
+import json
+import math
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterable
+
+
+@dataclass
+class BenchResult:
+    name: str
+    calls: int
+    total_seconds: float
+    p50_us: float
+    p90_us: float
+    p99_us: float
+    max_us: float
+
+    @property
+    def ops_per_sec(self) -> float:
+        if self.total_seconds <= 0:
+            return 0.0
+        return self.calls / self.total_seconds
+
+    def format(self) -> str:
+        return (
+            f"{self.name:<32} {self.calls:>8} calls  {self.ops_per_sec:>12,.0f} ops/s  "
+            f"p50 {self.p50_us:>8.1f}us  p90 {self.p90_us:>8.1f}us  "
+            f"p99 {self.p99_us:>8.1f}us  max {self.max_us:>8.1f}us"
+        )
+
+
+def percentile(sorted_samples: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_samples:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_samples)))
+    return sorted_samples[rank - 1]
+
+
+def measure(name: str, fn: Callable, inputs: Iterable, repeat: int = 1) -> BenchResult:
+    """Call fn(*args) for every args tuple in inputs, `repeat` times over."""
+    inputs = list(inputs)
+    samples: list[float] = []
+    clock = time.perf_counter
+
+    for _ in range(repeat):
+        for args in inputs:
+            start = clock()
+            fn(*args)
+            samples.append(clock() - start)
+
+    samples.sort()
+    to_us = 1_000_000
+    return BenchResult(
+        name=name,
+        calls=len(samples),
+        total_seconds=sum(samples),
+        p50_us=percentile(samples, 50) * to_us,
+        p90_us=percentile(samples, 90) * to_us,
+        p99_us=percentile(samples, 99) * to_us,
+        max_us=(samples[-1] * to_us) if samples else 0.0,
+    )
+
+
+def compare(results: list[BenchResult], baseline_path: Path, tolerance: float) -> bool:
+    """Print the change against a saved run. Returns False on a p50 regression past tolerance."""
+    baseline = {r["name"]: r for r in json.loads(baseline_path.read_text())}
+    ok = True
+    print(f"\nCompared to {baseline_path}:")
+    for result in results:
+        old = baseline.get(result.name)
+        if not old or not old["p50_us"]:
+            continue
+        change = result.p50_us / old["p50_us"] - 1
+        flag = ""
+        if change > tolerance:
+            flag = "  REGRESSION"
+            ok = False
+        print(f"  {result.name:<32} p50 {old['p50_us']:.1f}us -> {result.p50_us:.1f}us ({change:+.0%}){flag}")
+    return ok
@@ -0,0 +1,90 @@
+# scraper/benchmarks/memory_db.py
+"""
+In-memory stand-in for the Supabase client, for offline pipeline runs.
+
+Implements just the query-builder calls the scrapers, VenueMatcher,
+KnownEventIds and the sync engine make: select / eq / neq / in_ / order /
+range / maybe_single / insert / update, then execute(). Rows are plain
+dicts kept per table.
+"""
+from types import SimpleNamespace
+
+
+class _Query:
+    def __init__(self, db: "MemoryDB", table: str):
+        self._db = db
+        self._table = table
+        self._filters = []
+        self._order = None
+        self._range = None
+        self._single = False
+        self._insert = None
+        self._update = None
+
+    def select(self, *columns, **kwargs):
+        return self
+
+    def eq(self, column, value):
+        self._filters.append(lambda row: row.get(column) == value)
+        return self
+
+    def neq(self, column, value):
+        self._filters.append(lambda row: row.get(column) != value)
+        return self
+
+    def in_(self, column, values):
+        values = set(values)
+        self._filters.append(lambda row: row.get(column) in values)
+        return self
+
+    def order(self, column, desc=False):
+        self._order = (column, desc)
+        return self
+
+    def range(self, start, end):
+        self._range = (start, end)
+        return self
+
+    def maybe_single(self):
+        self._single = True
+        return self
+
+    def insert(self, row):
+        self._insert = row if isinstance(row, list) else [row]
+        return self
+
+    def update(self, data):
+        self._update = data
+        return self
+
+    def execute(self):
+        rows = self._db.tables.setdefault(self._table, [])
+        self._db.calls += 1
+        if self._insert is not None:
+            rows.extend(dict(r) for r in self._insert)
+            return SimpleNamespace(data=self._insert)
+        matched = [r for r in rows if all(f(r) for f in self._filters)]
+        if self._update is not None:
+            for row in matched:
+                row.update(self._update)
+            return SimpleNamespace(data=matched)
+        if self._order:
+            column, desc = self._order
+            matched.sort(key=lambda r: r.get(column) or "", reverse=desc)
+        if self._range:
+            start, end = self._range
+            matched = matched[start:end + 1]
+        if self._single:
+            return SimpleNamespace(data=matched[0] if matched else None)
+        return SimpleNamespace(data=matched)
+
+
+class MemoryDB:
+    """Dict-of-lists database answering the supabase query chain."""
+
+    def __init__(self, tables: dict[str, list[dict]] | None = None):
+        self.tables: dict[str, list[dict]] = {name: [dict(r) for r in rows] for name, rows in (tables or {}).items()}
+        self.calls = 0
+
+    def table(self, name: str) -> _Query:
+        return _Query(self, name)
@@ -0,0 +1,183 @@
+# scraper/benchmarks/workloads.py
+"""
+Synthetic workloads for the matching benchmarks.
+
+Titles are assembled from word pools so the mix looks like what the scrapers
+produce: short artist names, tour suffixes, "with ..." support lists and the
+occasional renamed/moved show. Venue names come in their official form, as a
+known alias, or with a typo, plus a share of venues we have never heard of.
+Everything is driven by a seeded Random so runs are reproducible.
+"""
+import random
+from dataclasses import dataclass, field
+
+ARTIST_WORDS = [
+    "Midnight", "Velvet", "Arcade", "Hollow", "Copper", "Saint", "Neon", "Electric",
+    "Lunar", "Gannon", "Leila's", "Rose", "Witches", "Fremin", "Sister", "Brother",
+    "Kings", "Queens", "Ghost", "Motel", "Desert", "River", "Young", "Wild", "Static",
+    "Orchard", "Harbor", "Pilot", "Scattered", "Hamlet", "Summer", "Winter", "Diesel",
+    "Omaha", "Prairie", "Coyote", "Atlas", "Paper", "Glass", "Animals", "Union",
+]
+SHORT_PREFIXES = ["The", "DJ", "MC", "Los", "Lil"]
+TOUR_SUFFIXES = [
+    "World Tour", "Farewell Tour", "Live", "Album Release Show", "Tour 2026",
+    "An Evening With", "Acoustic Set", "(21+)", "- SOLD OUT", "Night Two",
+]
+SUPPORT_SUFFIXES = ["with Special Guests", "w/ Local Support", "and Friends"]
+RENAME_SUFFIXES = [" - Moved to Waiting Room", " - POSTPONED", " (Rescheduled)", " - Early Show"]
+
+VENUES = [
+    {"id": "waitingroom", "name": "Waiting Room Lounge", "aliases": ["waiting room", "the waiting room"]},
+    {"id": "theslowdown", "name": "The Slowdown", "aliases": ["slowdown"]},
+    {"id": "reverblounge", "name": "Reverb Lounge", "aliases": ["reverb"]},
+    {"id": "bourbontheatre", "name": "Bourbon Theatre", "aliases": ["bourbon theater", "the bourbon"]},
+    {"id": "admiral", "name": "Admiral", "aliases": ["the admiral", "admiral omaha"]},
+    {"id": "astrotheater", "name": "The Astro", "aliases": ["astro theater", "astro amphitheater"]},
+    {"id": "steelhouse", "name": "Steelhouse", "aliases": ["steelhouse omaha"]},
+    {"id": "baxterarena", "name": "Baxter Arena", "aliases": []},
+    {"id": "stircove", "name": "Stir Concert Cove", "aliases": ["stir cove"]},
+    {"id": "holland", "name": "Holland Performing Arts Center", "aliases": ["holland center"]},
+    {"id": "orpheum", "name": "Orpheum Theater", "aliases": ["orpheum theatre"]},
+    {"id": "thesydney", "name": "The Sydney", "aliases": ["sydney benson"]},
+]
+UNKNOWN_VENUES = [
+    "Barley Street Tavern", "Lookout Lounge", "Pageturners Lounge", "Petshop Gallery",
+    "The Down Under Lounge", "Sweatshop Gallery", "Bemis Center", "Hi-Fi House",
+]
+
+
+@dataclass
+class SyntheticEvent:
+    """Same attributes find_existing_event reads from a scraped Event."""
+    id: str
+    title: str
+    date: str
+    venue_id: str
+
+
+@dataclass
+class MatchingWorkload:
+    events: list[SyntheticEvent]
+    candidates: dict[tuple[str, str], list[dict]]  # (venue_id, date) -> db rows
+    venue_names: list[str]
+    venues: list[dict] = field(default_factory=lambda: [dict(v) for v in VENUES])
+
+    def candidates_for(self, event: SyntheticEvent) -> list[dict]:
+        return self.candidates.get((event.venue_id, event.date), [])
+
+
+def random_title(rng: random.Random) -> str:
+    """Build one plausible show title."""
+    words = rng.sample(ARTIST_WORDS, rng.choice([1, 2, 2, 2, 3]))
+    if rng.random() < 0.2:
+        words.insert(0, rng.choice(SHORT_PREFIXES))
+    title = " ".join(words)
+    roll = rng.random()
+    if roll < 0.25:
+        title = f"{title} {rng.choice(TOUR_SUFFIXES)}"
+    elif roll < 0.4:
+        title = f"{title} {rng.choice(SUPPORT_SUFFIXES)}"
+    return title
+
+
+def variant_title(rng: random.Random, title: str) -> str:
+    """Return the same show as another source (or a later scrape) might list it."""
+    roll = rng.random()
+    if roll < 0.3:
+        return title + rng.choice(RENAME_SUFFIXES)
+    if roll < 0.5:
+        return title.upper()
+    if roll < 0.7:
+        return title.replace("'", "").replace("-", " ")
+    if roll < 0.85:
+        return f"{title} {rng.choice(TOUR_SUFFIXES)}"
+    return title
+
+
+def misspell(rng: random.Random, name: str) -> str:
+    """Introduce a single-character typo (drop, double or swap)."""
+    if len(name) < 4:
+        return name
+    i = rng.randrange(1, len(name) - 2)
+    op = rng.choice(["drop", "double", "swap"])
+    if op == "drop":
+        return name[:i] + name[i + 1:]
+    if op == "double":
+        return name[:i] + name[i] + name[i:]
+    return name[:i] + name[i + 1] + name[i] + name[i + 2:]
+
+
+def random_venue_name(rng: random.Random) -> str:
+    """Pick a venue name the way scraped aggregator data presents them."""
+    roll = rng.random()
+    if roll < 0.15:
+        return rng.choice(UNKNOWN_VENUES)
+    venue = rng.choice(VENUES)
+    if roll < 0.45:
+        return venue["name"]
+    if roll < 0.7 and venue["aliases"]:
+        return rng.choice(venue["aliases"]).title()
+    if roll < 0.85:
+        return misspell(rng, venue["name"])
+    return f"  {venue['name'].lower()} "
+
+
+def build_matching_workload(
+    n_events: int = 2000,
+    candidates_per_slot: int = 5,
+    n_dates: int = 90,
+    match_rate: float = 0.6,
+    seed: int = 1234,
+) -> MatchingWorkload:
+    """
+    Generate N scraped events with M existing DB rows per (venue, date).
+
+    Roughly match_rate of the scraped events correspond to one of the rows in
+    their slot (under a variant title); the rest are genuinely new shows.
+    """
+    rng = random.Random(seed)
+    dates = [f"2026-{(d // 28) % 12 + 1:02d}-{d % 28 + 1:02d}" for d in range(n_dates)]
+    candidates: dict[tuple[str, str], list[dict]] = {}
+    events: list[SyntheticEvent] = []
+
+    for i in range(n_events):
+        venue_id = rng.choice(VENUES)["id"]
+        date = rng.choice(dates)
+        slot = (venue_id, date)
+        if slot not in candidates:
+            candidates[slot] = [
+                {"id": f"{venue_id}-{date}-{j}", "title": random_title(rng), "date": date, "venue_id": venue_id}
+                for j in range(candidates_per_slot)
+            ]
+        rows = candidates[slot]
+        if rows and rng.random() < match_rate:
+            title = variant_title(rng, rng.choice(rows)["title"])
+        else:
+            title = random_title(rng)
+        events.append(SyntheticEvent(id=f"scraped-{i}", title=title, date=date, venue_id=venue_id))
+
+    venue_names = [random_venue_name(rng) for _ in range(n_events)]
+    return MatchingWorkload(events=events, candidates=candidates, venue_names=venue_names)
+
+
+class StaticVenueSource:
+    """Serves a fixed venue list through the query chain VenueMatcher uses."""
+
+    def __init__(self, venues: list[dict]):
+        self._venues = venues
+
+    def table(self, name):
+        return self
+
+    def select(self, *args, **kwargs):
+        return self
+
+    def neq(self, *args, **kwargs):
+        return self
+
+    def execute(self):
+        return self
+
+    @property
+    def data(self):
+        return self._venues
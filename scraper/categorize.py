@@ -0,0 +1,83 @@
+# scraper/categorize.py
+"""
+Keyword-based event categorization shared by every scraper and the sync engine.
+
+Keywords match on word boundaries. When several categories match,
+sports beats theater beats comedy; no match gets the caller's default.
+"""
+import re
+
+CATEGORIES = ("music", "sports", "theater", "comedy")
+
+# category -> keywords, in priority order
+TITLE_KEYWORDS: dict[str, list[str]] = {
+    "sports": [
+        "vs", "vs.",
+        "omaha beef", "beef",
+        "omaha supernovas", "supernovas",
+        "lancers",
+        "storm chasers",
+        "mavericks",
+        "huskers",
+        "creighton",
+        "bluejays",
+        "world wrestling", "wwe", "wrestling",
+        "monster jam",
+        "harlem globetrotters", "globetrotters",
+    ],
+    "theater": [
+        "symphony", "orchestra", "philharmonic",
+        "ballet", "opera",
+        "broadway", "musical",
+        "disney on ice",
+        "cirque",
+        "blue man group",
+    ],
+    "comedy": [
+        "comedy", "comedian", "stand-up", "standup",
+        "live podcast",
+    ],
+}
+
+# Venues that almost always host sports, whatever the title says
+VENUE_KEYWORDS: dict[str, list[str]] = {
+    "sports": ["chi health center", "chi"],
+}
+
+
+def _compile(table: dict[str, list[str]]) -> re.Pattern:
+    groups = []
+    for category, keywords in table.items():
+        # Longest first so "omaha beef" wins over "beef" at the same position
+        alternatives = "|".join(re.escape(k) for k in sorted(keywords, key=len, reverse=True))
+        groups.append(f"(?P<{category}>{alternatives})")
+    return re.compile(r"(?<![a-z0-9])(?:" + "|".join(groups) + r")(?![a-z0-9])")
+
+
+_TITLE_PATTERN = _compile(TITLE_KEYWORDS)
+_VENUE_PATTERN = _compile(VENUE_KEYWORDS)
+_PRIORITY = {category: rank for rank, category in enumerate(TITLE_KEYWORDS)}
+
+
+def _best_category(pattern: re.Pattern, text: str) -> str | None:
+    best = None
+    for match in pattern.finditer(text):
+        category = match.lastgroup
+        if best is None or _PRIORITY[category] < _PRIORITY[best]:
+            best = category
+            if _PRIORITY[best] == 0:
+                break
+    return best
+
+
+def categorize(title: str, venue_name: str | None = None, default: str = "music") -> str:
+    """Categorize an event as music, sports, theater or comedy."""
+    title_category = _best_category(_TITLE_PATTERN, (title or "").lower())
+    if title_category == "sports":
+        return "sports"
+
+    if venue_name and _best_category(_VENUE_PATTERN, venue_name.lower()) == "sports":
+        # Could still be a concert at CHI, but without a music signal assume sports
+        return "sports"
+
+    return title_category or default
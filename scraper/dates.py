@@ -0,0 +1,144 @@
+# scraper/dates.py
+"""
+Date and time normalization shared by every scraper.
+
+parse_date returns "YYYY-MM-DD" and parse_time "HH:MM" (24-hour), or None.
+
+Date hints:
+    text     "Fri Feb 27", "Feb. 27, 2026", "Mar 06 @ 8:00 pm" (trailing text ignored)
+    numeric  "3/5/2026", "3/5/26"
+    any      text, then numeric
+
+A date without a year gets the current year, or next year if it would be
+more than ROLLOVER_DAYS in the past.
+
+Time hints:
+    12h      needs am/pm: "8:00PM", "7 pm", "6 p.m."; "Show:" beats "Doors:"
+    24h      like 12h, but a bare "20:00" is accepted too
+    labeled  only times after a "Show:" or "Doors:" label
+
+An hour above 12 is already 24-hour and any am/pm is ignored.
+"""
+import re
+from datetime import date
+from functools import lru_cache
+
+ROLLOVER_DAYS = 30
+
+MONTHS: dict[str, int] = {}
+for _number, _name in enumerate(
+    ("january", "february", "march", "april", "may", "june", "july",
+     "august", "september", "october", "november", "december"),
+    start=1,
+):
+    MONTHS[_name] = _number
+    MONTHS[_name[:3]] = _number
+MONTHS["sept"] = 9
+
+_WEEKDAY = r"(?:mon|tue|wed|thu|fri|sat|sun)[a-z]*\.?,?\s+"
+_TEXT_DATE_RE = re.compile(
+    rf"^\s*(?:{_WEEKDAY})?(?P<month>[a-z]+)\.?\s+(?P<day>\d{{1,2}})(?:st|nd|rd|th)?"
+    r"(?:,?\s+(?P<year>\d{4}))?(?!\d)",
+    re.IGNORECASE,
+)
+_NUMERIC_DATE_RE = re.compile(r"^\s*(?P<month>\d{1,2})/(?P<day>\d{1,2})/(?P<year>\d{4}|\d{2})(?!\d)")
+
+_TIME = r"(?<![\d:])(?P<hour>\d{1,2})(?::(?P<minute>\d{2}))?\s*(?P<period>[ap])\.?\s*m\b\.?"
+_TIME_RE = re.compile(_TIME, re.IGNORECASE)
+_CLOCK_RE = re.compile(r"(?<![\d:])(?P<hour>\d{1,2}):(?P<minute>\d{2})(?:\s*(?P<period>[ap])\.?\s*m\b\.?)?", re.IGNORECASE)
+_SHOW_RE = re.compile(r"show\s*:\s*" + _TIME, re.IGNORECASE)
+_DOORS_RE = re.compile(r"doors\s*:\s*" + _TIME, re.IGNORECASE)
+
+DATE_HINTS = ("text", "numeric", "any")
+TIME_HINTS = ("12h", "24h", "labeled")
+
+
+def infer_year(month: int, day: int, today: date | None = None) -> int:
+    """Year for a month/day listed without one, rolling over to next year when long past."""
+    today = today or date.today()
+    try:
+        if (today - date(today.year, month, day)).days > ROLLOVER_DAYS:
+            return today.year + 1
+    except ValueError:
+        pass  # Feb 29 outside a leap year; let the caller's validation reject it
+    return today.year
+
+
+def _build_date(year: int | None, month: int, day: int, today: date) -> str | None:
+    if year is None:
+        year = infer_year(month, day, today)
+    try:
+        return date(year, month, day).isoformat()
+    except ValueError:
+        return None
+
+
+def _parse_text_date(text: str, today: date) -> str | None:
+    match = _TEXT_DATE_RE.match(text)
+    if not match:
+        return None
+    month = MONTHS.get(match.group("month").lower())
+    if not month:
+        return None
+    year = match.group("year")
+    return _build_date(int(year) if year else None, month, int(match.group("day")), today)
+
+
+def _parse_numeric_date(text: str, today: date) -> str | None:
+    match = _NUMERIC_DATE_RE.match(text)
+    if not match:
+        return None
+    year = int(match.group("year"))
+    if year < 100:
+        year += 2000
+    return _build_date(year, int(match.group("month")), int(match.group("day")), today)
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_cached(text: str, hint: str, today: date) -> str | None:
+    if hint in ("text", "any"):
+        result = _parse_text_date(text, today)
+        if result or hint == "text":
+            return result
+    return _parse_numeric_date(text, today)
+
+
+def parse_date(text: str | None, hint: str = "text", today: date | None = None) -> str | None:
+    """Normalize a date string to YYYY-MM-DD (see module docstring for hints)."""
+    if not text:
+        return None
+    if hint not in DATE_HINTS:
+        raise ValueError(f"Unknown date hint: {hint!r}")
+    # today is part of the cache key so year inference stays correct across midnight
+    return _parse_date_cached(text, hint, today or date.today())
+
+
+def _clock(match: re.Match) -> str | None:
+    hour = int(match.group("hour"))
+    minute = int(match.group("minute") or 0)
+    period = (match.group("period") or "").lower()
+    if hour <= 12 and period:
+        if period == "p" and hour != 12:
+            hour += 12
+        elif period == "a" and hour == 12:
+            hour = 0
+    if hour > 23 or minute > 59:
+        return None
+    return f"{hour:02d}:{minute:02d}"
+
+
+@lru_cache(maxsize=4096)
+def _parse_time_cached(text: str, hint: str) -> str | None:
+    match = _SHOW_RE.search(text) or _DOORS_RE.search(text)
+    if not match and hint != "labeled":
+        match = _TIME_RE.search(text) or (_CLOCK_RE.search(text) if hint == "24h" else None)
+    return _clock(match) if match else None
+
+
+def parse_time(text: str | None, hint: str = "12h") -> str | None:
+    """Normalize a time string to 24-hour HH:MM (see module docstring for hints)."""
+    if not text:
+        return None
+    if hint not in TIME_HINTS:
+        raise ValueError(f"Unknown time hint: {hint!r}")
+    return _parse_time_cached(text, hint)
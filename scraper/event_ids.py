@@ -0,0 +1,77 @@
+# scraper/event_ids.py
+"""
+Event IDs, `<prefix>-<YYYY-MM-DD>-<slug>` cut to MAX_ID_LENGTH, shared by every scraper.
+
+The format is the Supabase primary key and must not drift. EventIds
+suffixes a different title that truncates onto a taken ID.
+"""
+import hashlib
+import logging
+import re
+from functools import lru_cache
+
+MAX_ID_LENGTH = 80
+SUFFIX_LENGTH = 8  # Hex digits of the title hash on a colliding ID
+
+_NON_ALNUM = re.compile(r'[^a-z0-9]+')
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=4096)
+def slugify(title: str, max_length: int | None = None) -> str:
+    """Lowercase hyphenated slug of a title, optionally cut to max_length."""
+    slug = _NON_ALNUM.sub('-', title.lower()).strip('-')
+    return slug[:max_length] if max_length else slug
+
+
+def make_event_id(prefix: str, date: str, title: str, slug_length: int | None = None) -> str:
+    """Stable event ID for a title on a date (see module docstring)."""
+    return f"{prefix}-{date}-{slugify(title, slug_length)}"[:MAX_ID_LENGTH]
+
+
+def _disambiguate(event_id: str, title: str) -> str:
+    digest = hashlib.sha1(slugify(title).encode()).hexdigest()[:SUFFIX_LENGTH]
+    return f"{event_id[:MAX_ID_LENGTH - SUFFIX_LENGTH - 1]}-{digest}"
+
+
+class EventIds:
+    """IDs handed out during one scrape, with the title that claimed each."""
+
+    def __init__(self):
+        self._titles: dict[str, str] = {}
+        self.collisions: list[tuple[str, str, str]] = []  # (id, kept title, renamed title)
+
+    def __contains__(self, event_id: str) -> bool:
+        return event_id in self._titles
+
+    def __len__(self) -> int:
+        return len(self._titles)
+
+    def claim(self, event_id: str, title: str) -> str | None:
+        """
+        Register an event under event_id.
+
+        Returns the ID to use, or None if a title with the same slug already
+        claimed it (a true duplicate to skip, even if case or punctuation
+        differ). A title whose slug differs, and only collides because of the
+        80-character cut, gets a disambiguated ID.
+        """
+        owner = self._titles.get(event_id)
+        if owner is None:
+            self._titles[event_id] = title
+            return event_id
+        if slugify(owner) == slugify(title):
+            return None
+        renamed = _disambiguate(event_id, title)
+        renamed_owner = self._titles.get(renamed)
+        if renamed_owner is not None and slugify(renamed_owner) == slugify(title):
+            return None
+        logger.warning("Event ID collision on %s: '%s' vs '%s'", event_id, owner, title)
+        self.collisions.append((event_id, owner, title))
+        self._titles[renamed] = title
+        return renamed
+
+    def allocate(self, prefix: str, date: str, title: str, slug_length: int | None = None) -> str | None:
+        """make_event_id plus claim(): the ID to use, or None for a duplicate."""
+        return self.claim(make_event_id(prefix, date, title, slug_length), title)
@@ -0,0 +1,57 @@
+# scraper/feed_compress.py
+"""
+Deterministic .gz (and, with brotli installed, .br) siblings of published feed files.
+
+A sibling is only rewritten when its decompressed content differs.
+"""
+import gzip
+import importlib
+import importlib.util
+from pathlib import Path
+
+from artifacts import write_atomic
+
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 11
+
+
+def brotli_available() -> bool:
+    return importlib.util.find_spec("brotli") is not None
+
+
+def _gzip(raw: bytes) -> bytes:
+    return gzip.compress(raw, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+def _brotli(raw: bytes) -> bytes:
+    return importlib.import_module("brotli").compress(raw, quality=BROTLI_QUALITY)
+
+
+def _unbrotli(data: bytes) -> bytes:
+    return importlib.import_module("brotli").decompress(data)
+
+
+def _write_if_changed(path: Path, raw: bytes, compress, decompress) -> bool:
+    if path.exists():
+        try:
+            if decompress(path.read_bytes()) == raw:
+                return False
+        except Exception:
+            pass  # Truncated or corrupt sibling, rewrite it
+    write_atomic(path, compress(raw))
+    return True
+
+
+def precompress(path: Path, raw: bytes | None = None) -> list[Path]:
+    """Refresh path's .gz (and .br) siblings; returns the ones rewritten.
+
+    raw is the file's content if the caller already has it in memory.
+    """
+    raw = path.read_bytes() if raw is None else raw
+    variants = [(path.with_name(path.name + ".gz"), _gzip, gzip.decompress)]
+    br_path = path.with_name(path.name + ".br")
+    if brotli_available():
+        variants.append((br_path, _brotli, _unbrotli))
+    elif br_path.exists():
+        br_path.unlink()
+    return [p for p, compress, decompress in variants if _write_if_changed(p, raw, compress, decompress)]
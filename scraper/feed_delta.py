@@ -0,0 +1,79 @@
+# scraper/feed_delta.py
+"""
+Per-run deltas of the events feed, written next to events.json:
+
+    deltas/index.json   {"version", "latest", "oldest", "lastUpdated"}
+    deltas/<seq>.json   {"seq", "previous", "added", "updated", "archived", ...}
+
+updated entries are {"id", "changes"}, a dropped field changing to null.
+Pollers apply previous+1 .. latest in order, or reload events.json when
+behind "oldest". Unchanged runs write no delta; KEEP_DELTAS are kept.
+"""
+import json
+from pathlib import Path
+
+from artifacts import write_atomic
+from models import Event, ScraperOutput
+
+DELTA_VERSION = 1
+DELTA_DIR = "deltas"
+KEEP_DELTAS = 60  # Two months of daily runs, plenty for the site's pollers
+
+
+def _dump(event: Event) -> dict:
+    return event.model_dump(exclude_none=True)
+
+
+def diff_events(previous: list[Event], current: list[Event]) -> dict:
+    """added / updated / archived between two event lists, keyed by event ID."""
+    before = {e.id: _dump(e) for e in previous}
+    added, updated = [], []
+    for event in current:
+        new = _dump(event)
+        old = before.pop(event.id, None)
+        if old is None:
+            added.append(new)
+        elif old != new:
+            changes = {k: new.get(k) for k in old.keys() | new.keys() if old.get(k) != new.get(k)}
+            updated.append({"id": event.id, "changes": dict(sorted(changes.items()))})
+    return {"added": added, "updated": updated, "archived": sorted(before)}
+
+
+def _read_index(delta_dir: Path) -> dict:
+    path = delta_dir / "index.json"
+    if path.exists():
+        return json.loads(path.read_text(encoding="utf-8"))
+    return {"version": DELTA_VERSION, "latest": 0, "oldest": 0, "lastUpdated": ""}
+
+
+def write_delta(previous: list[Event], output: ScraperOutput, out_dir: Path) -> dict | None:
+    """Write the delta from previous to output.events under out_dir/deltas.
+
+    Returns the delta, or None when nothing changed (no file is written).
+    """
+    changes = diff_events(previous, output.events)
+    if not any(changes.values()):
+        return None
+
+    delta_dir = out_dir / DELTA_DIR
+    delta_dir.mkdir(parents=True, exist_ok=True)
+    index = _read_index(delta_dir)
+    seq = index["latest"] + 1
+    delta = {
+        "version": DELTA_VERSION,
+        "seq": seq,
+        "previous": index["latest"],
+        "since": index["lastUpdated"],
+        "lastUpdated": output.lastUpdated,
+        **changes,
+    }
+    write_atomic(delta_dir / f"{seq}.json", json.dumps(delta, separators=(",", ":")).encode("utf-8"))
+
+    oldest = max(index["oldest"] or seq, seq - KEEP_DELTAS + 1)
+    for path in delta_dir.glob("*.json"):
+        if path.stem.isdigit() and int(path.stem) < oldest:
+            path.unlink()
+
+    index = {"version": DELTA_VERSION, "latest": seq, "oldest": oldest, "lastUpdated": output.lastUpdated}
+    write_atomic(delta_dir / "index.json", json.dumps(index, separators=(",", ":")).encode("utf-8"))
+    return delta
@@ -0,0 +1,176 @@
+# scraper/feed_ics.py
+"""
+iCalendar feeds, one per source plus one for everything:
+
+    calendar/
+      all.ics            every upcoming event
+      holland.ics        one source, empty when it has no upcoming events
+      hashes.json        feed_hash per feed; only changed feeds are re-rendered
+
+Timed events are EVENT_HOURS blocks in TZID, the rest are all-day. UIDs
+are event IDs and DTSTAMP is addedAt, so the output is stable.
+"""
+import hashlib
+import json
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+from artifacts import write_atomic, write_if_changed
+from feed_shards import group_events
+from models import Event, SourceStatus
+
+CALENDAR_DIR = "calendar"
+ALL_FEED = "all"
+RESERVED_ALL_KEY = "all-source"  # Where a source whose id is "all" goes instead
+FORMAT_VERSION = 1  # Bump when vevent()/render_calendar() output changes, to re-render every feed
+SITE_URL = "https://omahashows.com"
+TZID = "America/Chicago"
+EVENT_HOURS = 3
+
+VTIMEZONE = [
+    "BEGIN:VTIMEZONE",
+    f"TZID:{TZID}",
+    "BEGIN:DAYLIGHT",
+    "TZOFFSETFROM:-0600",
+    "TZOFFSETTO:-0500",
+    "TZNAME:CDT",
+    "DTSTART:19700308T020000",
+    "RRULE:FREQ=YEARLY;BYMONTH=3;BYDAY=2SU",
+    "END:DAYLIGHT",
+    "BEGIN:STANDARD",
+    "TZOFFSETFROM:-0500",
+    "TZOFFSETTO:-0600",
+    "TZNAME:CST",
+    "DTSTART:19701101T020000",
+    "RRULE:FREQ=YEARLY;BYMONTH=11;BYDAY=1SU",
+    "END:STANDARD",
+    "END:VTIMEZONE",
+]
+
+
+def escape_text(value: str) -> str:
+    return (value.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,")
+            .replace("\r\n", "\\n").replace("\n", "\\n"))
+
+
+def fold(line: str) -> str:
+    """Fold a content line at 75 octets (RFC 5545 3.1)."""
+    raw = line.encode("utf-8")
+    if len(raw) <= 75:
+        return line
+    parts, start, limit = [], 0, 75
+    while start < len(raw):
+        end = min(start + limit, len(raw))
+        while end < len(raw) and (raw[end] & 0xC0) == 0x80:
+            end -= 1  # Don't split a UTF-8 sequence
+        parts.append(raw[start:end].decode("utf-8"))
+        start, limit = end, 74  # Continuation lines start with a space
+    return "\r\n ".join(parts)
+
+
+def _stamp(event: Event) -> str:
+    try:
+        added = datetime.fromisoformat(event.addedAt or "")
+    except ValueError:
+        return f"{event.date.replace('-', '')}T000000Z"
+    if added.tzinfo is None:
+        added = added.replace(tzinfo=timezone.utc)
+    return added.astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def _when(event: Event) -> list[str]:
+    day = date.fromisoformat(event.date)
+    try:
+        hour, minute = (int(part) for part in (event.time or "").split(":")[:2])
+        start = datetime(day.year, day.month, day.day, hour, minute)
+    except ValueError:
+        return [f"DTSTART;VALUE=DATE:{day:%Y%m%d}", f"DTEND;VALUE=DATE:{day + timedelta(days=1):%Y%m%d}"]
+    end = start + timedelta(hours=EVENT_HOURS)
+    return [f"DTSTART;TZID={TZID}:{start:%Y%m%dT%H%M%S}", f"DTEND;TZID={TZID}:{end:%Y%m%dT%H%M%S}"]
+
+
+def _description(event: Event) -> str:
+    lines = []
+    if event.supportingArtists:
+        lines.append("With " + ", ".join(event.supportingArtists))
+    if event.price:
+        lines.append(event.price)
+    if event.ageRestriction:
+        lines.append(event.ageRestriction)
+    if event.ticketUrl:
+        lines.append(f"Tickets: {event.ticketUrl}")
+    return "\n".join(lines)
+
+
+def vevent(event: Event) -> list[str]:
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:{event.id}@omahashows.com",
+        f"DTSTAMP:{_stamp(event)}",
+        *_when(event),
+        f"SUMMARY:{escape_text(event.title)}",
+        f"LOCATION:{escape_text(event.venue)}",
+        f"URL:{SITE_URL}/show/{event.id}",
+    ]
+    description = _description(event)
+    if description:
+        lines.append(f"DESCRIPTION:{escape_text(description)}")
+    lines.append("END:VEVENT")
+    return lines
+
+
+def render_calendar(name: str, events: list[Event]) -> bytes:
+    lines = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        "PRODID:-//Omaha Shows//Scraper//EN",
+        "CALSCALE:GREGORIAN",
+        "METHOD:PUBLISH",
+        f"X-WR-CALNAME:{escape_text(name)}",
+        f"X-WR-TIMEZONE:{TZID}",
+        *VTIMEZONE,
+    ]
+    for event in events:
+        lines.extend(vevent(event))
+    lines.append("END:VCALENDAR")
+    return ("\r\n".join(fold(line) for line in lines) + "\r\n").encode("utf-8")
+
+
+def feed_hash(name: str, events: list[Event]) -> str:
+    """Hash of the output format, a feed's name and its events, in feed order."""
+    digest = hashlib.sha256(f"{FORMAT_VERSION}\n{name}\n".encode("utf-8"))
+    for event in events:
+        digest.update(event.model_dump_json(exclude_none=True).encode("utf-8"))
+        digest.update(b"\n")
+    return digest.hexdigest()[:16]
+
+
+def write_calendars(events: list[Event], sources: list[SourceStatus], out_dir: Path) -> list[str]:
+    """Write all.ics and one .ics per source under out_dir/calendar; returns the feeds re-rendered."""
+    cal_dir = out_dir / CALENDAR_DIR
+    cal_dir.mkdir(parents=True, exist_ok=True)
+    hashes_path = cal_dir / "hashes.json"
+    old_hashes = json.loads(hashes_path.read_text(encoding="utf-8")) if hashes_path.exists() else {}
+
+    names = {s.id: s.name for s in sources}
+    _, by_venue = group_events(events)
+    feeds = {ALL_FEED: ("Omaha Shows", events)}
+    # Every known source keeps its feed, empty or not; a 404 breaks subscriptions
+    known = {ALL_FEED if key == RESERVED_ALL_KEY else key for key in old_hashes if key != ALL_FEED}
+    for source in names.keys() | by_venue.keys() | known:
+        venue_events = by_venue.get(source, [])
+        name = names.get(source) or (venue_events[0].venue if venue_events else source)
+        feeds[RESERVED_ALL_KEY if source == ALL_FEED else source] = (f"{name} - Omaha Shows", venue_events)
+
+    hashes, rendered = {}, []
+    for key in sorted(feeds):
+        name, feed_events = feeds[key]
+        hashes[key] = feed_hash(name, feed_events)
+        path = cal_dir / f"{key}.ics"
+        if hashes[key] == old_hashes.get(key) and path.exists():
+            continue
+        write_atomic(path, render_calendar(name, feed_events))
+        rendered.append(key)
+
+    write_if_changed(hashes_path, json.dumps(hashes, separators=(",", ":")).encode("utf-8"))
+    return rendered
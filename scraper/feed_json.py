@@ -0,0 +1,126 @@
+# scraper/feed_json.py
+"""
+Reading and writing the JSON feeds, in the SCRAPER_JSON_FORMAT format:
+
+    compact  no whitespace, null fields omitted (default)
+    pretty   indented with nulls kept
+    short    compact with the SHORT_KEYS names plus a top-level "keyMap"
+
+Readers of short output must expand "keyMap" (short -> field name), as
+load_feed and scripts/validate-events.js do.
+"""
+import json
+import logging
+import os
+from pathlib import Path
+from typing import TypeVar
+
+from pydantic import BaseModel, ValidationError
+
+from artifacts import write_atomic
+
+FORMATS = ("compact", "pretty", "short")
+DEFAULT_FORMAT = "compact"
+
+# Field -> short key, shared by Event and HistoricalShow
+SHORT_KEYS = {
+    "id": "i",
+    "title": "t",
+    "date": "d",
+    "time": "tm",
+    "venue": "v",
+    "eventUrl": "eu",
+    "ticketUrl": "tu",
+    "imageUrl": "iu",
+    "price": "p",
+    "ageRestriction": "a",
+    "supportingArtists": "sa",
+    "source": "s",
+    "category": "c",
+    "addedAt": "aa",
+}
+LIST_FIELDS = ("events", "shows")  # Lists whose items get short keys
+
+# Stamped on every run whether or not anything changed (pydantic exclude spec)
+VOLATILE_FIELDS = {"lastUpdated": True, "sources": {"__all__": {"lastScraped"}}}
+
+Feed = TypeVar("Feed", bound=BaseModel)
+
+logger = logging.getLogger(__name__)
+
+_warned: set[str] = set()
+
+
+def resolve_format(name: str | None = None) -> str:
+    """Turn a configured format name into one of FORMATS."""
+    name = (name or os.environ.get("SCRAPER_JSON_FORMAT") or DEFAULT_FORMAT).strip().lower()
+    if name not in FORMATS:
+        if name not in _warned:
+            _warned.add(name)
+            logger.warning("JSON format %r unknown, using %s", name, DEFAULT_FORMAT)
+        return DEFAULT_FORMAT
+    return name
+
+
+def _shorten(data: dict) -> dict:
+    for field in LIST_FIELDS:
+        if field in data:
+            data[field] = [{SHORT_KEYS.get(k, k): v for k, v in item.items()} for item in data[field]]
+    data["keyMap"] = {short: name for name, short in SHORT_KEYS.items()}
+    return data
+
+
+def _expand(data: dict) -> dict:
+    key_map = data.pop("keyMap")
+    for field in LIST_FIELDS:
+        if field in data:
+            data[field] = [{key_map.get(k, k): v for k, v in item.items()} for item in data[field]]
+    return data
+
+
+def dump_feed(feed: BaseModel, format: str | None = None) -> bytes:
+    """Serialize a ScraperOutput or ShowHistory as UTF-8 JSON."""
+    format = resolve_format(format)
+    if format == "pretty":
+        return feed.model_dump_json(indent=2).encode("utf-8")
+    if format == "compact":
+        return feed.model_dump_json(exclude_none=True).encode("utf-8")
+    data = _shorten(feed.model_dump(mode="json", exclude_none=True))
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _same_feed(raw: bytes, feed: BaseModel, format: str) -> bool:
+    try:
+        stored = parse_feed(raw, type(feed))
+    except ValueError:
+        return False
+    if dump_feed(stored, format) != raw:
+        return False  # Written in another format, rewrite it
+    return stored.model_dump(exclude=VOLATILE_FIELDS) == feed.model_dump(exclude=VOLATILE_FIELDS)
+
+
+def write_feed(path: Path, feed: BaseModel, format: str | None = None) -> bool:
+    """Atomically write the feed; returns False if path already held it (timestamps aside)."""
+    format = resolve_format(format)
+    if path.exists() and _same_feed(path.read_bytes(), feed, format):
+        return False
+    write_atomic(path, dump_feed(feed, format))
+    return True
+
+
+def parse_feed(raw: bytes | str, model: type[Feed]) -> Feed:
+    """Validate feed JSON in any of the formats into `model`."""
+    try:
+        return model.model_validate_json(raw)
+    except ValidationError:
+        data = json.loads(raw)
+        if not isinstance(data, dict) or "keyMap" not in data:
+            raise
+        return model.model_validate(_expand(data))
+
+
+def load_feed(path: Path, model: type[Feed], default: Feed) -> Feed:
+    """Read a feed file, or return `default` if it doesn't exist."""
+    if path.exists():
+        return parse_feed(path.read_bytes(), model)
+    return default
@@ -0,0 +1,86 @@
+# scraper/feed_shards.py
+"""
+Per-month and per-venue shards of the events feed:
+
+    events/
+      manifest.json            every shard's path, count and hash, plus source statuses
+      by-month/2026-03.json    events dated in that month
+      by-venue/holland.json    events from one source (venue ID, or "other")
+
+Shards are ScraperOutput feeds whose lastUpdated is their newest addedAt,
+so an unchanged shard keeps its hash and file.
+"""
+import hashlib
+import json
+from collections import defaultdict
+from pathlib import Path
+
+from artifacts import write_atomic, write_if_changed
+from feed_json import dump_feed
+from models import Event, ScraperOutput
+
+MANIFEST_VERSION = 1
+SHARD_DIR = "events"
+HASH_LENGTH = 16  # Hex digits of sha256
+
+
+def _shard_hash(raw: bytes) -> str:
+    return hashlib.sha256(raw).hexdigest()[:HASH_LENGTH]
+
+
+def group_events(events: list[Event]) -> tuple[dict[str, list[Event]], dict[str, list[Event]]]:
+    """(events by YYYY-MM, events by source), each keeping the feed's order."""
+    by_month: dict[str, list[Event]] = defaultdict(list)
+    by_venue: dict[str, list[Event]] = defaultdict(list)
+    for event in events:
+        by_month[event.date[:7]].append(event)
+        by_venue[event.source].append(event)
+    return by_month, by_venue
+
+
+def _shard(events: list[Event]) -> ScraperOutput:
+    return ScraperOutput(events=events, lastUpdated=max(e.addedAt or "" for e in events), sources=[])
+
+
+def _without_timestamps(manifest: dict) -> dict:
+    sources = [{k: v for k, v in s.items() if k != "lastScraped"} for s in manifest.get("sources", [])]
+    return {**manifest, "lastUpdated": None, "sources": sources}
+
+
+def _write_group(directory: Path, shards: dict[str, ScraperOutput], format: str | None) -> dict[str, dict]:
+    directory.mkdir(parents=True, exist_ok=True)
+    entries = {}
+    for key in sorted(shards):
+        raw = dump_feed(shards[key], format)
+        path = directory / f"{key}.json"
+        write_if_changed(path, raw)
+        entries[key] = {
+            "path": f"{directory.name}/{path.name}",
+            "hash": _shard_hash(raw),
+            "count": len(shards[key].events),
+        }
+    for stale in directory.glob("*.json"):
+        if stale.stem not in shards:
+            stale.unlink()
+    return entries
+
+
+def write_shards(output: ScraperOutput, out_dir: Path, format: str | None = None) -> dict:
+    """Write month and venue shards plus manifest.json under out_dir/events; return the manifest."""
+    shard_dir = out_dir / SHARD_DIR
+    by_month, by_venue = group_events(output.events)
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "lastUpdated": output.lastUpdated,
+        "count": len(output.events),
+        "months": _write_group(shard_dir / "by-month", {k: _shard(v) for k, v in by_month.items()}, format),
+        "venues": _write_group(shard_dir / "by-venue", {k: _shard(v) for k, v in by_venue.items()}, format),
+        "sources": [s.model_dump(exclude_none=True) for s in output.sources],
+    }
+    manifest_path = shard_dir / "manifest.json"
+    if manifest_path.exists():
+        stored = json.loads(manifest_path.read_text(encoding="utf-8"))
+        if _without_timestamps(stored) == _without_timestamps(manifest):
+            return stored
+    write_atomic(manifest_path, json.dumps(manifest, separators=(",", ":")).encode("utf-8"))
+    return manifest
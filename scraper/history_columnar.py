@@ -0,0 +1,140 @@
+# scraper/history_columnar.py
+"""
+Columnar encoding of the show history, history/columnar/<year>.json:
+
+    {
+      "version": 1,
+      "year": "2026",
+      "count": 3,
+      "venues": ["Reverb Lounge", "Slowdown"],         interned strings
+      "artists": ["Firestarter", "Molten"],
+      "start": "2026-03-02",                            date of the first show
+      "dates": [0, 1, 5],                               days back from the previous show
+      "titles": ["Stateside", "Scattered Hamlet", "Band"],
+      "venue": [0, 0, 1],                               index into venues
+      "support": [[0], [1], null]                       indexes into artists, null = none
+    }
+
+Shows are newest first.
+"""
+import json
+from datetime import date
+from itertools import accumulate
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from history_store import HistoryStore
+from models import HistoricalShow, ShowHistory
+
+COLUMNAR_VERSION = 1
+COLUMNAR_DIR = "columnar"
+
+
+def _interner(table: list[str]):
+    index: dict[str, int] = {}
+
+    def intern(value: str) -> int:
+        if value not in index:
+            index[value] = len(table)
+            table.append(value)
+        return index[value]
+    return intern
+
+
+def encode_history(shows: Iterable[HistoricalShow], year: str = "") -> dict:
+    """Columnar dict for shows, which must be newest first."""
+    venues: list[str] = []
+    artists: list[str] = []
+    venue_id, artist_id = _interner(venues), _interner(artists)
+    titles, venue_col, support_col, deltas = [], [], [], []
+    start = previous = None
+    for show in shows:
+        day = date.fromisoformat(show.date).toordinal()
+        if start is None:
+            start = previous = day
+        if day > previous:
+            raise ValueError(f"shows must be newest first, {show.date} follows a later date")
+        deltas.append(previous - day)
+        previous = day
+        titles.append(show.title)
+        venue_col.append(venue_id(show.venue))
+        support = show.supportingArtists
+        support_col.append(None if support is None else [artist_id(a) for a in support])
+    return {
+        "version": COLUMNAR_VERSION,
+        "year": year,
+        "count": len(titles),
+        "venues": venues,
+        "artists": artists,
+        "start": date.fromordinal(start).isoformat() if start is not None else "",
+        "dates": deltas,
+        "titles": titles,
+        "venue": venue_col,
+        "support": support_col,
+    }
+
+
+class ColumnarHistory:
+    """Read-only, lazily decoded view of one columnar history file."""
+
+    def __init__(self, data: dict):
+        if data.get("version") != COLUMNAR_VERSION:
+            raise ValueError(f"unsupported columnar history version {data.get('version')!r}")
+        self.year: str = data["year"]
+        self._data = data
+        self._dates: list[str] | None = None
+
+    @classmethod
+    def load(cls, path: Path) -> "ColumnarHistory":
+        return cls(json.loads(path.read_bytes()))
+
+    @property
+    def dates(self) -> list[str]:
+        """ISO date per show, expanded from the deltas on first use."""
+        if self._dates is None:
+            data = self._data
+            start = date.fromisoformat(data["start"]).toordinal() if data["dates"] else 0
+            self._dates = [date.fromordinal(start - back).isoformat()
+                           for back in accumulate(data["dates"])]
+        return self._dates
+
+    @property
+    def venues(self) -> list[str]:
+        return self._data["venues"]
+
+    def __len__(self) -> int:
+        return self._data["count"]
+
+    def __getitem__(self, i: int) -> HistoricalShow:
+        data = self._data
+        support = data["support"][i]
+        return HistoricalShow(
+            date=self.dates[i],
+            title=data["titles"][i],
+            venue=data["venues"][data["venue"][i]],
+            supportingArtists=None if support is None else [data["artists"][a] for a in support],
+        )
+
+    def __iter__(self) -> Iterator[HistoricalShow]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def to_history(self, last_updated: str = "") -> ShowHistory:
+        return ShowHistory(shows=list(self), lastUpdated=last_updated)
+
+
+def write_columnar(store: HistoryStore) -> list[Path]:
+    """Re-encode the years archival touched (or whose file is missing); returns the files written."""
+    directory = store.root / COLUMNAR_DIR
+
+    def render(year: str, shows: Iterator[HistoricalShow]) -> bytes:
+        return json.dumps(encode_history(shows, year), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    return [directory / f"{year}.json" for year in store.refresh_yearly(directory, render)]
+
+
+def read_columnar(directory: Path) -> Iterator[ColumnarHistory]:
+    """Every year under directory, newest first, each decoded when reached."""
+    for path in sorted(directory.glob("*.json"), reverse=True):
+        if path.stem.isdigit():
+            yield ColumnarHistory.load(path)
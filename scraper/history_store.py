@@ -0,0 +1,234 @@
+# scraper/history_store.py
+"""
+Append-only show history partitioned by month:
+
+    history/
+      keys.txt              hashed (date, title, venue) per line, for dedup
+      meta.json             lastUpdated plus the show count per partition
+      2026/2026-03.jsonl    that month's shows, oldest first, one JSON object per line
+
+Shows are written before their keys, so a crash between the two appends
+the shows again next run. Repeated lines are skipped on read and not
+counted in meta.json. keys.txt and meta.json are rebuilt from the
+partitions if missing.
+"""
+import hashlib
+import heapq
+import json
+import logging
+import os
+from bisect import bisect_left
+from collections import defaultdict
+from operator import attrgetter
+from pathlib import Path
+from typing import Callable, Iterable, Iterator
+
+from artifacts import write_atomic, write_if_changed
+from feed_json import load_feed
+from models import Event, HistoricalShow, ShowHistory
+
+KEYS_FILE = "keys.txt"
+META_FILE = "meta.json"
+KEY_LENGTH = 16  # Hex digits of sha1
+
+_by_date = attrgetter("date")
+
+logger = logging.getLogger(__name__)
+
+
+def show_key(date: str, title: str, venue: str) -> str:
+    """Hashed dedup key for a show, as stored in keys.txt."""
+    return hashlib.sha1(f"{date}\x1f{title}\x1f{venue}".encode("utf-8")).hexdigest()[:KEY_LENGTH]
+
+
+def _key_of(show: HistoricalShow) -> str:
+    return show_key(show.date, show.title, show.venue)
+
+
+def _dump_lines(shows: Iterable[HistoricalShow]) -> list[str]:
+    return [s.model_dump_json(exclude_none=True) + "\n" for s in shows]
+
+
+def _last_line(path: Path) -> str:
+    """Last line of a file, read from the end."""
+    with path.open("rb") as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        chunk = b""
+        while pos > 0 and chunk.count(b"\n") < 2:
+            step = min(4096, pos)
+            pos -= step
+            f.seek(pos)
+            chunk = f.read(step) + chunk
+    lines = chunk.rstrip(b"\n").rsplit(b"\n", 1)
+    return lines[-1].decode("utf-8")
+
+
+def split_past(events: list[Event], today: str) -> tuple[list[Event], list[Event]]:
+    """(past, upcoming) from events sorted by date, split by bisecting for today."""
+    cut = bisect_left(events, today, key=_by_date)
+    return events[:cut], events[cut:]
+
+
+def show_of(event: Event) -> HistoricalShow:
+    return HistoricalShow(
+        date=event.date,
+        title=event.title,
+        venue=event.venue,
+        supportingArtists=event.supportingArtists,
+    )
+
+
+class HistoryStore:
+    """Month-partitioned history with a persisted key index."""
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        meta_path = self.root / META_FILE
+        if meta_path.exists():
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            self.last_updated: str = meta.get("lastUpdated", "")
+            self.partitions: dict[str, int] = meta.get("partitions", {})
+        else:
+            self.last_updated, self.partitions = "", self._count_partitions()
+            if self.partitions:
+                self._write_meta()
+        self._keys = self._load_keys()
+        self.changed: set[str] = set()  # Months appended to since the store was opened
+
+    def _partition_path(self, month: str) -> Path:
+        return self.root / month[:4] / f"{month}.jsonl"
+
+    def _count_partitions(self) -> dict[str, int]:
+        """Show count per partition, read from the partitions themselves."""
+        return {path.stem: self._count_shows(path.stem) for path in sorted(self.root.glob("*/*.jsonl"))}
+
+    def _count_shows(self, month: str) -> int:
+        """Distinct shows in a partition, counting its lines as read_partition does."""
+        with self._partition_path(month).open(encoding="utf-8") as f:
+            return len({line for line in f if line.strip()})
+
+    def _write_meta(self) -> None:
+        meta = {"lastUpdated": self.last_updated, "partitions": dict(sorted(self.partitions.items()))}
+        write_atomic(self.root / META_FILE, json.dumps(meta, separators=(",", ":")).encode("utf-8"))
+
+    def _load_keys(self) -> set[str]:
+        keys_path = self.root / KEYS_FILE
+        if keys_path.exists():
+            return set(keys_path.read_text(encoding="utf-8").split())
+        keys = set()
+        for month in self.partitions:
+            keys.update(_key_of(show) for show in self.read_partition(month))
+        if keys:
+            write_atomic(keys_path, "".join(f"{k}\n" for k in sorted(keys)).encode("utf-8"))
+        return keys
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: tuple[str, str, str]) -> bool:
+        return show_key(*key) in self._keys
+
+    def append(self, shows: Iterable[HistoricalShow], now: str | None = None) -> int:
+        """Archive the shows not already stored; returns how many were added."""
+        by_month: dict[str, list[HistoricalShow]] = defaultdict(list)
+        new_keys: list[str] = []
+        for show in shows:
+            key = _key_of(show)
+            if key in self._keys:
+                continue
+            self._keys.add(key)
+            new_keys.append(key)
+            by_month[show.date[:7]].append(show)
+        if not new_keys:
+            return 0
+
+        for month, month_shows in by_month.items():
+            self._add_to_partition(month, sorted(month_shows, key=_by_date))
+            self.partitions[month] = self._count_shows(month)
+        self.changed.update(by_month)
+
+        with (self.root / KEYS_FILE).open("a", encoding="utf-8") as f:
+            f.writelines(f"{k}\n" for k in new_keys)
+
+        if now:
+            self.last_updated = now
+        self._write_meta()
+        return len(new_keys)
+
+    def _add_to_partition(self, month: str, shows: list[HistoricalShow]) -> None:
+        """Add date-sorted shows to a partition, keeping it sorted."""
+        path = self._partition_path(month)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.exists() and path.stat().st_size:
+            last = HistoricalShow.model_validate_json(_last_line(path))
+            if shows[0].date < last.date:
+                merged = heapq.merge(self.read_partition(month), shows, key=_by_date)
+                write_atomic(path, "".join(_dump_lines(merged)).encode("utf-8"))
+                return
+        with path.open("a", encoding="utf-8") as f:
+            f.writelines(_dump_lines(shows))
+
+    def read_partition(self, month: str) -> list[HistoricalShow]:
+        """Shows from one YYYY-MM partition, oldest first, skipping repeated lines."""
+        path = self._partition_path(month)
+        if not path.exists():
+            return []
+        shows, seen = [], set()
+        with path.open(encoding="utf-8") as f:
+            for line in f:
+                if line.strip() and line not in seen:
+                    seen.add(line)
+                    shows.append(HistoricalShow.model_validate_json(line))
+        return shows
+
+    def iter_shows(self) -> Iterator[HistoricalShow]:
+        """Every show, newest date first, reading one partition at a time."""
+        for month in sorted(self.partitions, reverse=True):
+            yield from reversed(self.read_partition(month))
+
+    @property
+    def years(self) -> list[str]:
+        """Years with at least one partition, newest first."""
+        return sorted({month[:4] for month in self.partitions}, reverse=True)
+
+    def iter_year(self, year: str) -> Iterator[HistoricalShow]:
+        """Shows from one year, newest date first."""
+        for month in sorted((m for m in self.partitions if m.startswith(year)), reverse=True):
+            yield from reversed(self.read_partition(month))
+
+    def refresh_yearly(self, directory: Path, render: Callable[[str, Iterator[HistoricalShow]], bytes]) -> list[str]:
+        """Keep one derived file per year in directory up to date; returns the years rebuilt.
+
+        Only years appended to since the store was opened, or whose file is
+        missing, are rendered (render(year, shows newest first) -> bytes).
+        Files for years the store doesn't have are removed.
+        """
+        directory.mkdir(parents=True, exist_ok=True)
+        years = self.years
+        changed = {month[:4] for month in self.changed}
+        rebuilt = []
+        for year in years:
+            path = directory / f"{year}.json"
+            if year in changed or not path.exists():
+                write_if_changed(path, render(year, self.iter_year(year)))
+                rebuilt.append(year)
+        for path in directory.glob("*.json"):
+            if path.stem.isdigit() and path.stem not in years:
+                path.unlink()
+        return rebuilt
+
+    def to_history(self) -> ShowHistory:
+        """The whole store as a ShowHistory, for callers that still want one."""
+        return ShowHistory(shows=list(self.iter_shows()), lastUpdated=self.last_updated)
+
+
+def open_store(root: Path, legacy_json: Path | None = None) -> HistoryStore:
+    """Open the store, folding in and then deleting legacy_json (an old history.json)."""
+    store = HistoryStore(root)
+    if legacy_json is not None and legacy_json.exists():
+        history = load_feed(legacy_json, ShowHistory, ShowHistory(shows=[], lastUpdated=""))
+        added = store.append(history.shows, now=None if len(store) else history.lastUpdated)
+        legacy_json.unlink()
+        logger.info("Imported %d shows from %s into %s and removed it", added, legacy_json, root)
+    return store
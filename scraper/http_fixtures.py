@@ -0,0 +1,185 @@
+# scraper/http_fixtures.py
+"""
+Record and replay every HTTP response a scrape makes, through requests' Session.request.
+
+A bundle is a directory with manifest.json plus one body file per response.
+Requests are keyed by method and URL with sorted query, minus REDACTED_PARAMS.
+Repeats replay in recorded order; a request missing from the bundle raises
+requests.ConnectionError and is listed in `misses`. Playwright fetches are not captured.
+
+Usage:
+    python http_fixtures.py record tests/fixtures/http/2026-10-19 [--on-demand]
+    python http_fixtures.py replay tests/fixtures/http/2026-10-19 [--on-demand]
+"""
+import argparse
+import hashlib
+import json
+import sys
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+BUNDLE_VERSION = 1
+MANIFEST = "manifest.json"
+REDACTED_PARAMS = {"apikey", "api_key", "key", "token"}
+BODY_SUFFIXES = {"application/json": ".json", "text/html": ".html", "text/plain": ".txt"}
+
+
+def _call_params(args: tuple, kwargs: dict):
+    # Session.request(method, url, params=None, ...) - params may arrive positionally
+    return args[0] if args else kwargs.get("params")
+
+
+def request_key(method: str, url: str, params=None) -> tuple[str, str]:
+    """(key, redacted url) for a request; the key is what replay looks up."""
+    full_url = requests.Request(method.upper(), url, params=params).prepare().url
+    parts = urlsplit(full_url)
+    query = sorted((k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k.lower() not in REDACTED_PARAMS)
+    clean_url = urlunsplit((parts.scheme, parts.netloc.lower(), parts.path, urlencode(query), ""))
+    return f"{method.upper()} {clean_url}", clean_url
+
+
+class HttpRecorder:
+    """Context manager that captures every requests call into a fixture bundle."""
+
+    def __init__(self, bundle_dir: Path):
+        self.bundle_dir = Path(bundle_dir)
+        self.entries: list[dict] = []
+        self._lock = threading.Lock()  # Paginated scrapers fetch from several threads
+        self._saved_request = None
+
+    def __enter__(self):
+        (self.bundle_dir / "bodies").mkdir(parents=True, exist_ok=True)
+        self._saved_request = requests.sessions.Session.request
+        recorder, passthrough = self, self._saved_request
+
+        def request(session, method, url, *args, **kwargs):
+            response = passthrough(session, method, url, *args, **kwargs)
+            recorder._save(method, url, _call_params(args, kwargs), response)
+            return response
+
+        requests.sessions.Session.request = request
+        return self
+
+    def __exit__(self, *exc):
+        requests.sessions.Session.request = self._saved_request
+        manifest = {
+            "version": BUNDLE_VERSION,
+            "recordedAt": datetime.now(timezone.utc).isoformat(),
+            "entries": self.entries,
+        }
+        (self.bundle_dir / MANIFEST).write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+        return False
+
+    def _save(self, method: str, url: str, params, response: requests.Response) -> None:
+        key, clean_url = request_key(method, url, params)
+        content_type = response.headers.get("Content-Type", "")
+        suffix = BODY_SUFFIXES.get(content_type.split(";")[0].strip(), ".bin")
+        with self._lock:
+            name = f"{len(self.entries):04d}-{hashlib.sha1(key.encode()).hexdigest()[:10]}{suffix}"
+            self.entries.append({
+                "key": key,
+                "url": clean_url,
+                "status": response.status_code,
+                "reason": response.reason,
+                "contentType": content_type,
+                "encoding": response.encoding,
+                "body": f"bodies/{name}",
+            })
+        (self.bundle_dir / "bodies" / name).write_bytes(response.content)
+
+
+class HttpReplayer:
+    """Context manager that answers requests calls from a recorded bundle."""
+
+    def __init__(self, bundle_dir: Path):
+        self.bundle_dir = Path(bundle_dir)
+        manifest = json.loads((self.bundle_dir / MANIFEST).read_text(encoding="utf-8"))
+        if manifest.get("version") != BUNDLE_VERSION:
+            raise ValueError(f"Unsupported fixture bundle version {manifest.get('version')} (expected {BUNDLE_VERSION})")
+        self.recorded_at = manifest.get("recordedAt")
+        self._responses: dict[str, list[dict]] = {}
+        for entry in manifest["entries"]:
+            self._responses.setdefault(entry["key"], []).append(entry)
+        self._served: dict[str, int] = {}
+        self._bodies: dict[str, bytes] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses: list[str] = []
+        self._saved_request = None
+
+    def __enter__(self):
+        self._saved_request = requests.sessions.Session.request
+        replayer = self
+
+        def request(session, method, url, *args, **kwargs):
+            return replayer.respond(method, url, _call_params(args, kwargs))
+
+        requests.sessions.Session.request = request
+        return self
+
+    def __exit__(self, *exc):
+        requests.sessions.Session.request = self._saved_request
+        return False
+
+    def respond(self, method: str, url: str, params=None) -> requests.Response:
+        key, _ = request_key(method, url, params)
+        recorded = self._responses.get(key)
+        with self._lock:
+            if not recorded:
+                self.misses.append(key)
+                raise requests.ConnectionError(f"No recorded response for {key}")
+            index = self._served.get(key, 0)
+            self._served[key] = index + 1
+            self.hits += 1
+        return self._build_response(recorded[min(index, len(recorded) - 1)])
+
+    def _build_response(self, entry: dict) -> requests.Response:
+        body = self._bodies.get(entry["body"])
+        if body is None:
+            body = self._bodies[entry["body"]] = (self.bundle_dir / entry["body"]).read_bytes()
+        response = requests.Response()
+        response.status_code = entry["status"]
+        response.reason = entry.get("reason") or ""
+        response.url = entry["url"]
+        response.headers = CaseInsensitiveDict({"Content-Type": entry.get("contentType", "")})
+        response.encoding = entry.get("encoding")
+        response._content = body
+        return response
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("mode", choices=["record", "replay"])
+    parser.add_argument("bundle", type=Path)
+    parser.add_argument("--on-demand", action="store_true", help="Include OhMyOmaha and Ticketmaster")
+    args = parser.parse_args()
+
+    from config import get_scrapers
+    from main import run_all_scrapers
+
+    scrapers = get_scrapers(include_on_demand=args.on_demand)
+    if args.mode == "record":
+        with HttpRecorder(args.bundle) as recorder:
+            output = run_all_scrapers(scrapers)
+        print(f"Recorded {len(recorder.entries)} responses to {args.bundle}")
+    else:
+        with HttpReplayer(args.bundle) as replayer:
+            output = run_all_scrapers(scrapers)
+        print(f"Replayed {replayer.hits} responses from {args.bundle} ({len(replayer.misses)} misses)")
+        for key in replayer.misses:
+            print(f"  miss: {key}")
+
+    for source in output.sources:
+        status_icon = "+" if source.status == "ok" else "x"
+        print(f"  {status_icon} {source.name}: {source.eventCount} events")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+# scraper/known_ids.py
+"""
+Run-level set of event IDs already in the database.
+
+Every ID is fetched once per run; IDs found are re-checked in batches
+before use, and a failed fetch treats every ID as possibly known.
+"""
+
+PAGE_SIZE = 1000
+VERIFY_CHUNK = 200  # Keep `in_` filters well under URL length limits
+
+
+class KnownEventIds:
+    """Snapshot of existing event IDs with batched verification."""
+
+    def __init__(self, supabase_client):
+        self.supabase = supabase_client
+        self._ids: set[str] = set()
+        self.loaded = False
+        self._load()
+
+    def _load(self):
+        try:
+            start = 0
+            while True:
+                result = (
+                    self.supabase.table("events")
+                    .select("id")
+                    .order("id")
+                    .range(start, start + PAGE_SIZE - 1)
+                    .execute()
+                )
+                rows = result.data or []
+                self._ids.update(row["id"] for row in rows)
+                if len(rows) < PAGE_SIZE:
+                    break
+                start += PAGE_SIZE
+            self.loaded = True
+        except Exception as e:
+            print(f"! Failed to load known event IDs, falling back to per-batch checks: {e}")
+            self._ids.clear()
+            self.loaded = False
+
+    def __contains__(self, event_id: str) -> bool:
+        return event_id in self._ids
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def add(self, event_id: str) -> None:
+        """Record an ID inserted during this run."""
+        self._ids.add(event_id)
+
+    def verify(self, event_ids) -> set[str]:
+        """
+        Confirm which of event_ids exist, using one batched query for probable hits.
+
+        Definite misses are never sent to the database. Probable hits that turn
+        out not to exist are removed from the snapshot. Returns the confirmed IDs.
+        """
+        ids = set(event_ids)
+        candidates = sorted(ids if not self.loaded else ids & self._ids)
+        if not candidates:
+            return set()
+
+        found: set[str] = set()
+        for i in range(0, len(candidates), VERIFY_CHUNK):
+            chunk = candidates[i:i + VERIFY_CHUNK]
+            result = self.supabase.table("events").select("id").in_("id", chunk).execute()
+            found.update(row["id"] for row in (result.data or []))
+
+        self._ids.difference_update(set(candidates) - found)
+        self._ids.update(found)
+        return found
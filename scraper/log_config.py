@@ -0,0 +1,24 @@
+# scraper/log_config.py
+"""
+Logging setup shared by the runners, from the LOG_LEVEL environment variable.
+"""
+import logging
+import os
+
+DEFAULT_LEVEL = logging.WARNING
+
+
+def log_level(name: str | None) -> int | None:
+    """Numeric level for a level name ("info", "DEBUG"), or None if it isn't one."""
+    level = logging.getLevelName((name or "").strip().upper())
+    return level if isinstance(level, int) else None
+
+
+def configure_logging() -> None:
+    """basicConfig at LOG_LEVEL, falling back to DEFAULT_LEVEL with a warning on a bad name."""
+    name = os.environ.get("LOG_LEVEL")
+    level = log_level(name)
+    logging.basicConfig(level=DEFAULT_LEVEL if level is None else level, format="%(message)s")
+    if name and level is None:
+        logging.getLogger(__name__).warning(
+            "LOG_LEVEL %r unknown, using %s", name, logging.getLevelName(DEFAULT_LEVEL))
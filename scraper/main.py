@@ -6,32 +6,27 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 from models import Event, SourceStatus, ScraperOutput
 from config import SCRAPERS
+from streaming import EventStream
+from feed_json import write_feed
 
-def run_all_scrapers() -> ScraperOutput:
-    """Run all configured scrapers and collect results."""
+def run_all_scrapers(scrapers=None) -> ScraperOutput:
+    """Run all configured scrapers (or the given ones) and collect results."""
     all_events: list[Event] = []
     sources: list[SourceStatus] = []
 
-    for scraper in SCRAPERS:
-        status = "ok"
-        error = None
-        events: list[Event] = []
-
-        try:
-            events = scraper.scrape()
-            all_events.extend(events)
-        except Exception as e:
-            status = "error"
-            error = str(e)
+    for scraper in scrapers if scrapers is not None else SCRAPERS:
+        # Events yielded before a scraper fails are kept
+        stream = EventStream(scraper)
+        all_events.extend(stream)
 
         sources.append(SourceStatus(
             name=scraper.name,
             id=scraper.id,
             url=scraper.url,
-            status=status,
+            status="error" if stream.error else "ok",
             lastScraped=datetime.now(timezone.utc).isoformat(),
-            eventCount=len(events),
-            error=error
+            eventCount=stream.count,
+            error=stream.error
         ))
 
     # Sort events by date
@@ -43,10 +38,9 @@ def run_all_scrapers() -> ScraperOutput:
         sources=sources
     )
 
-def save_output(output: ScraperOutput, path: Path) -> None:
-    """Save scraper output to JSON file."""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(output.model_dump_json(indent=2))
+def save_output(output: ScraperOutput, path: Path, format: str | None = None) -> None:
+    """Save scraper output to JSON file (see feed_json.py for formats)."""
+    write_feed(path, output, format)
 
 def main():
     output = run_all_scrapers()
@@ -22,13 +22,15 @@ def find_existing_event(new_event, db_events: list[dict]) -> dict | None:
     Find an existing event that matches the new event.
 
     Args:
-        new_event: Event object with title, date, venue_id attributes
+        new_event: Event-like object with a title attribute, or a plain
+                   (title, date) tuple so callers don't need to build a model
         db_events: List of dicts from database (same venue + same date)
 
     Returns:
         Matching event dict or None if no match found
     """
-    new_normalized = normalize_text(new_event.title)
+    title = new_event[0] if isinstance(new_event, tuple) else new_event.title
+    new_normalized = normalize_text(title)
     if not new_normalized:
         return None
 
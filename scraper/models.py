@@ -1,5 +1,7 @@
 # scraper/models.py
-from pydantic import BaseModel
+from dataclasses import dataclass, fields
+from operator import attrgetter
+from pydantic import BaseModel, TypeAdapter, ValidationError
 from typing import Optional
 from datetime import datetime
 
@@ -16,8 +18,57 @@ class Event(BaseModel):
     ageRestriction: Optional[str] = None
     supportingArtists: Optional[list[str]] = None  # ["Artist 1", "Artist 2"]
     source: str
+    category: Optional[str] = None  # music, sports, theater or comedy (see categorize.py)
     addedAt: Optional[str] = None  # ISO timestamp when first seen
 
+
+@dataclass(slots=True, kw_only=True)
+class EventRecord:
+    """Unvalidated Event built inside scraper parse loops.
+
+    Same fields as Event, but constructing one is a plain attribute store.
+    Scrapers collect these and call validate_events once per batch.
+    """
+    id: str
+    title: str
+    date: str
+    time: Optional[str] = None
+    venue: str
+    eventUrl: Optional[str] = None
+    ticketUrl: Optional[str] = None
+    imageUrl: Optional[str] = None
+    price: Optional[str] = None
+    ageRestriction: Optional[str] = None
+    supportingArtists: Optional[list[str]] = None
+    source: str
+    category: Optional[str] = None
+    addedAt: Optional[str] = None
+
+
+EVENT_FIELDS = tuple(f.name for f in fields(EventRecord))
+_event_values = attrgetter(*EVENT_FIELDS)
+_event_list = TypeAdapter(list[Event])
+
+
+def validate_events(records) -> list[Event]:
+    """Validate a batch of EventRecords (or Events) into Events in one pass.
+
+    If the batch has invalid records they are dropped one by one, matching
+    the per-event try/except the scrapers used to rely on.
+    """
+    rows = [dict(zip(EVENT_FIELDS, _event_values(r))) for r in records]
+    try:
+        return _event_list.validate_python(rows)
+    except ValidationError:
+        events = []
+        for row in rows:
+            try:
+                events.append(Event.model_validate(row))
+            except ValidationError:
+                continue
+        return events
+
+
 class SourceStatus(BaseModel):
     name: str
     id: str
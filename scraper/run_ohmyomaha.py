@@ -20,6 +20,8 @@ sys.path.insert(0, str(Path(__file__).parent))
 from supabase import create_client, Client
 from scrapers.ohmyomaha import OhMyOmahaScraper
 from venue_matcher import VenueMatcher
+from known_ids import KnownEventIds
+from log_config import configure_logging
 
 # Get Supabase credentials
 SUPABASE_URL = os.environ.get("SUPABASE_URL")
@@ -68,11 +70,12 @@ def run():
         new_ids = []
         skipped_ids = []
 
+        known_ids = KnownEventIds(supabase)
+        known_ids.verify(e.id for e in future_events)
+
         for event in future_events:
             # Check if event already exists (by ID or similar title+date)
-            existing_by_id = supabase.table("events").select("id").eq("id", event.id).execute()
-
-            if existing_by_id.data:
+            if event.id in known_ids:
                 skipped_ids.append(event.id)
                 continue
 
@@ -117,7 +120,7 @@ def run():
 
             # source is already set to matched venue_id by the scraper
             venue_id = event.source
-            category = scraper._categorize(event.title, event.venue or "")
+            category = event.category or scraper.categorize(event.title, event.venue)
 
             # Insert as pending event
             event_data = {
@@ -141,6 +144,7 @@ def run():
             }
 
             supabase.table("events").insert(event_data).execute()
+            known_ids.add(event.id)
 
             # Log new event for tracking
             log_event_change(
@@ -174,6 +178,7 @@ def run():
         print(f"Total events found: {len(future_events)}")
         print(f"New pending events: {len(new_ids)}")
         print(f"Skipped (already exist): {len(skipped_ids)}")
+        print(venue_matcher.summary())
         print(f"\n{'='*60}")
 
         if new_ids:
@@ -202,4 +207,5 @@ def run():
 
 
 if __name__ == "__main__":
+    configure_logging()
     run()
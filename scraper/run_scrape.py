@@ -3,39 +3,46 @@
 import sys
 from datetime import datetime, timezone, date
 from pathlib import Path
-import json
 
 # Ensure imports work from scraper directory
 sys.path.insert(0, str(Path(__file__).parent))
 
 from config import SCRAPERS
-from models import Event, SourceStatus, ScraperOutput, HistoricalShow, ShowHistory
+from models import Event, SourceStatus, ScraperOutput
+from streaming import EventStream
+from feed_json import load_feed, write_feed
+from feed_shards import write_shards
+from feed_delta import write_delta
+from feed_compress import precompress
+from feed_ics import write_calendars
+from history_store import HistoryStore, open_store, show_of, split_past
+from history_columnar import write_columnar
+from search_index import write_search_index
 
 OUTPUT_DIR = Path(__file__).parent / "output"
 EVENTS_PATH = OUTPUT_DIR / "events.json"
-HISTORY_PATH = OUTPUT_DIR / "history.json"
+HISTORY_DIR = OUTPUT_DIR / "history"  # Partitioned store, see history_store.py
+HISTORY_PATH = OUTPUT_DIR / "history.json"  # Pre-store history, folded into the store and removed
 
 
 def load_events() -> ScraperOutput:
-    if EVENTS_PATH.exists():
-        return ScraperOutput(**json.loads(EVENTS_PATH.read_text()))
-    return ScraperOutput(events=[], lastUpdated="", sources=[])
+    return load_feed(EVENTS_PATH, ScraperOutput, ScraperOutput(events=[], lastUpdated="", sources=[]))
 
 
-def load_history() -> ShowHistory:
-    if HISTORY_PATH.exists():
-        return ShowHistory(**json.loads(HISTORY_PATH.read_text()))
-    return ShowHistory(shows=[], lastUpdated="")
+def load_history() -> HistoryStore:
+    return open_store(HISTORY_DIR, legacy_json=HISTORY_PATH)
 
 
-def save_events(output: ScraperOutput):
-    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-    EVENTS_PATH.write_text(output.model_dump_json(indent=2))
-
-
-def save_history(history: ShowHistory):
-    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-    HISTORY_PATH.write_text(history.model_dump_json(indent=2))
+def save_events(output: ScraperOutput, previous: list[Event], history: HistoryStore):
+    if not write_feed(EVENTS_PATH, output):
+        print("events.json unchanged apart from timestamps, not rewritten")
+    precompress(EVENTS_PATH)
+    write_shards(output, OUTPUT_DIR)
+    write_delta(previous, output, OUTPUT_DIR)
+    write_calendars(output.events, output.sources, OUTPUT_DIR)
+    # History files are only rebuilt for the years archival touched
+    for path in write_search_index(output.events, history, OUTPUT_DIR) + write_columnar(history):
+        precompress(path)
 
 
 def run():
@@ -46,7 +53,6 @@ def run():
     current = load_events()
     history = load_history()
     existing_by_id = {e.id: e for e in current.events}
-    history_set = {(h.date, h.title, h.venue) for h in history.shows}
 
     # Track changes
     added = 0
@@ -57,62 +63,41 @@ def run():
 
     # Run all scrapers
     for scraper in SCRAPERS:
-        status = "ok"
-        error = None
-        events = []
-
-        try:
-            print(f"Scraping {scraper.name}...")
-            events = scraper.scrape()
-            for event in events:
-                if event.id not in existing_by_id:
-                    # New event - set addedAt
-                    event.addedAt = now
-                    added += 1
-                else:
-                    # Existing event - preserve original addedAt
-                    event.addedAt = existing_by_id[event.id].addedAt
-                existing_by_id[event.id] = event
-            print(f"  ✓ {len(events)} events")
+        print(f"Scraping {scraper.name}...")
+        # Merge events as the scraper yields them; a failure keeps what came before it
+        stream = EventStream(scraper)
+        for event in stream:
+            if event.id not in existing_by_id:
+                # New event - set addedAt
+                event.addedAt = now
+                added += 1
+            else:
+                # Existing event - preserve original addedAt
+                event.addedAt = existing_by_id[event.id].addedAt
+            existing_by_id[event.id] = event
+
+        if stream.error:
+            print(f"  ✗ FAILED: {stream.error}")
+            failed_scrapers.append((scraper.name, stream.error))
+        else:
+            print(f"  ✓ {stream.count} events")
             successful_scrapers.append(scraper.name)
-        except Exception as e:
-            status = "error"
-            error = str(e)
-            print(f"  ✗ FAILED: {e}")
-            failed_scrapers.append((scraper.name, str(e)))
 
         sources.append(SourceStatus(
             name=scraper.name,
             id=scraper.id,
             url=scraper.url,
-            status=status,
+            status="error" if stream.error else "ok",
             lastScraped=datetime.now(timezone.utc).isoformat(),
-            eventCount=len(events),
-            error=error
+            eventCount=stream.count,
+            error=stream.error
         ))
 
-    # Archive past events
-    active_events = []
-    for event in existing_by_id.values():
-        if event.date < today:
-            # Move to history (dedupe)
-            key = (event.date, event.title, event.venue)
-            if key not in history_set:
-                history.shows.append(HistoricalShow(
-                    date=event.date,
-                    title=event.title,
-                    venue=event.venue,
-                    supportingArtists=event.supportingArtists
-                ))
-                history_set.add(key)
-                archived += 1
-        else:
-            active_events.append(event)
-
-    # Sort
-    active_events.sort(key=lambda e: e.date)
-    history.shows.sort(key=lambda h: h.date, reverse=True)
-    history.lastUpdated = datetime.now(timezone.utc).isoformat()
+    # Archive past events (sorting first, so past events are a prefix)
+    merged = sorted(existing_by_id.values(), key=lambda e: e.date)
+    past_events, active_events = split_past(merged, today)
+    # The store skips shows it already has
+    archived = history.append(map(show_of, past_events), now=datetime.now(timezone.utc).isoformat())
 
     # Save
     output = ScraperOutput(
@@ -120,8 +105,7 @@ def run():
         lastUpdated=datetime.now(timezone.utc).isoformat(),
         sources=sources
     )
-    save_events(output)
-    save_history(history)
+    save_events(output, previous=current.events, history=history)
 
     print(f"\n{'='*50}")
     print(f"SCRAPE SUMMARY - {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M UTC')}")
@@ -129,7 +113,7 @@ def run():
     print(f"Active events: {len(active_events)}")
     print(f"New events added: {added}")
     print(f"Archived to history: {archived}")
-    print(f"Total history: {len(history.shows)}")
+    print(f"Total history: {len(history)}")
     print(f"")
     print(f"Scrapers: {len(successful_scrapers)}/{len(SCRAPERS)} successful")
 
@@ -4,6 +4,7 @@ import os
 import sys
 from datetime import datetime, timezone, date
 from pathlib import Path
+from typing import Iterable
 
 # Ensure imports work from scraper directory
 sys.path.insert(0, str(Path(__file__).parent))
@@ -12,7 +13,13 @@ from supabase import create_client, Client
 from config import get_scrapers
 from models import Event
 from matching import find_existing_event
+from categorize import categorize
+from known_ids import KnownEventIds
+from log_config import configure_logging
 from venue_matcher import VenueMatcher
+from streaming import EventStream, batched
+
+UPSERT_BATCH = 50  # Events whose IDs are verified together before writing
 
 # Get Supabase credentials from environment
 SUPABASE_URL = os.environ.get("SUPABASE_URL")
@@ -25,15 +32,6 @@ if not SUPABASE_URL or not SUPABASE_SERVICE_KEY:
 supabase: Client = create_client(SUPABASE_URL, SUPABASE_SERVICE_KEY)
 
 
-def run_scraper(scraper) -> tuple[list[Event], str | None]:
-    """Run a single scraper and return events and error (if any)."""
-    try:
-        events = scraper.scrape()
-        return events, None
-    except Exception as e:
-        return [], str(e)
-
-
 def normalize_value(val, field_name=None):
     """Normalize a value for comparison - treat None, empty string, empty list as equal."""
     if val is None:
@@ -80,17 +78,29 @@ def get_auto_approve_events() -> bool:
     return False
 
 
-def upsert_events(events: list[Event], scraper_id: str, auto_approve: bool = False) -> tuple[list[str], list[str]]:
+def upsert_events(
+    events: Iterable[Event],
+    scraper_id: str,
+    auto_approve: bool = False,
+    known_ids: KnownEventIds | None = None,
+) -> tuple[list[str], list[str]]:
     """Upsert events to Supabase using fuzzy matching.
 
     - New events: inserted with status='approved' when auto_approve is True, else 'pending'
     - Changed events: updated directly (scraper updates are trusted)
     - Unchanged events: skipped
 
+    events may be any iterable, e.g. a scraper's EventStream. It is consumed
+    UPSERT_BATCH events at a time, so writes begin before the source is
+    exhausted.
+
+    known_ids is the run-level ID snapshot used for the "already exists by ID"
+    safety check; one is loaded if not given.
+
     Returns tuple of (new_event_ids, changed_event_ids).
     """
-    if not events:
-        return [], []
+    if known_ids is None:
+        known_ids = KnownEventIds(supabase)
 
     now = datetime.now(timezone.utc).isoformat()
     new_status = "approved" if auto_approve else "pending"
@@ -103,74 +113,79 @@ def upsert_events(events: list[Event], scraper_id: str, auto_approve: bool = Fal
         "image_url", "price", "age_restriction", "supporting_artists"
     ]
 
-    for event in events:
-        # Get the actual venue_id for this event
-        # For discovery scrapers (ohmyomaha), event.source contains the matched venue_id
-        event_venue_id = event.source if event.source and event.source != scraper_id else scraper_id
-
-        # Get all events for this venue + date for fuzzy matching
-        db_events = get_events_by_venue_date(event_venue_id, event.date)
-
-        # Try fuzzy match first
-        existing = find_existing_event(event, db_events)
-
-        # Build event data
-        # For discovery scrapers (ohmyomaha), use event.source as venue_id
-        # For venue-specific scrapers, use scraper_id
-        venue_id = event.source if event.source and event.source != scraper_id else scraper_id
-        event_data = {
-            "id": event.id,
-            "title": event.title,
-            "date": event.date,
-            "time": event.time,
-            "venue_id": venue_id,
-            "venue_name": event.venue if venue_id == 'other' else None,
-            "event_url": event.eventUrl,
-            "ticket_url": event.ticketUrl,
-            "image_url": event.imageUrl,
-            "price": event.price,
-            "age_restriction": event.ageRestriction,
-            "supporting_artists": event.supportingArtists,
-            "source": scraper_id,
-        }
-
-        if existing:
-            # Found a match - check if anything actually changed
-            changed_fields = []
-            for field in compare_fields:
-                old_val = normalize_value(existing.get(field), field)
-                new_val = normalize_value(event_data.get(field), field)
-                if old_val != new_val:
-                    changed_fields.append(field)
-
-            if changed_fields:
-                # Auto-apply the update directly — scraper updates are trusted
-                update_data = {f: event_data[f] for f in changed_fields if f in event_data}
-                update_data["updated_at"] = now
-                supabase.table("events").update(update_data).eq("id", existing["id"]).execute()
-                changed_ids.append(existing["id"])
-        else:
-            # No match found - check if event ID already exists (safety check)
-            existing_by_id = supabase.table("events").select("id").eq("id", event.id).execute()
-            if existing_by_id.data:
-                # Event already exists by ID, skip
-                continue
-
-            # New event - insert with status based on auto_approve setting
-            event_data["status"] = new_status
-            event_data["added_at"] = now
-            event_data["updated_at"] = now
-            supabase.table("events").insert(event_data).execute()
-
-            # Log new event for tracking
-            log_event_change(
-                event_id=event.id,
-                change_type="new",
-                proposed_data=event_data,
-                original_data=None,
-                changed_fields=None,
-            )
-            new_ids.append(event.id)
+    for batch in batched(events, UPSERT_BATCH):
+        # One batched query confirms the probable hits; everything else is definitely new
+        known_ids.verify(e.id for e in batch)
+
+        for event in batch:
+            # Get the actual venue_id for this event
+            # For discovery scrapers (ohmyomaha), event.source contains the matched venue_id
+            event_venue_id = event.source if event.source and event.source != scraper_id else scraper_id
+
+            # Get all events for this venue + date for fuzzy matching
+            db_events = get_events_by_venue_date(event_venue_id, event.date)
+
+            # Try fuzzy match first
+            existing = find_existing_event(event, db_events)
+
+            # Build event data
+            # For discovery scrapers (ohmyomaha), use event.source as venue_id
+            # For venue-specific scrapers, use scraper_id
+            venue_id = event.source if event.source and event.source != scraper_id else scraper_id
+            event_data = {
+                "id": event.id,
+                "title": event.title,
+                "date": event.date,
+                "time": event.time,
+                "venue_id": venue_id,
+                "venue_name": event.venue if venue_id == 'other' else None,
+                "event_url": event.eventUrl,
+                "ticket_url": event.ticketUrl,
+                "image_url": event.imageUrl,
+                "price": event.price,
+                "age_restriction": event.ageRestriction,
+                "supporting_artists": event.supportingArtists,
+                "source": scraper_id,
+            }
+
+            if existing:
+                # Found a match - check if anything actually changed
+                changed_fields = []
+                for field in compare_fields:
+                    old_val = normalize_value(existing.get(field), field)
+                    new_val = normalize_value(event_data.get(field), field)
+                    if old_val != new_val:
+                        changed_fields.append(field)
+
+                if changed_fields:
+                    # Auto-apply the update directly — scraper updates are trusted
+                    update_data = {f: event_data[f] for f in changed_fields if f in event_data}
+                    update_data["updated_at"] = now
+                    supabase.table("events").update(update_data).eq("id", existing["id"]).execute()
+                    changed_ids.append(existing["id"])
+            else:
+                # No match found - check if event ID already exists (safety check)
+                if event.id in known_ids:
+                    # Event already exists by ID, skip
+                    continue
+
+                # New event - insert with status based on auto_approve setting
+                event_data["status"] = new_status
+                event_data["category"] = event.category or categorize(event.title, event.venue)
+                event_data["added_at"] = now
+                event_data["updated_at"] = now
+                supabase.table("events").insert(event_data).execute()
+                known_ids.add(event.id)
+
+                # Log new event for tracking
+                log_event_change(
+                    event_id=event.id,
+                    change_type="new",
+                    proposed_data=event_data,
+                    original_data=None,
+                    changed_fields=None,
+                )
+                new_ids.append(event.id)
 
     return new_ids, changed_ids
 
@@ -252,6 +267,7 @@ def run():
     scrapers = get_scrapers(supabase_client=supabase, venue_matcher=venue_matcher)
 
     auto_approve = get_auto_approve_events()
+    known_ids = KnownEventIds(supabase)
 
     print(f"\n{'='*60}")
     print(f"SUPABASE SCRAPE - {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M UTC')}")
@@ -262,39 +278,52 @@ def run():
     for scraper in scrapers:
         print(f"Scraping {scraper.name}...", end=" ", flush=True)
 
-        events, error = run_scraper(scraper)
-
-        if error:
-            print(f"FAILED: {error}")
-            failed_scrapers.append((scraper.name, error))
-            log_scraper_run(scraper.id, scraper.name, "error", 0, error=error)
+        # Future events only, written in batches as the scraper yields them
+        stream = EventStream(scraper, keep=lambda e: e.date >= today)
+        try:
+            new_ids, changed_ids = upsert_events(
+                stream, scraper.id, auto_approve=auto_approve, known_ids=known_ids
+            )
+        except Exception as upsert_error:
+            print(f"UPSERT FAILED: {upsert_error}")
+            failed_scrapers.append((scraper.name, f"upsert error: {upsert_error}"))
+            log_scraper_run(scraper.id, scraper.name, "error", stream.count, error=str(upsert_error))
             scraper_results.append({"name": scraper.name, "newCount": 0, "changedCount": 0})
+            continue
+
+        total_events += stream.count
+        total_new += len(new_ids)
+        total_changed += len(changed_ids)
+        scraper_results.append({"name": scraper.name, "newCount": len(new_ids), "changedCount": len(changed_ids)})
+
+        if stream.error:
+            # Events yielded before the failure have already been written
+            print(f"FAILED: {stream.error} (after {stream.count} events, {len(new_ids)} new, {len(changed_ids)} changed)")
+            failed_scrapers.append((scraper.name, stream.error))
+            log_scraper_run(
+                scraper.id,
+                scraper.name,
+                "error",
+                stream.count,
+                new_count=len(new_ids),
+                changed_count=len(changed_ids),
+                new_event_ids=new_ids,
+                changed_event_ids=changed_ids,
+                error=stream.error,
+            )
         else:
-            # Filter to future events only
-            future_events = [e for e in events if e.date >= today]
-            try:
-                new_ids, changed_ids = upsert_events(future_events, scraper.id, auto_approve=auto_approve)
-                total_events += len(future_events)
-                total_new += len(new_ids)
-                total_changed += len(changed_ids)
-                print(f"OK - {len(future_events)} events ({len(new_ids)} new, {len(changed_ids)} changed)")
-                successful_scrapers.append(scraper.name)
-                log_scraper_run(
-                    scraper.id,
-                    scraper.name,
-                    "success",
-                    len(future_events),
-                    new_count=len(new_ids),
-                    changed_count=len(changed_ids),
-                    new_event_ids=new_ids,
-                    changed_event_ids=changed_ids,
-                )
-                scraper_results.append({"name": scraper.name, "newCount": len(new_ids), "changedCount": len(changed_ids)})
-            except Exception as upsert_error:
-                print(f"UPSERT FAILED: {upsert_error}")
-                failed_scrapers.append((scraper.name, f"upsert error: {upsert_error}"))
-                log_scraper_run(scraper.id, scraper.name, "error", len(future_events), error=str(upsert_error))
-                scraper_results.append({"name": scraper.name, "newCount": 0, "changedCount": 0})
+            print(f"OK - {stream.count} events ({len(new_ids)} new, {len(changed_ids)} changed)")
+            successful_scrapers.append(scraper.name)
+            log_scraper_run(
+                scraper.id,
+                scraper.name,
+                "success",
+                stream.count,
+                new_count=len(new_ids),
+                changed_count=len(changed_ids),
+                new_event_ids=new_ids,
+                changed_event_ids=changed_ids,
+            )
 
     # Send admin notification if there are pending items
     if total_new > 0 or total_changed > 0:
@@ -308,6 +337,7 @@ def run():
     print(f"New events added: {total_new}")
     print(f"Events changed: {total_changed}")
     print(f"Scrapers: {len(successful_scrapers)}/{len(scrapers)} successful")
+    print(venue_matcher.summary())
 
     if failed_scrapers:
         print(f"\n{'!'*60}")
@@ -322,4 +352,5 @@ def run():
 
 
 if __name__ == "__main__":
+    configure_logging()
     run()
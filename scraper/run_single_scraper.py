@@ -7,6 +7,9 @@ from datetime import datetime, timezone, date
 from supabase import create_client
 from config import SCRAPERS
 from matching import find_existing_event
+from categorize import categorize
+from known_ids import KnownEventIds
+from log_config import configure_logging
 
 SUPABASE_URL = os.environ.get('SUPABASE_URL', '')
 SUPABASE_SERVICE_KEY = os.environ.get('SUPABASE_SERVICE_KEY', '')
@@ -119,6 +122,9 @@ def main():
         today = date.today().isoformat()
         future_events = [e for e in events if e.date >= today]
 
+        known_ids = KnownEventIds(supabase)
+        known_ids.verify(e.id for e in future_events)
+
         new_ids, changed_ids = [], []
         for e in future_events:
             # Get all events for this venue + date for fuzzy matching
@@ -163,16 +169,17 @@ def main():
                     changed_ids.append(existing['id'])
             else:
                 # No match found - check if event ID already exists (safety check)
-                existing_by_id = supabase.table('events').select('id').eq('id', e.id).execute()
-                if existing_by_id.data:
+                if e.id in known_ids:
                     # Event already exists by ID, skip
                     continue
 
                 # New event - insert as pending
                 data['status'] = 'pending'
+                data['category'] = e.category or categorize(e.title, e.venue)
                 data['added_at'] = now
                 data['updated_at'] = now
                 supabase.table('events').insert(data).execute()
+                known_ids.add(e.id)
 
                 log_event_change(
                     supabase,
@@ -221,4 +228,5 @@ def main():
         sys.exit(1)
 
 if __name__ == '__main__':
+    configure_logging()
     main()
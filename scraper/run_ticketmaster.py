@@ -20,6 +20,8 @@ sys.path.insert(0, str(Path(__file__).parent))
 from supabase import create_client, Client
 from scrapers.ticketmaster import TicketmasterClient
 from venue_matcher import VenueMatcher
+from known_ids import KnownEventIds
+from log_config import configure_logging
 
 # Get credentials
 SUPABASE_URL = os.environ.get("SUPABASE_URL")
@@ -77,11 +79,12 @@ def run():
         new_ids = []
         skipped_ids = []
 
+        known_ids = KnownEventIds(supabase)
+        known_ids.verify(e.id for e in future_events)
+
         for event in future_events:
             # Check if event already exists (by ID or similar title+date)
-            existing_by_id = supabase.table("events").select("id").eq("id", event.id).execute()
-
-            if existing_by_id.data:
+            if event.id in known_ids:
                 skipped_ids.append(event.id)
                 continue
 
@@ -143,11 +146,13 @@ def run():
                 "supporting_artists": event.supportingArtists,
                 "source": "ticketmaster",
                 "status": "pending",
+                "category": event.category,
                 "added_at": now,
                 "updated_at": now,
             }
 
             supabase.table("events").insert(event_data).execute()
+            known_ids.add(event.id)
 
             # Log new event for tracking
             log_event_change(
@@ -182,6 +187,7 @@ def run():
         print(f"Total events found: {len(future_events)}")
         print(f"New pending events: {len(new_ids)}")
         print(f"Skipped (already exist): {len(skipped_ids)}")
+        print(venue_matcher.summary())
         print(f"\n{'='*60}")
 
         if new_ids:
@@ -214,4 +220,5 @@ def run():
 
 
 if __name__ == "__main__":
+    configure_logging()
     run()
@@ -4,19 +4,21 @@ Admiral Omaha scraper - uses same RHP system as Waiting Room/Reverb.
 """
 import re
 import sys
-from datetime import datetime
 from pathlib import Path
 import requests
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from scrapers.base import BaseScraper
-from models import Event
+from models import Event, EventRecord, validate_events
+from event_ids import make_event_id
+from dates import parse_time
 
 
 class AdmiralScraper(BaseScraper):
     name = "Admiral"
     id = "admiral"
     url = "https://admiralomaha.com/events/"
+    container_selectors = ("div.eventWrapper.rhpSingleEvent",)
 
     headers = {
         'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
@@ -97,14 +99,7 @@ class AdmiralScraper(BaseScraper):
                 if time_el:
                     time_str = self._parse_time(time_el.get_text(strip=True))
                 else:
-                    card_text = card.get_text()
-                    time_match = re.search(r'Show:\s*(\d{1,2}(?::\d{2})?\s*[ap]m)', card_text, re.I)
-                    if time_match:
-                        time_str = self._parse_time(time_match.group(1))
-                    else:
-                        doors_match = re.search(r'Doors:\s*(\d{1,2}(?::\d{2})?\s*[ap]m)', card_text, re.I)
-                        if doors_match:
-                            time_str = self._parse_time(doors_match.group(1))
+                    time_str = parse_time(card.get_text(), "labeled")
 
                 # Supporting Artists - look for "with Artist, Artist"
                 supporting_artists = None
@@ -124,10 +119,9 @@ class AdmiralScraper(BaseScraper):
                         supporting_artists = [a.strip() for a in artists_str.split(',') if a.strip()]
 
                 # Generate ID
-                slug = re.sub(r'[^a-z0-9]+', '-', title.lower()).strip('-')
-                event_id = f"admiral-{date_str}-{slug}"[:80]
+                event_id = make_event_id("admiral", date_str, title)
 
-                events.append(Event(
+                events.append(EventRecord(
                     id=event_id,
                     title=title,
                     date=date_str,
@@ -139,73 +133,10 @@ class AdmiralScraper(BaseScraper):
                     price=price,
                     ageRestriction=age_restriction,
                     supportingArtists=supporting_artists if supporting_artists else None,
-                    source=self.id
+                    source=self.id,
+                    category=self.categorize(title),
                 ))
             except Exception:
                 continue
 
-        return events
-
-    def _parse_date(self, date_text: str) -> str | None:
-        """Convert date like 'Thu, Feb 26' or 'Sat, Mar 06' to YYYY-MM-DD."""
-        try:
-            date_text = date_text.strip()
-
-            # Handle format "Thu, Feb 26"
-            if ',' in date_text:
-                date_text = date_text.split(',')[1].strip()
-
-            parts = date_text.split()
-            if len(parts) >= 2:
-                month_str = parts[0]
-                day_str = parts[1]
-            else:
-                return None
-
-            month_map = {
-                'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
-                'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12
-            }
-            month = month_map.get(month_str)
-            if not month:
-                return None
-
-            day = int(day_str)
-            year = datetime.now().year
-
-            # If date is in the past, assume next year
-            today = datetime.now()
-            event_date = datetime(year, month, day)
-            if event_date < today - datetime.resolution:
-                if (today - event_date).days > 30:
-                    year += 1
-
-            return f"{year:04d}-{month:02d}-{day:02d}"
-        except Exception:
-            return None
-
-    def _parse_time(self, time_text: str) -> str | None:
-        """Convert time like '7 pm' or '7:30 pm' to 24-hour HH:MM."""
-        try:
-            time_text = time_text.strip().lower()
-
-            # Handle "Show: 7 pm" or just "7 pm"
-            if 'show:' in time_text:
-                time_text = time_text.split('show:')[-1].strip()
-
-            match = re.search(r'(\d{1,2})(?::(\d{2}))?\s*(am|pm)', time_text)
-            if not match:
-                return None
-
-            hour = int(match.group(1))
-            minute = int(match.group(2)) if match.group(2) else 0
-            period = match.group(3).upper()
-
-            if period == 'PM' and hour != 12:
-                hour += 12
-            elif period == 'AM' and hour == 12:
-                hour = 0
-
-            return f"{hour:02d}:{minute:02d}"
-        except Exception:
-            return None
+        return validate_events(events)
@@ -7,12 +7,12 @@ import re
 import sys
 import hashlib
 from pathlib import Path
-from datetime import datetime
 from playwright.sync_api import sync_playwright
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from scrapers.base import BaseScraper
-from models import Event
+from models import Event, EventRecord, validate_events
+from event_ids import EventIds
 
 # Path to save downloaded images (relative to repo root)
 IMAGES_DIR = Path(__file__).parent.parent.parent / 'public' / 'images' / 'astro'
@@ -38,7 +38,7 @@ class AstroTheaterScraper(BaseScraper):
     def _extract_events(self, page) -> list[Event]:
         """Extract events from the rendered page."""
         events = []
-        seen_ids = set()
+        event_ids = EventIds()
 
         # Get all grid-item elements
         items = page.query_selector_all('.grid-item')
@@ -76,7 +76,8 @@ class AstroTheaterScraper(BaseScraper):
                 time_str = None
                 if date_el:
                     date_text = date_el.inner_text().strip()
-                    date_str, time_str = self._parse_date_time(date_text)
+                    date_str = self._parse_date(date_text)  # "Mar 06 @ 8:00 pm"
+                    time_str = self._parse_time(date_text)
                 if not date_str:
                     continue
 
@@ -120,14 +121,11 @@ class AstroTheaterScraper(BaseScraper):
                     display_title = f"{title} - {tagline}"
 
                 # Generate ID
-                slug = re.sub(r'[^a-z0-9]+', '-', title.lower()).strip('-')
-                event_id = f"astrotheater-{date_str}-{slug}"[:80]
-
-                if event_id in seen_ids:
+                event_id = event_ids.allocate("astrotheater", date_str, title)
+                if event_id is None:
                     continue
-                seen_ids.add(event_id)
 
-                events.append(Event(
+                events.append(EventRecord(
                     id=event_id,
                     title=display_title,
                     date=date_str,
@@ -139,57 +137,13 @@ class AstroTheaterScraper(BaseScraper):
                     price=price,
                     ageRestriction=age_restriction,
                     supportingArtists=supporting_artists,
-                    source=self.id
+                    source=self.id,
+                    category=self.categorize(display_title, venue_name),
                 ))
             except Exception:
                 continue
 
-        return events
-
-    def _parse_date_time(self, date_text: str) -> tuple[str | None, str | None]:
-        """Parse 'Mar 06 @ 8:00 pm' into (YYYY-MM-DD, HH:MM)."""
-        try:
-            # Pattern: "Mar 06 @ 8:00 pm"
-            match = re.match(r'([A-Za-z]+)\s+(\d{1,2})\s*@\s*(\d{1,2}):(\d{2})\s*(am|pm)', date_text, re.I)
-            if not match:
-                return None, None
-
-            month_str, day_str, hour_str, minute_str, period = match.groups()
-
-            # Parse month
-            month_map = {
-                'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
-                'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12
-            }
-            month = month_map.get(month_str.lower()[:3])
-            if not month:
-                return None, None
-
-            day = int(day_str)
-            year = datetime.now().year
-
-            # If date is in the past, assume next year
-            today = datetime.now()
-            event_date = datetime(year, month, day)
-            if event_date < today:
-                if (today - event_date).days > 30:
-                    year += 1
-
-            date_str = f"{year:04d}-{month:02d}-{day:02d}"
-
-            # Parse time
-            hour = int(hour_str)
-            minute = int(minute_str)
-            if period.lower() == 'pm' and hour != 12:
-                hour += 12
-            elif period.lower() == 'am' and hour == 12:
-                hour = 0
-
-            time_str = f"{hour:02d}:{minute:02d}"
-
-            return date_str, time_str
-        except Exception:
-            return None, None
+        return validate_events(events)
 
     def _is_valid_image(self, data: bytes) -> bool:
         """Check if data starts with known image file signatures."""
@@ -1,17 +1,33 @@
 # scraper/scrapers/base.py
 from abc import ABC, abstractmethod
+from typing import Iterator
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 import requests
 from bs4 import BeautifulSoup
 from models import Event
+from categorize import categorize
+from dates import parse_date, parse_time
+from scrapers.parsing import make_soup
 
 class BaseScraper(ABC):
     name: str
     id: str
     url: str
     timeout: int = 30
+    default_category: str = "music"  # Used when no category keyword matches
+    parser: str | None = None  # HTML backend override; None uses SCRAPER_HTML_PARSER (see parsing.py)
+    # Elements parse_events reads from (see parsing.py for the selector forms).
+    # When set, get_soup only builds these subtrees. Empty means the whole page.
+    container_selectors: tuple[str, ...] = ()
+    date_format: str = "text"  # Format hints for dates.parse_date / parse_time
+    time_format: str = "12h"
+    # Paginated listings: concurrent page fetches once the page count is
+    # known, and the minimum seconds between requests to the site (see pagination.py)
+    page_workers: int = 4
+    page_interval: float = 0.5
+    stream_batch: int = 25  # Detail-page events validated and yielded together by iter_events
     headers: dict = {
         "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36",
         "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
@@ -24,9 +40,27 @@ class BaseScraper(ABC):
         response.raise_for_status()
         return response.text
 
-    def get_soup(self, html: str) -> BeautifulSoup:
-        """Parse HTML into BeautifulSoup object."""
-        return BeautifulSoup(html, "html.parser")
+    def get_soup(self, html: str, containers: tuple[str, ...] | None = None) -> BeautifulSoup:
+        """Parse HTML into BeautifulSoup object.
+
+        Only this scraper's container_selectors are built unless `containers`
+        is given; pass () to parse the whole document (e.g. detail pages).
+        """
+        if containers is None:
+            containers = self.container_selectors
+        return make_soup(html, self.parser, containers)
+
+    def categorize(self, title: str, venue_name: str | None = None, default: str | None = None) -> str:
+        """Categorize an event from this venue (see categorize.py)."""
+        return categorize(title, venue_name or self.name, default or self.default_category)
+
+    def _parse_date(self, text: str) -> str | None:
+        """Normalize this venue's date text to YYYY-MM-DD (see dates.py)."""
+        return parse_date(text, self.date_format)
+
+    def _parse_time(self, text: str) -> str | None:
+        """Normalize this venue's time text to 24-hour HH:MM (see dates.py)."""
+        return parse_time(text, self.time_format)
 
     @abstractmethod
     def parse_events(self, html: str) -> list[Event]:
@@ -37,3 +71,12 @@ class BaseScraper(ABC):
         """Main entry point: fetch and parse events."""
         html = self.fetch_html()
         return self.parse_events(html)
+
+    def iter_events(self) -> Iterator[Event]:
+        """Yield events as they become available (see streaming.py).
+
+        Single-page scrapers just yield scrape()'s result. Paginated and
+        detail-page scrapers override this to yield each page or batch as
+        soon as it is validated; their scrape() is list(iter_events()).
+        """
+        yield from self.scrape()
@@ -1,10 +1,10 @@
 # scraper/scrapers/baxterarena.py
-import re
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from scrapers.base import BaseScraper
-from models import Event
+from models import Event, EventRecord, validate_events
+from event_ids import make_event_id
 
 
 class BaxterArenaScraper(BaseScraper):
@@ -13,6 +13,7 @@ class BaxterArenaScraper(BaseScraper):
     # We'll scrape both concerts and comedy pages
     url = "https://www.baxterarena.com/events/category/concerts/"
     comedy_url = "https://www.baxterarena.com/events/category/comedy/list/"
+    container_selectors = (".tribe-events-calendar-list__event-row",)
 
     def scrape(self) -> list[Event]:
         """Override to scrape multiple pages (concerts + comedy)."""
@@ -82,10 +83,9 @@ class BaxterArenaScraper(BaseScraper):
                     ticket_url = ticket_el.get("href")
 
                 # Generate ID
-                slug = re.sub(r'[^a-z0-9]+', '-', title.lower()).strip('-')
-                event_id = f"baxterarena-{date_str}-{slug}"[:80]
+                event_id = make_event_id("baxterarena", date_str, title)
 
-                events.append(Event(
+                events.append(EventRecord(
                     id=event_id,
                     title=title,
                     date=date_str,
@@ -97,32 +97,10 @@ class BaxterArenaScraper(BaseScraper):
                     price=None,
                     ageRestriction=None,
                     supportingArtists=None,
-                    source=self.id
+                    source=self.id,
+                    category=self.categorize(title, default=category),
                 ))
             except Exception:
                 continue
 
-        return events
-
-    def _parse_time(self, time_text: str) -> str | None:
-        """Convert time text like '7:00 PM' to HH:MM format (24-hour)."""
-        try:
-            # Clean up - remove icon text if present
-            time_text = time_text.strip().upper()
-            match = re.search(r'(\d{1,2}):(\d{2})\s*(AM|PM)', time_text)
-            if not match:
-                return None
-
-            hour = int(match.group(1))
-            minute = int(match.group(2))
-            period = match.group(3)
-
-            # Convert to 24-hour format
-            if period == 'PM' and hour != 12:
-                hour += 12
-            elif period == 'AM' and hour == 12:
-                hour = 0
-
-            return f"{hour:02d}:{minute:02d}"
-        except Exception:
-            return None
+        return validate_events(events)
@@ -1,19 +1,20 @@
 # scraper/scrapers/bourbontheatre.py
-import re
 import sys
-from datetime import datetime
 from pathlib import Path
 import requests
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from scrapers.base import BaseScraper
-from models import Event
+from models import Event, EventRecord, validate_events
+from event_ids import EventIds
 
 
 class BourbonTheatreScraper(BaseScraper):
     name = "Bourbon Theatre"
     id = "bourbontheatre"
     url = "https://www.bourbontheatre.com/calendar/"
+    container_selectors = (".tw-cal-event-popup",)
+    time_format = "24h"  # Times show as "19:00 pm" as often as "7:00 PM"
 
     def fetch_html(self) -> str:
         response = requests.get(self.url, headers={
@@ -25,7 +26,7 @@ class BourbonTheatreScraper(BaseScraper):
     def parse_events(self, html: str) -> list[Event]:
         soup = self.get_soup(html)
         events = []
-        seen_ids = set()
+        event_ids = EventIds()
 
         for popup in soup.select('.tw-cal-event-popup'):
             try:
@@ -67,14 +68,11 @@ class BourbonTheatreScraper(BaseScraper):
                 age = age_el.get_text(strip=True) if age_el else None
 
                 # Generate ID
-                slug = re.sub(r'[^a-z0-9]+', '-', title.lower()).strip('-')
-                event_id = f"bourbontheatre-{date_str}-{slug}"[:80]
-
-                if event_id in seen_ids:
+                event_id = event_ids.allocate("bourbontheatre", date_str, title)
+                if event_id is None:
                     continue
-                seen_ids.add(event_id)
 
-                events.append(Event(
+                events.append(EventRecord(
                     id=event_id,
                     title=title,
                     date=date_str,
@@ -86,47 +84,9 @@ class BourbonTheatreScraper(BaseScraper):
                     price=price,
                     ageRestriction=age,
                     source=self.id,
+                    category=self.categorize(title),
                 ))
             except Exception:
                 continue
 
-        return events
-
-    def _parse_date(self, date_text: str) -> str | None:
-        """Parse date like 'February 27, 2026' to YYYY-MM-DD."""
-        try:
-            date_text = date_text.strip()
-            for fmt in ("%B %d, %Y", "%b %d, %Y"):
-                try:
-                    return datetime.strptime(date_text, fmt).strftime("%Y-%m-%d")
-                except ValueError:
-                    continue
-            return None
-        except Exception:
-            return None
-
-    def _parse_time(self, time_text: str) -> str | None:
-        """Convert time like '19:00 pm' or '7:00 PM' to HH:MM 24-hour."""
-        if not time_text:
-            return None
-        try:
-            time_text = time_text.strip()
-            # Handle "19:00 pm" format (already 24h with spurious am/pm)
-            match = re.match(r'(\d{1,2}):(\d{2})\s*(am|pm)?', time_text, re.I)
-            if not match:
-                return None
-
-            hour = int(match.group(1))
-            minute = int(match.group(2))
-            period = (match.group(3) or '').upper()
-
-            # If hour > 12, it's already 24-hour format, ignore am/pm
-            if hour <= 12 and period:
-                if period == 'PM' and hour != 12:
-                    hour += 12
-                elif period == 'AM' and hour == 12:
-                    hour = 0
-
-            return f"{hour:02d}:{minute:02d}"
-        except Exception:
-            return None
+        return validate_events(events)
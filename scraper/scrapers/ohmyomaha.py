@@ -4,57 +4,23 @@ Ohmyomaha scraper - discovers shows we might be missing.
 Manual-trigger only, creates pending events for admin review.
 Uses Playwright to bypass bot protection.
 """
-import re
 import sys
-from datetime import datetime
 from pathlib import Path
 from playwright.sync_api import sync_playwright
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from scrapers.base import BaseScraper
-from models import Event
+from models import Event, EventRecord, validate_events
+from event_ids import make_event_id
 from venue_matcher import VenueMatcher
 from matching import find_existing_event
 
-# Sports team names and keywords
-SPORTS_KEYWORDS = [
-    "vs", "vs.",
-    "omaha beef", "beef",
-    "omaha supernovas", "supernovas",
-    "lancers",
-    "storm chasers",
-    "mavericks",
-    "huskers",
-    "creighton",
-    "bluejays",
-    "world wrestling", "wwe", "wrestling",
-    "monster jam",
-    "harlem globetrotters", "globetrotters",
-]
-
-# Theater/Arts keywords
-THEATER_KEYWORDS = [
-    "symphony", "orchestra", "philharmonic",
-    "ballet", "opera",
-    "broadway", "musical",
-    "disney on ice",
-    "cirque",
-    "blue man group",
-]
-
-# Comedy keywords
-COMEDY_KEYWORDS = [
-    "comedy", "comedian", "stand-up", "standup",
-    "live podcast",
-]
-
-# Sports venues that almost always have sports events
-SPORTS_VENUES = ["chi health center", "chi"]
-
 
 class OhMyOmahaScraper(BaseScraper):
     name = "OhMyOmaha"
     id = "ohmyomaha"
     url = "https://ohmyomaha.com/biggest-concerts-omaha/"
+    container_selectors = ("li",)
+    date_format = "any"  # Mix of "March 5, 2026" and "3/5/26"
 
     def __init__(self, supabase_client=None, venue_matcher=None):
         super().__init__()
@@ -124,7 +90,7 @@ class OhMyOmahaScraper(BaseScraper):
                     continue
 
                 # Auto-categorize and skip sports events
-                category = self._categorize(title, venue_name)
+                category = self.categorize(title, venue_name)
                 if category == "sports":
                     continue
 
@@ -150,29 +116,14 @@ class OhMyOmahaScraper(BaseScraper):
                 # Check for duplicates if we matched to an official venue
                 if matched_venue_id and self.supabase:
                     existing_events = self._get_events_for_venue_date(matched_venue_id, date)
-                    temp_event = Event(
-                        id="temp",
-                        title=title,
-                        date=date,
-                        time=None,
-                        venue=venue_name,
-                        eventUrl=None,
-                        ticketUrl=ticket_url,
-                        imageUrl=None,
-                        price=None,
-                        ageRestriction=None,
-                        supportingArtists=None,
-                        source=self.id
-                    )
-                    if find_existing_event(temp_event, existing_events):
+                    if find_existing_event((title, date), existing_events):
                         # Duplicate found - skip
                         continue
 
                 # Generate standard ID
-                slug = re.sub(r'[^a-z0-9]+', '-', title.lower()).strip('-')
-                event_id = f"{venue_id}-{date}-{slug}"[:80]
+                event_id = make_event_id(venue_id, date, title)
 
-                events.append(Event(
+                events.append(EventRecord(
                     id=event_id,
                     title=title,
                     date=date,
@@ -184,13 +135,14 @@ class OhMyOmahaScraper(BaseScraper):
                     price=None,
                     ageRestriction=None,
                     supportingArtists=None,
-                    source=venue_id  # Use matched venue_id as source
+                    source=venue_id,  # Use matched venue_id as source
+                    category=category,
                 ))
 
             except Exception:
                 continue
 
-        return events
+        return validate_events(events)
 
     def _get_events_for_venue_date(self, venue_id: str, event_date: str) -> list[dict]:
         """Query existing events for a venue on a specific date."""
@@ -199,60 +151,6 @@ class OhMyOmahaScraper(BaseScraper):
         result = self.supabase.table("events").select("*").eq("venue_id", venue_id).eq("date", event_date).execute()
         return result.data or []
 
-    def _parse_date(self, text: str) -> str | None:
-        """Parse various date formats to YYYY-MM-DD."""
-        text = text.strip()
-
-        # Common formats on ohmyomaha
-        formats = [
-            "%B %d, %Y",      # March 5, 2026
-            "%b %d, %Y",      # Mar 5, 2026
-            "%B %d %Y",       # March 5 2026
-            "%b %d %Y",       # Mar 5 2026
-            "%m/%d/%Y",       # 3/5/2026
-            "%m/%d/%y",       # 3/5/26
-        ]
-
-        for fmt in formats:
-            try:
-                dt = datetime.strptime(text, fmt)
-                return dt.strftime("%Y-%m-%d")
-            except ValueError:
-                continue
-
-        return None
-
-    def _categorize(self, title: str, venue_name: str) -> str:
-        """Auto-categorize event based on title and venue."""
-        title_lower = title.lower()
-        venue_lower = venue_name.lower()
-
-        # Check sports keywords in title
-        for keyword in SPORTS_KEYWORDS:
-            if keyword in title_lower:
-                return "sports"
-
-        # Check if it's a sports venue
-        for venue in SPORTS_VENUES:
-            if venue in venue_lower:
-                # Could still be a concert at CHI
-                # But if no obvious music indicators, default to sports
-                return "sports"
-
-        # Check theater keywords
-        for keyword in THEATER_KEYWORDS:
-            if keyword in title_lower:
-                return "theater"
-
-        # Check comedy keywords
-        for keyword in COMEDY_KEYWORDS:
-            if keyword in title_lower:
-                return "comedy"
-
-        # Default to music
-        return "music"
-
-
 # Standalone function to get categorized events
 def scrape_ohmyomaha(supabase_client=None, venue_matcher=None) -> list[dict]:
     """
@@ -267,7 +165,7 @@ def scrape_ohmyomaha(supabase_client=None, venue_matcher=None) -> list[dict]:
     for event in events:
         # source is already set to the matched venue_id
         venue_id = event.source
-        category = scraper._categorize(event.title, event.venue or "")
+        category = event.category or scraper.categorize(event.title, event.venue)
 
         result.append({
             "id": event.id,
@@ -1,20 +1,26 @@
 # scraper/scrapers/omahaunderground.py
 import re
 import sys
-from datetime import datetime
 from pathlib import Path
+from typing import Iterator
 import requests
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from scrapers.base import BaseScraper
-from models import Event
+from scrapers.parse_pool import ParseJob
+from scrapers.parsing import make_soup
+from models import Event, EventRecord, validate_events
+from event_ids import make_event_id
 from venue_matcher import VenueMatcher
 from matching import find_existing_event
+from dates import parse_date, parse_time
+from streaming import batched
 
 
 class OtherVenuesScraper(BaseScraper):
     name = "Other"
     id = "other"
     url = "https://omahaunderground.net/shows/"
+    container_selectors = ("div.show",)
 
     def __init__(self, supabase_client=None, venue_matcher=None):
         self.session = requests.Session()
@@ -26,12 +32,19 @@ class OtherVenuesScraper(BaseScraper):
 
     def scrape(self) -> list[Event]:
         """Override scrape to fetch detail pages for each show."""
+        return list(self.iter_events())
+
+    def iter_events(self) -> Iterator[Event]:
+        """Yield events a batch of detail pages at a time."""
         html = self.fetch_html()
-        return self.parse_events(html)
+        yield from self._iter_shows(html)
 
     def parse_events(self, html: str) -> list[Event]:
+        return list(self._iter_shows(html))
+
+    def _iter_shows(self, html: str) -> Iterator[Event]:
         soup = self.get_soup(html)
-        events = []
+        shows = []
 
         # Each show is in a div.show
         for show_div in soup.select("div.show"):
@@ -57,81 +70,104 @@ class OtherVenuesScraper(BaseScraper):
                 if not detail_url.startswith("http"):
                     detail_url = f"https://omahaunderground.net{detail_url}"
 
-                # Fetch detail page (dedup handled inside)
-                event = self._fetch_detail(detail_url, venue_name, matched_venue_id)
-                if event:
-                    events.append(event)
+                shows.append((detail_url, venue_name, matched_venue_id))
 
             except Exception:
                 continue
 
-        return events
+        for batch in batched(shows, self.stream_batch):
+            yield from self._events_from_details(batch)
+
+    def _events_from_details(self, shows: list[tuple]) -> list[Event]:
+        """Fetch and build a batch of shows. Detail pages are parsed in the
+        parse pool while the next one downloads."""
+        jobs = []
+        for detail_url, venue_name, matched_venue_id in shows:
+            html = self._fetch_detail_html(detail_url)
+            if html is not None:
+                jobs.append((ParseJob(self._parse_detail, html), detail_url, venue_name, matched_venue_id))
+
+        events = []
+        for job, detail_url, venue_name, matched_venue_id in jobs:
+            try:
+                detail = job.result()
+            except Exception:
+                continue
+            if detail:
+                # Dedup handled inside
+                event = self._build_event(detail, detail_url, venue_name, matched_venue_id)
+                if event:
+                    events.append(event)
+
+        return validate_events(events)
+
+    def _fetch_detail_html(self, url: str) -> str | None:
+        try:
+            response = self.session.get(url, timeout=15)
+            response.raise_for_status()
+            return response.text
+        except Exception:
+            return None
 
-    def _fetch_detail(self, url: str, venue_name: str, matched_venue_id: str | None = None) -> Event | None:
-        """Fetch a show detail page and extract event info.
+    @classmethod
+    def _parse_detail(cls, html: str) -> dict | None:
+        """Extract date, title, image, time and price from a show detail page.
+
+        Runs in the parse pool, so it only touches class attributes.
+        """
+        soup = make_soup(html, cls.parser)
+
+        # Date from h2.name (format: "Feb. 27, 2026")
+        date_el = soup.select_one("h2.name")
+        if not date_el:
+            return None
+        date_str = parse_date(date_el.get_text(strip=True), cls.date_format)
+        if not date_str:
+            return None
+
+        # Title from h1 in below-name div
+        title_el = soup.select_one("div.below-name h1")
+        title = title_el.get_text(strip=True) if title_el else None
+        if not title:
+            return None
+
+        # Image
+        img_el = soup.select_one("div.below-name img")
+        image_url = img_el.get("src") if img_el else None
+
+        # Time and price from h3 in below-name
+        time_str = None
+        price = None
+        info_el = soup.select_one("div.below-name h3")
+        if info_el:
+            info_text = info_el.get_text(separator=" ", strip=True)
+            time_str = parse_time(info_text, cls.time_format)
+            price = cls._parse_price(info_text)
+
+        return {"date": date_str, "title": title, "image_url": image_url, "time": time_str, "price": price}
+
+    def _build_event(self, detail: dict, url: str, venue_name: str, matched_venue_id: str | None = None) -> EventRecord | None:
+        """Turn a parsed detail page into an event.
 
         Args:
+            detail: Fields from _parse_detail
             url: Detail page URL
             venue_name: Raw venue name from scraper
             matched_venue_id: Official venue ID if matched, None otherwise
 
         Returns:
-            Event object or None if skipped (duplicate) or error
+            Event record or None if skipped (duplicate) or error
         """
         try:
-            response = self.session.get(url, timeout=15)
-            response.raise_for_status()
-            soup = self.get_soup(response.text)
-
-            # Date from h2.name (format: "Feb. 27, 2026")
-            date_el = soup.select_one("h2.name")
-            if not date_el:
-                return None
-            date_str = self._parse_date(date_el.get_text(strip=True))
-            if not date_str:
-                return None
-
-            # Title from h1 in below-name div
-            title_el = soup.select_one("div.below-name h1")
-            title = title_el.get_text(strip=True) if title_el else None
-            if not title:
-                return None
+            title, date_str = detail["title"], detail["date"]
 
             # If matched to official venue, check for existing event
             if matched_venue_id and self.supabase:
                 existing_events = self._get_events_for_venue_date(matched_venue_id, date_str)
-                # Create a temp event object for matching
-                temp_event = Event(
-                    id="temp",
-                    title=title,
-                    date=date_str,
-                    time=None,
-                    venue=venue_name,
-                    eventUrl=url,
-                    ticketUrl=None,
-                    imageUrl=None,
-                    price=None,
-                    ageRestriction=None,
-                    supportingArtists=None,
-                    source=self.id
-                )
-                if find_existing_event(temp_event, existing_events):
+                if find_existing_event((title, date_str), existing_events):
                     # Duplicate found - skip this event
                     return None
 
-            # Image
-            img_el = soup.select_one("div.below-name img")
-            image_url = img_el.get("src") if img_el else None
-
-            # Time and price from h3 in below-name
-            time_str = None
-            price = None
-            info_el = soup.select_one("div.below-name h3")
-            if info_el:
-                info_text = info_el.get_text(separator=" ", strip=True)
-                time_str = self._parse_time(info_text)
-                price = self._parse_price(info_text)
-
             # Determine venue_id and venue_name for the event
             # If matched to official venue, use that venue_id
             # Otherwise, use "other" with the raw venue name
@@ -143,22 +179,22 @@ class OtherVenuesScraper(BaseScraper):
                 final_venue_name = venue_name
 
             # Generate ID
-            slug = re.sub(r'[^a-z0-9]+', '-', title.lower()).strip('-')
-            event_id = f"{final_venue_id}-{date_str}-{slug}"[:80]
+            event_id = make_event_id(final_venue_id, date_str, title)
 
-            return Event(
+            return EventRecord(
                 id=event_id,
                 title=title,
                 date=date_str,
-                time=time_str,
+                time=detail["time"],
                 venue=final_venue_name,  # Only set for "other" venues
                 eventUrl=url,
                 ticketUrl=None,
-                imageUrl=image_url,
-                price=price,
+                imageUrl=detail["image_url"],
+                price=detail["price"],
                 ageRestriction=None,
                 supportingArtists=None,
-                source=final_venue_id  # Use matched venue_id as source
+                source=final_venue_id,  # Use matched venue_id as source
+                category=self.categorize(title, venue_name),
             )
         except Exception:
             return None
@@ -170,50 +206,8 @@ class OtherVenuesScraper(BaseScraper):
         result = self.supabase.table("events").select("*").eq("venue_id", venue_id).eq("date", event_date).execute()
         return result.data or []
 
-    def _parse_date(self, text: str) -> str | None:
-        """Parse 'Feb. 27, 2026' or 'March 7, 2026' to YYYY-MM-DD."""
-        try:
-            # Handle abbreviated month with period (e.g., "Feb. 27, 2026")
-            text = text.replace(".", "")
-            try:
-                dt = datetime.strptime(text, "%b %d, %Y")
-                return dt.strftime("%Y-%m-%d")
-            except ValueError:
-                pass
-
-            # Handle full month name (e.g., "March 7, 2026")
-            try:
-                dt = datetime.strptime(text, "%B %d, %Y")
-                return dt.strftime("%Y-%m-%d")
-            except ValueError:
-                pass
-
-            return None
-        except Exception:
-            return None
-
-    def _parse_time(self, text: str) -> str | None:
-        """Extract time like '6 p.m.' or '8:30 p.m.' from text."""
-        try:
-            # Match patterns like "6 p.m.", "8:30 p.m.", "7pm"
-            match = re.search(r'(\d{1,2})(?::(\d{2}))?\s*([ap])\.?m\.?', text.lower())
-            if not match:
-                return None
-
-            hour = int(match.group(1))
-            minute = int(match.group(2)) if match.group(2) else 0
-            period = match.group(3)
-
-            if period == 'p' and hour != 12:
-                hour += 12
-            elif period == 'a' and hour == 12:
-                hour = 0
-
-            return f"{hour:02d}:{minute:02d}"
-        except Exception:
-            return None
-
-    def _parse_price(self, text: str) -> str | None:
+    @staticmethod
+    def _parse_price(text: str) -> str | None:
         """Extract price like '$10' or '$10 PWYC' from text."""
         try:
             # Normalize whitespace
@@ -2,11 +2,17 @@
 import re
 import sys
 import time
-from datetime import datetime, date as date_type
 from pathlib import Path
+from typing import Iterator
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from scrapers.base import BaseScraper
-from models import Event
+from scrapers.pagination import ParsedPage, host_limiter, paginate, total_pages_from_select
+from scrapers.parse_pool import ParseJob
+from scrapers.parsing import make_soup
+from models import Event, EventRecord, validate_events
+from event_ids import make_event_id
+from dates import parse_date, parse_time
+from streaming import batched
 
 
 class OPAScraper(BaseScraper):
@@ -21,6 +27,8 @@ class OPAScraper(BaseScraper):
     _price_cache: dict[str, str | None] = {}
 
     BASE_URL = "https://ticketomaha.com/events"
+    # Event cards plus the page dropdown used for pagination
+    container_selectors = ("li.eventCard", "select[name=page]")
     VENUE_MAP = {
         "Holland Performing Arts Center": "holland",
         "Orpheum Theater": "orpheum",
@@ -32,13 +40,20 @@ class OPAScraper(BaseScraper):
         self.url = f"https://ticketomaha.com/events?themes%5B%5D=6"
 
     def scrape(self) -> list[Event]:
-        all_raw = self._get_all_events()
+        return list(self.iter_events())
+
+    def iter_events(self) -> Iterator[Event]:
+        """Yield this venue's events a batch at a time as their detail-page prices come in."""
+        all_raw = [raw for raw in self._get_all_events() if raw["venue_id"] == self.id]
+        for batch in batched(all_raw, self.stream_batch):
+            yield from self._events_with_prices(batch)
+
+    def _events_with_prices(self, raws: list[dict]) -> list[Event]:
+        prices = self._fetch_prices([raw["event_url"] for raw in raws if raw["event_url"]])
         events = []
-        for raw in all_raw:
-            if raw["venue_id"] != self.id:
-                continue
-            price = self._fetch_price(raw["event_url"]) if raw["event_url"] else None
-            events.append(Event(
+        for raw in raws:
+            price = prices.get(raw["event_url"]) if raw["event_url"] else None
+            events.append(EventRecord(
                 id=raw["id"],
                 title=raw["title"],
                 date=raw["date"],
@@ -50,8 +65,9 @@ class OPAScraper(BaseScraper):
                 price=price,
                 ageRestriction=raw["age_restriction"],
                 source=self.id,
+                category=self.categorize(raw["title"]),
             ))
-        return events
+        return validate_events(events)
 
     def parse_events(self, html: str) -> list[Event]:
         # Required by BaseScraper ABC but unused — scrape() handles everything
@@ -62,70 +78,82 @@ class OPAScraper(BaseScraper):
         if cls._cache is not None and (time.time() - cls._cache_time) < 60:
             return cls._cache
 
-        import requests
-        from bs4 import BeautifulSoup
-
-        all_raw = []
-        page = 1
-
-        while True:
-            url = f"{cls.BASE_URL}?start=&end=&themes%5B%5D=6&page={page}"
-            try:
-                resp = requests.get(url, timeout=30)
-                resp.raise_for_status()
-            except Exception:
-                break
-
-            raw_events = cls._parse_page(resp.text)
-            if not raw_events:
-                break
-
-            all_raw.extend(raw_events)
-
-            soup = BeautifulSoup(resp.text, "html.parser")
-            page_options = soup.select("select[name=page] option")
-            max_page = max((int(o.get_text(strip=True)) for o in page_options), default=1)
-            if page >= max_page:
-                break
-            page += 1
+        all_raw = paginate(
+            cls._fetch_page,
+            first_page=1,
+            workers=cls.page_workers,
+            limiter=host_limiter(cls.BASE_URL, cls.page_interval),
+            parse=cls._parse_page,
+        )
 
         cls._cache = all_raw
         cls._cache_time = time.time()
         return all_raw
 
     @classmethod
-    def _fetch_price(cls, url: str) -> str | None:
-        """Fetch an event detail page to extract 'Tickets start at $X'."""
-        if url in cls._price_cache:
-            return cls._price_cache[url]
+    def _fetch_page(cls, page: int) -> str | None:
+        import requests
+
+        url = f"{cls.BASE_URL}?start=&end=&themes%5B%5D=6&page={page}"
+        try:
+            resp = requests.get(url, timeout=30)
+            resp.raise_for_status()
+        except Exception:
+            return None
+        return resp.text
+
+    @classmethod
+    def _fetch_prices(cls, urls: list[str]) -> dict[str, str | None]:
+        """Prices for event detail pages, parsed in the parse pool while the next page downloads."""
+        jobs = {}
+        for url in urls:
+            if url in cls._price_cache or url in jobs:
+                continue
+            html = cls._fetch_detail_html(url)
+            jobs[url] = ParseJob(cls._price_from_detail, html) if html is not None else None
+        for url, job in jobs.items():
+            try:
+                cls._price_cache[url] = job.result() if job else None
+            except Exception:
+                cls._price_cache[url] = None
+        return {url: cls._price_cache[url] for url in urls}
 
+    @classmethod
+    def _fetch_detail_html(cls, url: str) -> str | None:
         import requests
-        from bs4 import BeautifulSoup
 
         try:
-            time.sleep(0.5)  # Be polite
+            host_limiter(url, cls.page_interval).wait()  # Be polite
             resp = requests.get(url, timeout=15, headers={
                 'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
             })
             resp.raise_for_status()
-            soup = BeautifulSoup(resp.text, "html.parser")
-            text = soup.get_text(" ", strip=True)
-            match = re.search(r'Tickets\s+start\s+at\s+\$(\d+(?:\.\d+)?)', text)
-            if match:
-                dollars = match.group(1).split('.')[0]
-                price = f"From ${dollars}"
-            else:
-                price = None
         except Exception:
-            price = None
+            return None
+        return resp.text
+
+    @classmethod
+    def _price_from_detail(cls, html: str) -> str | None:
+        """Extract 'Tickets start at $X' from an event detail page."""
+        soup = make_soup(html, cls.parser)
+        text = soup.get_text(" ", strip=True)
+        match = re.search(r'Tickets\s+start\s+at\s+\$(\d+(?:\.\d+)?)', text)
+        if match:
+            dollars = match.group(1).split('.')[0]
+            return f"From ${dollars}"
+        return None
 
-        cls._price_cache[url] = price
-        return price
+    @classmethod
+    def _parse_page(cls, html: str) -> ParsedPage:
+        """Parse one listing page into raw event dicts plus the page count."""
+        soup = make_soup(html, cls.parser, cls.container_selectors)
+        return ParsedPage(
+            items=cls._raw_events_from_soup(soup),
+            total_pages=total_pages_from_select(soup, "select[name=page]"),
+        )
 
     @classmethod
-    def _parse_page(cls, html: str) -> list[dict]:
-        from bs4 import BeautifulSoup
-        soup = BeautifulSoup(html, "html.parser")
+    def _raw_events_from_soup(cls, soup) -> list[dict]:
         results = []
 
         for card in soup.select("li.eventCard"):
@@ -150,13 +178,13 @@ class OPAScraper(BaseScraper):
                 # Date
                 start_el = card.select_one(".start")
                 date_text = start_el.get_text(strip=True) if start_el else None
-                date_str = cls._parse_date(date_text) if date_text else None
+                date_str = parse_date(date_text) if date_text else None
                 if not date_str:
                     continue
 
                 # Time
                 time_el = card.select_one(".time")
-                time_str = cls._parse_time(time_el.get_text(strip=True)) if time_el else None
+                time_str = parse_time(time_el.get_text(strip=True)) if time_el else None
 
                 # Event/ticket URL
                 detail_link = card.select_one('a[href^="/events/"]')
@@ -166,8 +194,7 @@ class OPAScraper(BaseScraper):
                 img_el = card.select_one("img")
                 image_url = img_el.get("src") if img_el else None
 
-                slug = re.sub(r'[^a-z0-9]+', '-', title.lower()).strip('-')
-                event_id = f"{venue_id}-{date_str}-{slug}"[:80]
+                event_id = make_event_id(venue_id, date_str, title)
 
                 results.append({
                     "id": event_id,
@@ -185,64 +212,6 @@ class OPAScraper(BaseScraper):
 
         return results
 
-    @staticmethod
-    def _parse_date(date_text: str) -> str | None:
-        try:
-            date_text = date_text.strip()
-            # Strip day-of-week prefix and collapse whitespace
-            date_text = re.sub(r'^[A-Za-z]{3}\s+', '', date_text)
-            date_text = re.sub(r'\s+', ' ', date_text).strip()
-
-            match = re.match(r'([A-Za-z]+)\s+(\d+)', date_text)
-            if not match:
-                return None
-
-            month_str = match.group(1)
-            day = int(match.group(2))
-            months = {
-                'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
-                'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12,
-            }
-            month = months.get(month_str.lower())
-            if not month:
-                return None
-
-            year = datetime.now().year
-            try:
-                event_date = date_type(year, month, day)
-                if (date_type.today() - event_date).days > 30:
-                    year += 1
-            except ValueError:
-                return None
-
-            return f"{year:04d}-{month:02d}-{day:02d}"
-        except Exception:
-            return None
-
-    @staticmethod
-    def _parse_time(time_text: str) -> str | None:
-        try:
-            time_text = time_text.strip().lstrip('-').strip()
-            if not time_text or 'Multiple' in time_text:
-                return None
-
-            match = re.match(r'(\d{1,2}):(\d{2})\s*(AM|PM)', time_text, re.IGNORECASE)
-            if not match:
-                return None
-
-            hour = int(match.group(1))
-            minute = int(match.group(2))
-            period = match.group(3).upper()
-
-            if period == 'PM' and hour != 12:
-                hour += 12
-            elif period == 'AM' and hour == 12:
-                hour = 0
-
-            return f"{hour:02d}:{minute:02d}"
-        except Exception:
-            return None
-
     @staticmethod
     def _extract_age_restriction(title: str) -> tuple[str, str | None]:
         match = re.search(r'\s*\((\d+\+)\)\s*$', title)
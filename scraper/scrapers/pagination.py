@@ -0,0 +1,179 @@
+# scraper/scrapers/pagination.py
+"""
+Parse-once page model for paginated listing sites.
+
+A paginated scraper turns each fetched page into a ParsedPage in a single
+parse: the items found on it plus whatever the page says about pagination
+(a "Next" link, a page dropdown). The fetch loop only looks at the
+ParsedPage, so the HTML is never parsed a second time just to find the
+next page.
+
+iter_pages() drives the fetching and yields pages as they arrive;
+paginate() collects them into one list. Once the first page advertises a page
+count, the remaining pages are fetched concurrently. Every request waits
+on a per-host rate limiter, and the results are merged back in page order.
+When a site only offers a "Next" link, the pages are walked one at a time
+as before.
+
+Given a `parse` function, fetching and parsing are decoupled: fetch
+threads only download raw HTML, and each page is parsed in the process
+pool (see parse_pool.py) as soon as it arrives.
+"""
+import re
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, Iterator
+from urllib.parse import urlparse
+
+from bs4 import BeautifulSoup
+
+from scrapers.parse_pool import ParseJob
+
+
+@dataclass
+class ParsedPage:
+    """Items from one listing page and the pagination it advertises."""
+    items: list = field(default_factory=list)
+    next_page: int | None = None    # Page number a "Next" link points to
+    total_pages: int | None = None  # Page count, when the site advertises one
+
+
+def next_page_from_links(soup: BeautifulSoup, selector: str, param: str, label: str = "Next") -> int | None:
+    """Page number from the last `label` link matching selector, read from its `param=N` query value."""
+    pattern = re.compile(rf"{re.escape(param)}=(\d+)")
+    next_page = None
+    for link in soup.select(selector):
+        if label in link.get_text():
+            match = pattern.search(link.get("href", ""))
+            if match:
+                next_page = int(match.group(1))
+    return next_page
+
+
+def total_pages_from_select(soup: BeautifulSoup, selector: str) -> int | None:
+    """Highest numeric option in a page dropdown, or None if there isn't one."""
+    pages = [int(text) for o in soup.select(f"{selector} option") if (text := o.get_text(strip=True)).isdigit()]
+    return max(pages) if pages else None
+
+
+class HostRateLimiter:
+    """Enforces a minimum interval between request starts to one host, across threads."""
+
+    def __init__(self, min_interval: float):
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next_at = 0.0
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_at)
+            self._next_at = start + self.min_interval
+        if start > now:
+            time.sleep(start - now)
+
+
+_limiters: dict[str, HostRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def host_limiter(url: str, min_interval: float) -> HostRateLimiter:
+    """Shared limiter for url's host, so scrapers hitting the same site share one budget."""
+    host = urlparse(url).netloc.lower()
+    with _limiters_lock:
+        limiter = _limiters.get(host)
+        if limiter is None:
+            limiter = _limiters[host] = HostRateLimiter(min_interval)
+        else:
+            limiter.min_interval = max(limiter.min_interval, min_interval)
+        return limiter
+
+
+def _following_page(parsed: ParsedPage, current: int) -> int | None:
+    if parsed.total_pages is not None:
+        return current + 1 if current < parsed.total_pages else None
+    if parsed.next_page is not None and parsed.next_page > current:
+        return parsed.next_page
+    return None
+
+
+def _parsed_pages(fetched: Iterable, parse: Callable[[str], ParsedPage] | None) -> Iterator[ParsedPage | None]:
+    """Pass ParsedPages through, or send raw HTML to the parse pool as each page arrives.
+
+    Parsed pages are yielded in order as soon as they are ready, while
+    later pages may still be downloading.
+    """
+    if parse is None:
+        yield from fetched
+        return
+    pending: deque[ParseJob] = deque()
+    for html in fetched:
+        if html is None:
+            break
+        pending.append(ParseJob(parse, html))
+        while pending and pending[0].done():
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def iter_pages(
+    fetch_page: Callable[[int], ParsedPage | str | None],
+    first_page: int = 1,
+    workers: int = 4,
+    limiter: HostRateLimiter | None = None,
+    parse: Callable[[str], ParsedPage] | None = None,
+) -> Iterator[ParsedPage]:
+    """
+    Yield every page of a listing in page order, as each becomes available.
+
+    fetch_page(n) returns the ParsedPage for page n, or None if the request
+    failed. With `parse`, fetch_page returns page n's raw HTML instead and
+    parse(html) builds the ParsedPage in the parse pool. Pagination stops
+    at the first failed or empty page, the same as a sequential walk would.
+    workers=1 forces sequential fetching.
+    """
+    def fetch(number: int) -> ParsedPage | str | None:
+        if limiter:
+            limiter.wait()
+        return fetch_page(number)
+
+    def fetch_parsed(number: int) -> ParsedPage | None:
+        return next(_parsed_pages([fetch(number)], parse), None)
+
+    first = fetch_parsed(first_page)
+    if not first or not first.items:
+        return
+    yield first
+
+    total = first.total_pages
+    if total is not None and workers > 1 and total > first_page:
+        numbers = range(first_page + 1, total + 1)
+        with ThreadPoolExecutor(max_workers=min(workers, len(numbers))) as pool:
+            for parsed in _parsed_pages(pool.map(fetch, numbers), parse):
+                if not parsed or not parsed.items:
+                    break
+                yield parsed
+    else:
+        current, parsed = first_page, first
+        while (following := _following_page(parsed, current)) is not None:
+            parsed = fetch_parsed(following)
+            if not parsed or not parsed.items:
+                break
+            yield parsed
+            current = following
+
+
+def paginate(
+    fetch_page: Callable[[int], ParsedPage | str | None],
+    first_page: int = 1,
+    workers: int = 4,
+    limiter: HostRateLimiter | None = None,
+    parse: Callable[[str], ParsedPage] | None = None,
+) -> list:
+    """Fetch every page of a listing (see iter_pages) and return all items in page order."""
+    pages = iter_pages(fetch_page, first_page, workers, limiter, parse)
+    return [item for page in pages for item in page.items]
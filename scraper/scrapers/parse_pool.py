@@ -0,0 +1,115 @@
+# scraper/scrapers/parse_pool.py
+"""
+Process pool for CPU-bound HTML parsing.
+
+Parse functions and their results must pickle. SCRAPER_PARSE_WORKERS is
+"auto" (CPUs, at most MAX_AUTO_WORKERS), N, or 0 to parse inline. Workers
+start from a forkserver or spawn, never fork, since fetch threads are live.
+A job whose function or arguments won't pickle runs inline, as does one
+whose pool dies. Errors raised by the parse itself propagate unchanged.
+"""
+import logging
+import multiprocessing
+import os
+import pickle
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable
+
+MAX_AUTO_WORKERS = 4  # A run parses tens of pages, more processes only cost startup
+
+_pool: ProcessPoolExecutor | None = None
+_pool_broken = False
+_pool_lock = threading.Lock()
+_warned: set[str] = set()
+
+logger = logging.getLogger(__name__)
+
+
+def _warn_once(key: str, message: str) -> None:
+    if key not in _warned:
+        _warned.add(key)
+        logger.warning(message)
+
+
+def parse_workers() -> int:
+    """Worker process count from SCRAPER_PARSE_WORKERS; 0 means parse inline."""
+    value = (os.environ.get("SCRAPER_PARSE_WORKERS") or "auto").strip().lower()
+    if value != "auto":
+        try:
+            return max(0, int(value))
+        except ValueError:
+            _warn_once(value, f"SCRAPER_PARSE_WORKERS='{value}' is not a number, using auto")
+    return min(os.cpu_count() or 1, MAX_AUTO_WORKERS)
+
+
+def _mp_context() -> multiprocessing.context.BaseContext:
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+def get_parse_pool() -> ProcessPoolExecutor | None:
+    """The shared parse pool, started on first use; None when parsing inline."""
+    global _pool
+    with _pool_lock:
+        if _pool is None and not _pool_broken:
+            workers = parse_workers()
+            if workers > 0:
+                _pool = ProcessPoolExecutor(max_workers=workers, mp_context=_mp_context())
+        return _pool
+
+
+def shutdown_parse_pool() -> None:
+    """Stop the worker processes; the next parse starts a fresh pool."""
+    global _pool, _pool_broken
+    with _pool_lock:
+        pool, _pool, _pool_broken = _pool, None, False
+    if pool is not None:
+        pool.shutdown()
+
+
+def _mark_broken(error: Exception) -> None:
+    global _pool, _pool_broken
+    with _pool_lock:
+        _pool, _pool_broken = None, True
+    _warn_once("broken", f"parse pool failed ({error}), parsing inline")
+
+
+def _picklable(func: Callable, args: tuple) -> bool:
+    """Whether a job can be sent to the pool; warns once per function if not."""
+    try:
+        pickle.dumps((func, args), pickle.HIGHEST_PROTOCOL)
+        return True
+    except (pickle.PicklingError, TypeError, AttributeError) as e:
+        name = getattr(func, "__qualname__", repr(func))
+        _warn_once(name, f"{name} could not run in the parse pool ({e}), parsing inline")
+        return False
+
+
+class ParseJob:
+    """One parse submitted to the pool. result() waits for it."""
+
+    def __init__(self, func: Callable, *args):
+        self.func = func
+        self.args = args
+        self._future: Future | None = None
+        pool = get_parse_pool()
+        if pool is not None and _picklable(func, args):
+            try:
+                self._future = pool.submit(func, *args)
+            except (BrokenProcessPool, RuntimeError) as e:
+                _mark_broken(e)
+
+    def done(self) -> bool:
+        """True once result() won't block on the pool (inline jobs run on demand)."""
+        return self._future is None or self._future.done()
+
+    def result(self):
+        if self._future is None:
+            return self.func(*self.args)
+        try:
+            return self._future.result()
+        except BrokenProcessPool as e:
+            _mark_broken(e)
+        return self.func(*self.args)
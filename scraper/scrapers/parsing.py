@@ -0,0 +1,139 @@
+# scraper/scrapers/parsing.py
+"""
+HTML parser backend selection.
+
+Every scraper builds its soup through make_soup (usually via
+BaseScraper.get_soup) so the tree builder can be swapped in one place.
+The backend comes from the SCRAPER_HTML_PARSER environment variable:
+
+    html.parser  pure-Python stdlib parser, always available (default)
+    lxml         libxml2-based C parser, several times faster on listing pages
+    auto         lxml if it is installed, otherwise html.parser
+    html5lib     browser-grade but slowest; only useful for debugging odd markup
+
+lxml is opt-in because it can build a different tree from the same
+markup. A backend that isn't installed falls back to html.parser with a
+warning rather than failing the scrape.
+
+Scrapers can also scope parsing to the containers they actually read (see
+BaseScraper.container_selectors). Only subtrees whose root matches one of
+the selectors are built; navigation, footers and inline scripts are
+skipped by the tree builder. Supported selector forms are deliberately
+small: `tag`, `.class`, `tag.class1.class2`, and an optional single
+`[attr=value]`, `[attr^=value]` or `[attr*=value]` suffix.
+"""
+import importlib.util
+import logging
+import os
+import re
+from functools import lru_cache
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+DEFAULT_PARSER = "html.parser"
+KNOWN_PARSERS = ("lxml", "html.parser", "html5lib")
+
+logger = logging.getLogger(__name__)
+
+_warned: set[str] = set()
+
+
+def parser_available(name: str) -> bool:
+    if name == "html.parser":
+        return True
+    return importlib.util.find_spec(name) is not None
+
+
+def available_parsers() -> list[str]:
+    return [name for name in KNOWN_PARSERS if parser_available(name)]
+
+
+def resolve_parser(name: str | None = None) -> str:
+    """Turn a configured backend name into one BeautifulSoup can use here."""
+    name = (name or os.environ.get("SCRAPER_HTML_PARSER") or DEFAULT_PARSER).strip().lower()
+    if name == "auto":
+        return "lxml" if parser_available("lxml") else DEFAULT_PARSER
+    if name not in KNOWN_PARSERS or not parser_available(name):
+        if name not in _warned:
+            _warned.add(name)
+            logger.warning("HTML parser %r unavailable, using %s", name, DEFAULT_PARSER)
+        return DEFAULT_PARSER
+    return name
+
+
+SELECTOR_RE = re.compile(
+    r'^(?P<tag>[a-zA-Z][\w-]*)?(?P<classes>(?:\.[\w-]+)*)'
+    r'(?:\[(?P<attr>[\w-]+)(?P<op>[*^]?=)["\']?(?P<value>[^\]"\']*)["\']?\])?$'
+)
+
+
+class _SelectorRule:
+    """One compiled container selector, matched against raw start-tag data."""
+
+    def __init__(self, selector: str):
+        match = SELECTOR_RE.match(selector.strip())
+        if not match or not any(match.group("tag", "classes", "attr")):
+            raise ValueError(f"Unsupported container selector: {selector!r}")
+        self.tag = (match.group("tag") or "").lower() or None
+        self.classes = frozenset(c for c in match.group("classes").split(".") if c)
+        self.attr = match.group("attr")
+        self.op = match.group("op")
+        self.value = match.group("value")
+
+    def matches(self, name: str, attrs: dict) -> bool:
+        if self.tag and name != self.tag:
+            return False
+        if self.classes:
+            classes = attrs.get("class") or ""
+            if isinstance(classes, str):
+                classes = classes.split()
+            if not self.classes.issubset(classes):
+                return False
+        if self.attr:
+            value = attrs.get(self.attr)
+            if value is None:
+                return False
+            if isinstance(value, list):
+                value = " ".join(value)
+            if self.op == "=":
+                return value == self.value
+            if self.op == "^=":
+                return value.startswith(self.value)
+            return self.value in value
+        return True
+
+
+class ContainerStrainer(SoupStrainer):
+    """Lets the tree builder create only subtrees rooted at matching containers.
+
+    Once a container is admitted its whole subtree is kept, so scrapers can
+    keep using their normal CSS selectors on the result.
+    """
+
+    def __init__(self, selectors: tuple[str, ...]):
+        super().__init__()
+        self.selectors = selectors
+        self.rules = [_SelectorRule(s) for s in selectors]
+
+    def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+        attrs = attrs or {}
+        return any(rule.matches(name, attrs) for rule in self.rules)
+
+    def allow_string_creation(self, string: str) -> bool:
+        # Text outside any container is never needed
+        return False
+
+    def __repr__(self):
+        return f"ContainerStrainer({self.selectors!r})"
+
+
+@lru_cache(maxsize=64)
+def container_strainer(selectors: tuple[str, ...]) -> ContainerStrainer:
+    return ContainerStrainer(selectors)
+
+
+def make_soup(html: str, parser: str | None = None, containers: tuple[str, ...] = ()) -> BeautifulSoup:
+    """Parse HTML with the configured backend, optionally only the given containers."""
+    if containers:
+        return BeautifulSoup(html, resolve_parser(parser), parse_only=container_strainer(tuple(containers)))
+    return BeautifulSoup(html, resolve_parser(parser))
@@ -1,17 +1,17 @@
 # scraper/scrapers/steelhouse.py
-import re
 import sys
-from datetime import datetime
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from scrapers.base import BaseScraper
-from models import Event
+from models import Event, EventRecord, validate_events
+from event_ids import make_event_id
 
 
 class SteelHouseScraper(BaseScraper):
     name = "Steelhouse"
     id = "steelhouse"
     url = "https://steelhouseomaha.com/events/"
+    container_selectors = ("div.bg-gray-800.rounded-lg.overflow-hidden.shadow-lg.relative.group",)
 
     def parse_events(self, html: str) -> list[Event]:
         soup = self.get_soup(html)
@@ -44,7 +44,8 @@ class SteelHouseScraper(BaseScraper):
                 footer_p = card.select_one("p.text-gray-300.mb-3")
                 if footer_p:
                     footer_text = footer_p.get_text(strip=True)
-                    date_str, time_str = self._parse_datetime(footer_text)
+                    date_str = self._parse_date(footer_text)
+                    time_str = self._parse_time(footer_text)
 
                 # If no date from footer, try hover overlay
                 if not date_str:
@@ -57,7 +58,7 @@ class SteelHouseScraper(BaseScraper):
                                 label_text = label.get_text(strip=True).lower()
                                 value_text = value.get_text(strip=True)
                                 if label_text == "date":
-                                    date_str = self._parse_full_date(value_text)
+                                    date_str = self._parse_date(value_text)
                                 elif label_text == "showtime":
                                     time_str = self._parse_time(value_text)
 
@@ -69,10 +70,9 @@ class SteelHouseScraper(BaseScraper):
                 ticket_url = ticket_link.get("href") if ticket_link else None
 
                 # Generate ID
-                slug = re.sub(r'[^a-z0-9]+', '-', title.lower()).strip('-')
-                event_id = f"steelhouse-{date_str}-{slug}"[:80]
+                event_id = make_event_id("steelhouse", date_str, title)
 
-                events.append(Event(
+                events.append(EventRecord(
                     id=event_id,
                     title=title.title(),  # Capitalize since titles are lowercase on site
                     date=date_str,
@@ -84,61 +84,10 @@ class SteelHouseScraper(BaseScraper):
                     price=None,
                     ageRestriction=None,
                     supportingArtists=None,
-                    source=self.id
+                    source=self.id,
+                    category=self.categorize(title),
                 ))
             except Exception:
                 continue  # Skip malformed events
 
-        return events
-
-    def _parse_datetime(self, text: str) -> tuple[str | None, str | None]:
-        """Parse 'Feb 26, 2026 @ 7:00 PM' format."""
-        try:
-            # Split on @ to get date and time
-            if "@" in text:
-                date_part, time_part = text.split("@", 1)
-                date_str = self._parse_short_date(date_part.strip())
-                time_str = self._parse_time(time_part.strip())
-                return date_str, time_str
-            else:
-                return self._parse_short_date(text.strip()), None
-        except Exception:
-            return None, None
-
-    def _parse_short_date(self, text: str) -> str | None:
-        """Parse 'Feb 26, 2026' or 'Mar 11, 2026' to YYYY-MM-DD."""
-        try:
-            # Try parsing with datetime
-            dt = datetime.strptime(text, "%b %d, %Y")
-            return dt.strftime("%Y-%m-%d")
-        except ValueError:
-            return None
-
-    def _parse_full_date(self, text: str) -> str | None:
-        """Parse 'February 26, 2026' to YYYY-MM-DD."""
-        try:
-            dt = datetime.strptime(text, "%B %d, %Y")
-            return dt.strftime("%Y-%m-%d")
-        except ValueError:
-            return None
-
-    def _parse_time(self, text: str) -> str | None:
-        """Convert '7:00 PM' to HH:MM format (24-hour)."""
-        try:
-            text = text.strip().upper()
-            match = re.match(r'(\d{1,2}):(\d{2})\s*(AM|PM)', text)
-            if not match:
-                return None
-
-            hour = int(match.group(1))
-            minute = int(match.group(2))
-            period = match.group(3)
-
-            if period == 'PM' and hour != 12:
-                hour += 12
-            elif period == 'AM' and hour == 12:
-                hour = 0
-
-            return f"{hour:02d}:{minute:02d}"
-        except Exception:
-            return None
+        return validate_events(events)
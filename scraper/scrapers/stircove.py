@@ -4,14 +4,14 @@ Stir Concert Cove scraper.
 Uses Ticketmaster API to fetch events directly - much more reliable than scraping.
 """
 import os
-import re
 import sys
 from pathlib import Path
 import requests
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from scrapers.base import BaseScraper
-from models import Event
+from models import Event, EventRecord, validate_events
+from event_ids import make_event_id
 
 
 class StirCoveScraper(BaseScraper):
@@ -76,9 +76,9 @@ class StirCoveScraper(BaseScraper):
                 print(f"Error fetching from Ticketmaster API: {e}")
                 break
 
-        return events
+        return validate_events(events)
 
-    def _parse_event(self, tm_event: dict) -> Event | None:
+    def _parse_event(self, tm_event: dict) -> EventRecord | None:
         """Parse a Ticketmaster event into our Event model."""
         try:
             # Title
@@ -142,10 +142,9 @@ class StirCoveScraper(BaseScraper):
                 supporting = [a.get("name") for a in attractions[1:] if a.get("name")]
 
             # Generate ID
-            slug = re.sub(r'[^a-z0-9]+', '-', title.lower()).strip('-')[:40]
-            event_id = f"stircove-{date}-{slug}"[:80]
+            event_id = make_event_id("stircove", date, title, slug_length=40)
 
-            return Event(
+            return EventRecord(
                 id=event_id,
                 title=title,
                 date=date,
@@ -157,7 +156,8 @@ class StirCoveScraper(BaseScraper):
                 price=price,
                 ageRestriction=age_restriction,
                 supportingArtists=supporting,
-                source=self.id
+                source=self.id,
+                category=self.categorize(title),
             )
 
         except Exception as e:
@@ -1,16 +1,17 @@
 # scraper/scrapers/theslowdown.py
 import re
 import sys
-from datetime import datetime
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from scrapers.base import BaseScraper
-from models import Event
+from models import Event, EventRecord, validate_events
+from event_ids import make_event_id
 
 class SlowdownScraper(BaseScraper):
     name = "Slowdown"
     id = "theslowdown"
     url = "https://theslowdown.com/events/"
+    container_selectors = (".seetickets-list-event-container",)
 
     def parse_events(self, html: str) -> list[Event]:
         soup = self.get_soup(html)
@@ -66,10 +67,9 @@ class SlowdownScraper(BaseScraper):
                             supporting_artists = [a.strip() for a in artists_str.split(',') if a.strip()]
 
                 # Generate ID
-                slug = re.sub(r'[^a-z0-9]+', '-', title.lower()).strip('-')
-                event_id = f"theslowdown-{date_str}-{slug}"[:80]
+                event_id = make_event_id("theslowdown", date_str, title)
 
-                events.append(Event(
+                events.append(EventRecord(
                     id=event_id,
                     title=title,
                     date=date_str,
@@ -81,53 +81,13 @@ class SlowdownScraper(BaseScraper):
                     price=price,
                     ageRestriction=age_restriction,
                     supportingArtists=supporting_artists if supporting_artists else None,
-                    source=self.id
+                    source=self.id,
+                    category=self.categorize(title),
                 ))
             except Exception:
                 continue  # Skip malformed events
 
-        return events
-
-    def _parse_date(self, date_text: str) -> str | None:
-        """Convert date text like 'Fri Feb 27' or 'Tue Mar 3' to YYYY-MM-DD format."""
-        try:
-            # Clean up the date text - remove day of week if present
-            # Format is typically "Fri Feb 27" or "Tue Mar 3"
-            parts = date_text.split()
-            if len(parts) >= 3:
-                # Has day of week prefix, e.g., "Fri Feb 27"
-                month_str = parts[1]
-                day_str = parts[2]
-            elif len(parts) == 2:
-                # No day of week, e.g., "Feb 27"
-                month_str = parts[0]
-                day_str = parts[1]
-            else:
-                return None
-
-            # Parse month
-            month_map = {
-                'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
-                'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12
-            }
-            month = month_map.get(month_str)
-            if not month:
-                return None
-
-            day = int(day_str)
-            year = datetime.now().year
-
-            # If the date appears to be in the past, assume next year
-            today = datetime.now()
-            event_date = datetime(year, month, day)
-            if event_date < today - datetime.resolution:
-                # Allow some buffer for events today or recently passed
-                if (today - event_date).days > 30:
-                    year += 1
-
-            return f"{year:04d}-{month:02d}-{day:02d}"
-        except Exception:
-            return None
+        return validate_events(events)
 
     def _format_price(self, price_text: str) -> str | None:
         """Convert price range like '$14.00-$17.00' to 'From $14'."""
@@ -141,26 +101,3 @@ class SlowdownScraper(BaseScraper):
             return f"From ${dollars}"
         except Exception:
             return None
-
-    def _parse_time(self, time_text: str) -> str | None:
-        """Convert time text like '8:00PM' to HH:MM format (24-hour)."""
-        try:
-            # Parse time like "8:00PM" or "7:00PM"
-            time_text = time_text.strip().upper()
-            match = re.match(r'(\d{1,2}):(\d{2})(AM|PM)', time_text)
-            if not match:
-                return None
-
-            hour = int(match.group(1))
-            minute = int(match.group(2))
-            period = match.group(3)
-
-            # Convert to 24-hour format
-            if period == 'PM' and hour != 12:
-                hour += 12
-            elif period == 'AM' and hour == 12:
-                hour = 0
-
-            return f"{hour:02d}:{minute:02d}"
-        except Exception:
-            return None
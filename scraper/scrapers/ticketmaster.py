@@ -4,16 +4,17 @@ Ticketmaster API client - fetches music events from Omaha/Lincoln metro.
 Runs after other scrapers to catch events we might have missed.
 """
 import os
-import re
 import sys
 from datetime import datetime
 from pathlib import Path
 import requests
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
-from models import Event
+from models import Event, EventRecord, validate_events
+from event_ids import make_event_id
 from venue_matcher import VenueMatcher
 from matching import find_existing_event
+from categorize import categorize
 
 
 class TicketmasterClient:
@@ -51,7 +52,7 @@ class TicketmasterClient:
                     if parsed:
                         all_events.append(parsed)
 
-        return all_events
+        return validate_events(all_events)
 
     def _fetch_city_events(self, city: str, state: str) -> list[dict]:
         """Fetch all music events for a city with pagination."""
@@ -99,7 +100,7 @@ class TicketmasterClient:
 
         return events
 
-    def _parse_event(self, tm_event: dict) -> Event | None:
+    def _parse_event(self, tm_event: dict) -> EventRecord | None:
         """Convert Ticketmaster event to our Event model."""
         try:
             # Basic info
@@ -147,21 +148,7 @@ class TicketmasterClient:
             # Check for duplicates
             if matched_venue_id and self.supabase:
                 existing_events = self._get_events_for_venue_date(matched_venue_id, date)
-                temp_event = Event(
-                    id="temp",
-                    title=title,
-                    date=date,
-                    time=time,
-                    venue=venue_name,
-                    eventUrl=None,
-                    ticketUrl=None,
-                    imageUrl=None,
-                    price=None,
-                    ageRestriction=None,
-                    supportingArtists=None,
-                    source=self.id
-                )
-                if find_existing_event(temp_event, existing_events):
+                if find_existing_event((title, date), existing_events):
                     return None  # Duplicate found
 
             # URLs
@@ -216,10 +203,9 @@ class TicketmasterClient:
 
             # Generate ID using Ticketmaster's ID for uniqueness
             tm_id = tm_event.get("id", "")
-            slug = re.sub(r'[^a-z0-9]+', '-', title.lower()).strip('-')[:40]
-            event_id = f"tm-{venue_id}-{date}-{slug}"[:80]
+            event_id = make_event_id(f"tm-{venue_id}", date, title, slug_length=40)
 
-            return Event(
+            return EventRecord(
                 id=event_id,
                 title=title,
                 date=date,
@@ -231,7 +217,8 @@ class TicketmasterClient:
                 price=price,
                 ageRestriction=age_restriction,
                 supportingArtists=supporting,
-                source=venue_id
+                source=venue_id,
+                category=categorize(title, venue_name),
             )
 
         except Exception as e:
@@ -276,6 +263,7 @@ def scrape_ticketmaster(supabase_client=None, venue_matcher=None, api_key=None)
             "supporting_artists": event.supportingArtists,
             "source": "ticketmaster",
             "status": "pending",  # Review before publishing
+            "category": event.category,
         })
 
     return result
@@ -3,20 +3,25 @@
 Generic scraper for venues that embed a TicketWeb widget on their own site.
 Works with .tw-section containers. Handles pagination via ?twpage= parameter.
 """
-import re
 import sys
-from datetime import datetime
 from pathlib import Path
+from typing import Iterator
 import requests
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from scrapers.base import BaseScraper
-from models import Event
+from scrapers.pagination import ParsedPage, host_limiter, iter_pages, next_page_from_links
+from models import Event, EventRecord, validate_events
+from event_ids import EventIds
 
 
 class TicketWebScraper(BaseScraper):
     """Scraper for venue sites with embedded TicketWeb widgets."""
 
+    # Event sections plus the pagination links scrape() follows
+    container_selectors = (".tw-section", "a[href*=twpage]")
+    time_format = "24h"  # Widget sometimes shows "20:00" with no am/pm
+
     def __init__(self, venue_name: str, venue_id: str, events_url: str):
         self.name = venue_name
         self.id = venue_id
@@ -30,49 +35,53 @@ class TicketWebScraper(BaseScraper):
         return response.text
 
     def scrape(self) -> list[Event]:
-        all_events = []
-        seen_ids = set()
-        page = 0
-
-        while True:
-            url = self.url if page == 0 else f"{self.url}?twpage={page}"
-            try:
-                response = requests.get(url, headers={
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-                }, timeout=self.timeout)
-                response.raise_for_status()
-            except Exception:
-                break
-
-            events = self.parse_events(response.text)
-            if not events:
-                break
-
-            for e in events:
-                if e.id not in seen_ids:
-                    seen_ids.add(e.id)
-                    all_events.append(e)
-
-            # Check for next page
-            soup = self.get_soup(response.text)
-            next_links = soup.select('a[href*="twpage"]')
-            next_page = None
-            for link in next_links:
-                if 'Next' in link.get_text():
-                    match = re.search(r'twpage=(\d+)', link.get('href', ''))
-                    if match:
-                        next_page = int(match.group(1))
-            if next_page is not None and next_page > page:
-                page = next_page
-            else:
-                break
-
-        return all_events
+        return list(self.iter_events())
+
+    def iter_events(self) -> Iterator[Event]:
+        """Yield each widget page's events as soon as that page is parsed."""
+        event_ids = EventIds()
+        pages = iter_pages(
+            self._fetch_page,
+            first_page=0,
+            workers=self.page_workers,
+            limiter=host_limiter(self.url, self.page_interval),
+            parse=self.parse_page,
+        )
+        for page in pages:
+            # Pages are parsed separately, so the same show can appear on two of them
+            records = []
+            for e in page.items:
+                event_id = event_ids.claim(e.id, e.title)
+                if event_id is not None:
+                    e.id = event_id
+                    records.append(e)
+            yield from validate_events(records)
+
+    def _fetch_page(self, page: int) -> str | None:
+        url = self.url if page == 0 else f"{self.url}?twpage={page}"
+        try:
+            response = requests.get(url, headers={
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+            }, timeout=self.timeout)
+            response.raise_for_status()
+        except Exception:
+            return None
+        return response.text
 
     def parse_events(self, html: str) -> list[Event]:
+        return validate_events(self.parse_page(html).items)
+
+    def parse_page(self, html: str) -> ParsedPage:
+        """Parse one widget page: its event records and the ?twpage= of the Next link."""
         soup = self.get_soup(html)
+        return ParsedPage(
+            items=self._records_from_soup(soup),
+            next_page=next_page_from_links(soup, 'a[href*="twpage"]', "twpage"),
+        )
+
+    def _records_from_soup(self, soup) -> list[EventRecord]:
         events = []
-        seen_ids = set()
+        event_ids = EventIds()
 
         containers = soup.select('.tw-section')
 
@@ -120,14 +129,11 @@ class TicketWebScraper(BaseScraper):
                 age = age_el.get_text(strip=True) if age_el else None
 
                 # Generate ID
-                slug = re.sub(r'[^a-z0-9]+', '-', title.lower()).strip('-')
-                event_id = f"{self.id}-{date_str}-{slug}"[:80]
-
-                if event_id in seen_ids:
+                event_id = event_ids.allocate(self.id, date_str, title)
+                if event_id is None:
                     continue
-                seen_ids.add(event_id)
 
-                events.append(Event(
+                events.append(EventRecord(
                     id=event_id,
                     title=title,
                     date=date_str,
@@ -139,47 +145,9 @@ class TicketWebScraper(BaseScraper):
                     price=price,
                     ageRestriction=age,
                     source=self.id,
+                    category=self.categorize(title),
                 ))
             except Exception:
                 continue
 
         return events
-
-    def _parse_date(self, date_text: str) -> str | None:
-        try:
-            date_text = date_text.strip()
-            for fmt in ("%B %d, %Y", "%b %d, %Y"):
-                try:
-                    return datetime.strptime(date_text, fmt).strftime("%Y-%m-%d")
-                except ValueError:
-                    continue
-            return None
-        except Exception:
-            return None
-
-    def _parse_time(self, time_text: str) -> str | None:
-        if not time_text:
-            return None
-        try:
-            time_text = time_text.strip().lstrip('-').strip()
-            match = re.match(r'(\d{1,2}):(\d{2})\s*(am|pm)?', time_text, re.I)
-            if not match:
-                match = re.match(r'(\d{1,2})\s*(AM|PM)', time_text, re.I)
-                if not match:
-                    return None
-                hour, minute = int(match.group(1)), 0
-                period = match.group(2).upper()
-            else:
-                hour = int(match.group(1))
-                minute = int(match.group(2))
-                period = (match.group(3) or '').upper()
-
-            if hour <= 12 and period:
-                if period == 'PM' and hour != 12:
-                    hour += 12
-                elif period == 'AM' and hour == 12:
-                    hour = 0
-
-            return f"{hour:02d}:{minute:02d}"
-        except Exception:
-            return None
@@ -0,0 +1,106 @@
+# scraper/search_index.py
+"""
+Prebuilt search indexes: search.json for upcoming events, search/<year>.json for history.
+
+Each index is {"version", "docs", "tokens"}. docs rows are
+[date, title, venue, id] for events and [date, title, venue] for shows.
+tokens maps each matching.normalize_text token of the title and
+supportingArtists to ascending doc ordinals, with keys in sorted order.
+search.json also lists "historyYears", the year files available.
+"""
+import json
+from bisect import bisect_left
+from collections import defaultdict
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from artifacts import write_if_changed
+from history_store import HistoryStore
+from matching import normalize_text
+from models import Event, HistoricalShow
+
+INDEX_VERSION = 1
+INDEX_FILE = "search.json"
+HISTORY_INDEX_DIR = "search"
+
+
+def tokenize(text: str) -> list[str]:
+    """Search tokens for a piece of text, as the client must compute them."""
+    return normalize_text(text).split()
+
+
+def _doc_tokens(title: str, supporting_artists: list[str] | None) -> set[str]:
+    tokens = set(tokenize(title))
+    for artist in supporting_artists or []:
+        tokens.update(tokenize(artist))
+    return tokens
+
+
+def build_index(events: Iterable[Event], shows: Iterable[HistoricalShow]) -> dict:
+    docs: list[list[str]] = []
+    postings: dict[str, list[int]] = defaultdict(list)
+    for event in events:
+        for token in _doc_tokens(event.title, event.supportingArtists):
+            postings[token].append(len(docs))
+        docs.append([event.date, event.title, event.venue, event.id])
+    for show in shows:
+        for token in _doc_tokens(show.title, show.supportingArtists):
+            postings[token].append(len(docs))
+        docs.append([show.date, show.title, show.venue])
+    return {
+        "version": INDEX_VERSION,
+        "docs": docs,
+        "tokens": {token: postings[token] for token in sorted(postings)},
+    }
+
+
+class SearchIndex:
+    """Lookups over a loaded index, mirroring what the client does."""
+
+    def __init__(self, data: dict):
+        self.docs: list[list[str]] = data["docs"]
+        self._tokens: dict[str, list[int]] = data["tokens"]
+        self._keys = sorted(self._tokens)
+
+    def prefixed(self, prefix: str) -> set[int]:
+        """Ordinals of docs with a token starting with prefix (a range scan of the sorted keys)."""
+        ordinals: set[int] = set()
+        for key in self._keys[bisect_left(self._keys, prefix):]:
+            if not key.startswith(prefix):
+                break
+            ordinals.update(self._tokens[key])
+        return ordinals
+
+    def search(self, query: str) -> list[int]:
+        """Ordinals of docs containing every query token (the last one as a prefix)."""
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+        *whole, prefix = tokens
+        matches = self.prefixed(prefix)
+        for token in whole:
+            matches &= set(self._tokens.get(token, ()))
+        return sorted(matches)
+
+
+def _dump(index: dict) -> bytes:
+    return json.dumps(index, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def write_search_index(events: Iterable[Event], store: HistoryStore, out_dir: Path) -> list[Path]:
+    """Write search.json, plus search/<year>.json for years archival touched; returns the files written.
+
+    Only the upcoming events are re-tokenized every run. History years
+    are rebuilt through HistoryStore.refresh_yearly.
+    """
+    path = out_dir / INDEX_FILE
+    index = build_index(events, [])
+    index["historyYears"] = store.years
+    written = [path] if write_if_changed(path, _dump(index)) else []
+
+    def render(year: str, shows: Iterator[HistoricalShow]) -> bytes:
+        return _dump(build_index([], shows))
+
+    years_dir = out_dir / HISTORY_INDEX_DIR
+    written += [years_dir / f"{year}.json" for year in store.refresh_yearly(years_dir, render)]
+    return written
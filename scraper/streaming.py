@@ -0,0 +1,48 @@
+# scraper/streaming.py
+"""
+Helpers for consuming scraper output as a stream.
+
+Scrapers expose iter_events(), which yields validated Events as they
+become available (per listing page, or per batch of detail pages) rather
+than once the whole source is done. The runners read that stream through
+EventStream and hand it on in batches. Database writes therefore start
+while a slow paginated source is still fetching, and only one batch of
+pending work is held at a time.
+"""
+from itertools import islice
+from typing import Callable, Iterable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+
+def batched(items: Iterable[T], size: int) -> Iterator[list[T]]:
+    """Split an iterable into lists of up to `size` items (itertools.batched before 3.12)."""
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+class EventStream:
+    """
+    One pass over a scraper's iter_events(), counting what it yields.
+
+    A scraper failure ends the stream instead of propagating, and is kept
+    in `error`. Any exception raised while the stream is being consumed
+    therefore comes from the consumer (e.g. a failed upsert), not the
+    scraper. Events yielded before the failure have already been handed on.
+    """
+
+    def __init__(self, scraper, keep: Callable | None = None):
+        self.scraper = scraper
+        self.keep = keep  # Optional filter, e.g. future events only
+        self.count = 0
+        self.error: str | None = None
+
+    def __iter__(self):
+        try:
+            for event in self.scraper.iter_events():
+                if self.keep is None or self.keep(event):
+                    self.count += 1
+                    yield event
+        except Exception as e:
+            self.error = str(e)
@@ -0,0 +1,44 @@
+# scraper/tests/test_artifacts.py
+import pytest
+import stat
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import artifacts
+from artifacts import write_atomic, write_if_changed
+
+
+def test_write_atomic_replaces_and_keeps_mode(tmp_path):
+    path = tmp_path / "out" / "events.json"
+    write_atomic(path, b"one")
+    assert stat.S_IMODE(path.stat().st_mode) == 0o644
+    path.chmod(0o664)
+    write_atomic(path, b"two")
+    assert path.read_bytes() == b"two"
+    assert stat.S_IMODE(path.stat().st_mode) == 0o664
+    assert [p.name for p in path.parent.iterdir()] == ["events.json"]
+
+
+def test_failed_write_leaves_old_file(tmp_path, monkeypatch):
+    path = tmp_path / "events.json"
+    path.write_bytes(b"old")
+
+    def broken_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(artifacts.os, "replace", broken_replace)
+    with pytest.raises(OSError):
+        write_atomic(path, b"new")
+    assert path.read_bytes() == b"old"
+    assert [p.name for p in tmp_path.iterdir()] == ["events.json"]
+
+
+def test_write_if_changed(tmp_path):
+    path = tmp_path / "shard.json"
+    assert write_if_changed(path, b"{}")
+    mtime = path.stat().st_mtime_ns
+    assert not write_if_changed(path, b"{}")
+    assert path.stat().st_mtime_ns == mtime
+    assert write_if_changed(path, b"[]")
@@ -0,0 +1,116 @@
+# scraper/tests/test_artist_index.py
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from artist_index import ArtistIndex, artist_key, headliner
+from models import Event, HistoricalShow, ScraperOutput, ShowHistory
+
+
+def make_event(id, title, date="2026-03-10", venue="Reverb Lounge", supporting=None):
+    return Event(id=id, title=title, date=date, venue=venue, source="reverblounge", supportingArtists=supporting)
+
+
+def test_artist_key_normalizes():
+    assert artist_key("Leila's Rose") == artist_key("LEILAS  ROSE")
+
+
+def test_headliner_strips_tour_and_support():
+    assert headliner("All Them Witches - World Tour") == "All Them Witches"
+    assert headliner("Gannon Fremin with Special Guests") == "Gannon Fremin"
+    assert headliner("Can't Feel My Face: 2010s Dance Party") == "Can't Feel My Face"
+    assert headliner("Scattered Hamlet") == "Scattered Hamlet"
+
+
+def test_headliner_keeps_with_inside_names():
+    assert headliner("An Evening with Bonnie Raitt") == "Bonnie Raitt"
+    assert headliner("An Evening With Lyle Lovett - Acoustic Tour") == "Lyle Lovett"
+    assert headliner("Dancing with the Stars Live") == "Dancing with the Stars Live"
+    assert headliner("Band w/ Opener") == "Band"
+
+
+def test_evening_with_indexes_the_artist():
+    index = ArtistIndex.build(
+        [make_event("e1", "An Evening with Bonnie Raitt"), make_event("e2", "Dancing with the Stars Live")],
+        [HistoricalShow(date="2025-01-01", title="An Evening with Lyle Lovett", venue="Holland Center")],
+    )
+    assert index.events_for("Bonnie Raitt") == {"e1"}
+    assert index.events_for("An Evening") == set()
+    assert index.events_for("Dancing with the Stars Live") == {"e2"}
+    assert index.events_for("dancing") == set()
+    assert index.has_played("Lyle Lovett", "Holland Center")
+    assert len(index.shows_for("Lyle Lovett")) == 1
+
+
+def test_indexes_headliner_and_supporting_artists():
+    index = ArtistIndex.build([make_event("e1", "Scattered Hamlet", supporting=["Mother Road"])], [])
+    assert index.events_for("scattered hamlet") == {"e1"}
+    assert index.events_for("Mother Road") == {"e1"}
+    assert "Mother Road" in index
+
+
+def test_other_dates_for_act():
+    index = ArtistIndex.build([
+        make_event("e1", "Scattered Hamlet", date="2026-03-10"),
+        make_event("e2", "Scattered Hamlet - Night Two", date="2026-03-11"),
+        make_event("e3", "Someone Else"),
+    ], [])
+    assert index.events_for("Scattered Hamlet") == {"e1", "e2"}
+
+
+def test_add_event_replaces_previous_entry():
+    index = ArtistIndex()
+    index.add_event(make_event("e1", "Old Name"))
+    index.add_event(make_event("e1", "New Name"))
+    assert index.events_for("Old Name") == set()
+    assert index.events_for("New Name") == {"e1"}
+    assert "Old Name" not in index
+
+
+def test_remove_event():
+    index = ArtistIndex.build([make_event("e1", "Band")], [])
+    index.remove_event("e1")
+    assert index.events_for("Band") == set()
+    assert len(index) == 0
+
+
+def test_has_played_with_venue():
+    shows = [HistoricalShow(date="2025-01-01", title="Band", venue="Slowdown", supportingArtists=["Opener"])]
+    index = ArtistIndex.build([], shows)
+    assert index.has_played("Band")
+    assert index.has_played("Band", "Slowdown")
+    assert not index.has_played("Band", "Admiral")
+    assert index.has_played("Opener", "Slowdown")
+    assert not index.has_played("Unknown")
+
+
+def test_add_show_dedupes():
+    index = ArtistIndex()
+    show = HistoricalShow(date="2025-01-01", title="Band", venue="Slowdown")
+    assert index.add_show(show) is True
+    assert index.add_show(show) is False
+    assert len(index.shows_for("Band")) == 1
+
+
+def test_archive_event_moves_to_history():
+    index = ArtistIndex.build([make_event("e1", "Band")], [])
+    index.archive_event(make_event("e1", "Band"))
+    assert index.events_for("Band") == set()
+    assert index.has_played("Band", "Reverb Lounge")
+
+
+def test_from_files(tmp_path):
+    events_path = tmp_path / "events.json"
+    history_path = tmp_path / "history.json"
+    events_path.write_text(ScraperOutput(events=[make_event("e1", "Band")], lastUpdated="", sources=[]).model_dump_json())
+    history_path.write_text(ShowHistory(shows=[HistoricalShow(date="2025-01-01", title="Band", venue="Slowdown")], lastUpdated="").model_dump_json())
+    index = ArtistIndex.from_files(events_path, history_path)
+    assert index.events_for("Band") == {"e1"}
+    assert index.has_played("Band", "Slowdown")
+
+
+def test_from_files_missing(tmp_path):
+    index = ArtistIndex.from_files(tmp_path / "nope.json", tmp_path / "nope2.json")
+    assert len(index) == 0
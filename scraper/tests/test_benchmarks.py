@@ -0,0 +1,54 @@
+# scraper/tests/test_benchmarks.py
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.harness import measure, percentile
+from benchmarks.workloads import StaticVenueSource, build_matching_workload, misspell
+from matching import find_existing_event
+from venue_matcher import VenueMatcher
+
+
+def test_percentile_nearest_rank():
+    samples = [float(i) for i in range(1, 101)]
+    assert percentile(samples, 50) == 50.0
+    assert percentile(samples, 99) == 99.0
+    assert percentile([], 50) == 0.0
+
+
+def test_measure_counts_every_call():
+    result = measure("noop", lambda x: x, [(1,), (2,), (3,)], repeat=2)
+    assert result.calls == 6
+    assert result.p50_us <= result.p99_us <= result.max_us
+
+
+def test_workload_is_deterministic():
+    a = build_matching_workload(n_events=50, seed=7)
+    b = build_matching_workload(n_events=50, seed=7)
+    assert [e.title for e in a.events] == [e.title for e in b.events]
+    assert a.venue_names == b.venue_names
+
+
+def test_workload_has_candidates_per_slot():
+    workload = build_matching_workload(n_events=100, candidates_per_slot=4)
+    assert all(len(rows) == 4 for rows in workload.candidates.values())
+    assert all(workload.candidates_for(e) for e in workload.events)
+
+
+def test_workload_contains_matches_and_misses():
+    workload = build_matching_workload(n_events=300, match_rate=0.5)
+    matched = sum(1 for e in workload.events if find_existing_event(e, workload.candidates_for(e)))
+    assert 0 < matched < len(workload.events)
+
+
+def test_misspell_changes_name():
+    import random
+    assert misspell(random.Random(1), "Reverb Lounge") != "Reverb Lounge"
+
+
+def test_static_venue_source_feeds_matcher():
+    workload = build_matching_workload(n_events=10)
+    matcher = VenueMatcher(StaticVenueSource(workload.venues))
+    assert matcher.match("Reverb Lounge") == ("reverblounge", "name")
@@ -0,0 +1,52 @@
+# scraper/tests/test_categorize.py
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from categorize import categorize
+
+
+def test_defaults_to_music():
+    assert categorize("All Them Witches") == "music"
+
+
+def test_custom_default():
+    assert categorize("Nate Bargatze", default="comedy") == "comedy"
+
+
+def test_sports_keywords():
+    assert categorize("Omaha Beef vs. Sioux City Bandits") == "sports"
+    assert categorize("Creighton Bluejays Basketball") == "sports"
+    assert categorize("WWE Monday Night Raw") == "sports"
+
+
+def test_theater_and_comedy():
+    assert categorize("Omaha Symphony: Beethoven 9") == "theater"
+    assert categorize("Disney On Ice") == "theater"
+    assert categorize("Stand-Up Comedy Night") == "comedy"
+
+
+def test_sports_beats_other_matches():
+    assert categorize("Comedy vs. Wrestling") == "sports"
+
+
+def test_theater_beats_comedy():
+    assert categorize("Comedy Musical Revue") == "theater"
+
+
+def test_word_boundaries():
+    assert categorize("Captain Beefheart Tribute") == "music"
+    assert categorize("Canvas Operation") == "music"
+    assert categorize("Chicago", venue_name="Chicago Music Hall") == "music"
+
+
+def test_sports_venue():
+    assert categorize("Some Headliner", venue_name="CHI Health Center Omaha") == "sports"
+    assert categorize("Some Headliner", venue_name="Slowdown") == "music"
+
+
+def test_handles_empty():
+    assert categorize("") == "music"
+    assert categorize(None, None) == "music"
@@ -0,0 +1,90 @@
+# scraper/tests/test_dates.py
+import pytest
+import sys
+from datetime import date
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dates import infer_year, parse_date, parse_time
+
+TODAY = date(2026, 10, 19)
+
+
+@pytest.mark.parametrize("text,expected", [
+    ("Fri Feb 27", "2027-02-27"),
+    ("Thu, Feb 26", "2027-02-26"),
+    ("Sat, Nov 07", "2026-11-07"),
+    ("Nov 7", "2026-11-07"),
+    ("Wednesday, September 30", "2026-09-30"),  # 19 days ago: still this year
+    ("Sept 3", "2027-09-03"),
+    ("Feb. 27, 2026", "2026-02-27"),
+    ("March 7, 2026", "2026-03-07"),
+    ("March 5 2026", "2026-03-05"),
+    ("Mar 06 @ 8:00 pm", "2027-03-06"),
+    ("Feb 26, 2026 @ 7:00 PM", "2026-02-26"),
+])
+def test_text_dates(text, expected):
+    assert parse_date(text, today=TODAY) == expected
+
+
+@pytest.mark.parametrize("text", ["", None, "TBA", "Smarch 3", "Feb 30, 2026", "3/5/2026"])
+def test_unparseable_text_dates(text):
+    assert parse_date(text, today=TODAY) is None
+
+
+def test_numeric_and_any_hints():
+    assert parse_date("3/5/2026", "numeric") == "2026-03-05"
+    assert parse_date("3/5/26", "any") == "2026-03-05"
+    assert parse_date("March 5, 2026", "any") == "2026-03-05"
+    assert parse_date("March 5, 2026", "numeric") is None
+
+
+def test_unknown_hint_rejected():
+    with pytest.raises(ValueError):
+        parse_date("Feb 27", "iso")
+    with pytest.raises(ValueError):
+        parse_time("8 pm", "military")
+
+
+def test_infer_year_rolls_over_after_thirty_days():
+    assert infer_year(9, 19, TODAY) == 2026
+    assert infer_year(9, 18, TODAY) == 2027
+    assert infer_year(12, 31, TODAY) == 2026
+
+
+def test_year_inference_follows_today():
+    assert parse_date("Jan 10", today=date(2026, 1, 5)) == "2026-01-10"
+    assert parse_date("Jan 10", today=date(2026, 12, 5)) == "2027-01-10"
+
+
+@pytest.mark.parametrize("text,expected", [
+    ("8:00PM", "20:00"),
+    ("7:00 PM", "19:00"),
+    ("7 pm", "19:00"),
+    ("6 p.m.", "18:00"),
+    ("8:30 p.m. $10 PWYC", "20:30"),
+    ("12:00 am", "00:00"),
+    ("12 pm", "12:00"),
+    ("19:00 pm", "19:00"),
+    ("- 8 PM", "20:00"),
+    ("Doors: 6 pm // Show: 6:30 pm", "18:30"),
+    ("Doors: 7 pm", "19:00"),
+    ("Mar 06 @ 8:00 pm", "20:00"),
+    ("Multiple Times", None),
+    ("20:00", None),
+])
+def test_12h_times(text, expected):
+    assert parse_time(text) == expected
+
+
+def test_24h_hint_accepts_bare_clock():
+    assert parse_time("20:00", "24h") == "20:00"
+    assert parse_time("7:00 PM", "24h") == "19:00"
+    assert parse_time("25:00", "24h") is None
+
+
+def test_labeled_hint_ignores_unlabeled_times():
+    card = "Sat Mar 7 8 pm tickets on sale - Doors: 7 pm"
+    assert parse_time(card, "labeled") == "19:00"
+    assert parse_time("Sale ends 5 pm", "labeled") is None
@@ -0,0 +1,68 @@
+# scraper/tests/test_event_ids.py
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from event_ids import MAX_ID_LENGTH, EventIds, make_event_id, slugify
+
+LONG_A = "An Evening With The Extremely Long Band Name Orchestra And Friends: Part One"
+LONG_B = "An Evening With The Extremely Long Band Name Orchestra And Friends: Part Two"
+
+
+def test_slugify_matches_legacy_format():
+    assert slugify("The Mountain Goats (Solo!)") == "the-mountain-goats-solo"
+    assert slugify("  --Hello,   World--  ") == "hello-world"
+    assert slugify("Beyoncé") == "beyonc"
+
+
+def test_slug_length_cut_keeps_trailing_hyphen():
+    # Ticketmaster and Stir Cove cut after stripping; existing IDs depend on it
+    assert slugify("abcd efgh", 5) == "abcd-"
+
+
+def test_make_event_id_truncates_to_80():
+    event_id = make_event_id("theslowdown", "2026-03-07", LONG_A)
+    assert len(event_id) == MAX_ID_LENGTH
+    assert event_id.startswith("theslowdown-2026-03-07-an-evening-with")
+    assert make_event_id("tm-holland", "2026-03-07", LONG_A, slug_length=40) == \
+        "tm-holland-2026-03-07-" + slugify(LONG_A)[:40]
+
+
+def test_claim_skips_true_duplicates():
+    ids = EventIds()
+    assert ids.allocate("admiral", "2026-03-07", "Band") == "admiral-2026-03-07-band"
+    assert ids.allocate("admiral", "2026-03-07", "Band") is None
+    assert ids.allocate("admiral", "2026-03-08", "Band") == "admiral-2026-03-08-band"
+    assert len(ids) == 2
+
+
+def test_truncation_collision_keeps_both_events(caplog):
+    ids = EventIds()
+    first = ids.allocate("theslowdown", "2026-03-07", LONG_A)
+    second = ids.allocate("theslowdown", "2026-03-07", LONG_B)
+    assert first == make_event_id("theslowdown", "2026-03-07", LONG_A)
+    assert second != first
+    assert len(second) == MAX_ID_LENGTH
+    assert ids.collisions == [(first, LONG_A, LONG_B)]
+    assert "collision" in caplog.text
+
+    # Stable across runs, and a repeat of the renamed event is still a duplicate
+    assert EventIds().claim(first, LONG_A) == first
+    again = EventIds()
+    again.claim(first, LONG_A)
+    assert again.claim(first, LONG_B) == second
+    assert ids.allocate("theslowdown", "2026-03-07", LONG_B) is None
+
+
+def test_case_and_punctuation_variants_are_duplicates():
+    ids = EventIds()
+    assert ids.allocate("bourbontheatre", "2026-03-01", "The Band") == "bourbontheatre-2026-03-01-the-band"
+    assert ids.allocate("bourbontheatre", "2026-03-01", "THE BAND") is None
+    assert ids.allocate("bourbontheatre", "2026-03-01", "The Band!") is None
+    assert ids.collisions == []
+
+    ids.allocate("theslowdown", "2026-03-07", LONG_A)
+    renamed = ids.allocate("theslowdown", "2026-03-07", LONG_B)
+    assert ids.allocate("theslowdown", "2026-03-07", LONG_B.upper()) is None
+    assert len(ids.collisions) == 1 and renamed in ids
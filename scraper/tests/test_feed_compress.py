@@ -0,0 +1,57 @@
+# scraper/tests/test_feed_compress.py
+import gzip
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import feed_compress
+from feed_compress import precompress
+
+FEED = b'{"events":[' + b'{"title":"Band","venue":"Slowdown"},' * 50 + b'{}]}'
+
+
+def test_gzip_sibling_round_trips(tmp_path):
+    path = tmp_path / "events.json"
+    path.write_bytes(FEED)
+    written = precompress(path)
+    gz = tmp_path / "events.json.gz"
+    assert gz in written
+    assert gzip.decompress(gz.read_bytes()) == FEED
+    assert len(gz.read_bytes()) < len(FEED) // 5
+
+
+def test_unchanged_content_is_not_rewritten(tmp_path, monkeypatch):
+    monkeypatch.setattr(feed_compress, "brotli_available", lambda: False)
+    path = tmp_path / "events.json"
+    path.write_bytes(FEED)
+    precompress(path)
+    assert precompress(path) == []
+    path.write_bytes(FEED.replace(b"Band", b"Bend"))
+    assert precompress(path) == [tmp_path / "events.json.gz"]
+
+
+def test_corrupt_sibling_is_replaced(tmp_path):
+    path = tmp_path / "events.json"
+    path.write_bytes(FEED)
+    (tmp_path / "events.json.gz").write_bytes(b"not gzip")
+    precompress(path)
+    assert gzip.decompress((tmp_path / "events.json.gz").read_bytes()) == FEED
+
+
+def test_stale_brotli_removed_without_brotli(tmp_path, monkeypatch):
+    monkeypatch.setattr(feed_compress, "brotli_available", lambda: False)
+    path = tmp_path / "events.json"
+    path.write_bytes(FEED)
+    (tmp_path / "events.json.br").write_bytes(b"old")
+    precompress(path)
+    assert not (tmp_path / "events.json.br").exists()
+
+
+def test_brotli_sibling(tmp_path):
+    brotli = pytest.importorskip("brotli")
+    path = tmp_path / "events.json"
+    path.write_bytes(FEED)
+    precompress(path, raw=FEED)
+    assert brotli.decompress((tmp_path / "events.json.br").read_bytes()) == FEED
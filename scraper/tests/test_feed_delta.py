@@ -0,0 +1,62 @@
+# scraper/tests/test_feed_delta.py
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import feed_delta
+from feed_delta import diff_events, write_delta
+from models import Event, ScraperOutput
+
+
+def event(id_: str, date: str = "2026-03-05", **fields) -> Event:
+    return Event(id=id_, title=id_, date=date, venue="Slowdown", source="theslowdown", **fields)
+
+
+def output(events: list[Event], run: str) -> ScraperOutput:
+    return ScraperOutput(events=events, lastUpdated=run, sources=[])
+
+
+def test_diff_reports_only_changed_fields():
+    before = [event("a", price="$15"), event("b"), event("gone", date="2026-02-01")]
+    after = [event("a", price="$20"), event("b", time="20:00"), event("new")]
+    delta = diff_events(before, after)
+    assert [e["id"] for e in delta["added"]] == ["new"]
+    assert delta["updated"] == [
+        {"id": "a", "changes": {"price": "$20"}},
+        {"id": "b", "changes": {"time": "20:00"}},
+    ]
+    assert delta["archived"] == ["gone"]
+
+
+def test_dropped_field_is_null():
+    delta = diff_events([event("a", price="$15")], [event("a")])
+    assert delta["updated"] == [{"id": "a", "changes": {"price": None}}]
+
+
+def test_deltas_chain_by_sequence(tmp_path):
+    first = write_delta([], output([event("a")], "t1"), tmp_path)
+    second = write_delta([event("a")], output([event("a"), event("b")], "t2"), tmp_path)
+    assert (first["seq"], first["previous"]) == (1, 0)
+    assert (second["seq"], second["previous"], second["since"]) == (2, 1, "t1")
+
+    index = json.loads((tmp_path / "deltas" / "index.json").read_text())
+    assert (index["latest"], index["oldest"], index["lastUpdated"]) == (2, 1, "t2")
+    assert json.loads((tmp_path / "deltas" / "2.json").read_text()) == second
+
+
+def test_unchanged_run_writes_nothing(tmp_path):
+    write_delta([], output([event("a")], "t1"), tmp_path)
+    assert write_delta([event("a")], output([event("a")], "t2"), tmp_path) is None
+    assert json.loads((tmp_path / "deltas" / "index.json").read_text())["latest"] == 1
+
+
+def test_old_deltas_pruned(tmp_path, monkeypatch):
+    monkeypatch.setattr(feed_delta, "KEEP_DELTAS", 2)
+    events = []
+    for n in range(4):
+        previous, events = events, events + [event(f"e{n}")]
+        write_delta(previous, output(events, f"t{n}"), tmp_path)
+    assert sorted(p.name for p in (tmp_path / "deltas").iterdir()) == ["3.json", "4.json", "index.json"]
+    assert json.loads((tmp_path / "deltas" / "index.json").read_text())["oldest"] == 3
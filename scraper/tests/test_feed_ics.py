@@ -0,0 +1,78 @@
+# scraper/tests/test_feed_ics.py
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import feed_ics
+from feed_ics import fold, render_calendar, write_calendars
+from models import Event, SourceStatus
+
+
+def event(id_: str, source: str, **fields) -> Event:
+    defaults = dict(title=id_, date="2026-03-07", venue=source.title(), addedAt="2026-02-01T12:00:00+00:00")
+    return Event(id=id_, source=source, **{**defaults, **fields})
+
+
+SOURCES = [SourceStatus(name="The Slowdown", id="theslowdown", url="https://theslowdown.com", status="ok",
+                        lastScraped="2026-03-01T00:00:00+00:00", eventCount=1)]
+EVENTS = [
+    event("band", "theslowdown", time="20:00", title="Band, Live; Again", supportingArtists=["Opener"], price="$15"),
+    event("matinee", "holland"),
+]
+
+
+def lines(raw: bytes) -> list[str]:
+    return raw.decode("utf-8").split("\r\n")
+
+
+def test_timed_and_all_day_events():
+    out = lines(render_calendar("Test", EVENTS))
+    assert out[0] == "BEGIN:VCALENDAR" and out[-2:] == ["END:VCALENDAR", ""]
+    assert "DTSTART;TZID=America/Chicago:20260307T200000" in out
+    assert "DTEND;TZID=America/Chicago:20260307T230000" in out
+    assert "DTSTART;VALUE=DATE:20260307" in out and "DTEND;VALUE=DATE:20260308" in out
+    assert "SUMMARY:Band\\, Live\\; Again" in out
+    assert "DESCRIPTION:With Opener\\n$15" in out
+    assert "UID:band@omahashows.com" in out
+    assert "DTSTAMP:20260201T120000Z" in out
+
+
+def test_fold_keeps_utf8_sequences_whole():
+    line = "SUMMARY:" + "é" * 60
+    folded = fold(line)
+    assert all(len(part.encode("utf-8")) <= 75 for part in folded.split("\r\n"))
+    assert folded.replace("\r\n ", "") == line
+
+
+def test_only_changed_venues_rerendered(tmp_path):
+    assert write_calendars(EVENTS, SOURCES, tmp_path) == ["all", "holland", "theslowdown"]
+    cal = tmp_path / "calendar"
+    assert "X-WR-CALNAME:The Slowdown - Omaha Shows" in lines((cal / "theslowdown.ics").read_bytes())
+    assert write_calendars(EVENTS, SOURCES, tmp_path) == []
+
+    changed = [EVENTS[0], event("matinee", "holland", time="14:00")]
+    assert write_calendars(changed, SOURCES, tmp_path) == ["all", "holland"]
+
+
+def test_venue_without_events_keeps_empty_feed(tmp_path):
+    write_calendars(EVENTS, SOURCES, tmp_path)
+    assert write_calendars(EVENTS[:1], SOURCES, tmp_path) == ["all", "holland"]
+    holland = lines((tmp_path / "calendar" / "holland.ics").read_bytes())
+    assert "BEGIN:VEVENT" not in holland and holland[-2] == "END:VCALENDAR"
+    assert write_calendars(EVENTS[:1], SOURCES, tmp_path) == []
+
+
+def test_format_version_rerenders_everything(tmp_path, monkeypatch):
+    write_calendars(EVENTS, SOURCES, tmp_path)
+    monkeypatch.setattr(feed_ics, "FORMAT_VERSION", feed_ics.FORMAT_VERSION + 1)
+    assert write_calendars(EVENTS, SOURCES, tmp_path) == ["all", "holland", "theslowdown"]
+
+
+def test_source_named_all_does_not_replace_all_feed(tmp_path):
+    clash = [EVENTS[0], event("odd", "all")]
+    write_calendars(clash, SOURCES, tmp_path)
+    cal = tmp_path / "calendar"
+    assert "UID:band@omahashows.com" in lines((cal / "all.ics").read_bytes())
+    assert "UID:odd@omahashows.com" in lines((cal / "all-source.ics").read_bytes())
+    assert "UID:band@omahashows.com" not in lines((cal / "all-source.ics").read_bytes())
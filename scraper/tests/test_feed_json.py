@@ -0,0 +1,97 @@
+# scraper/tests/test_feed_json.py
+import json
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from feed_json import SHORT_KEYS, dump_feed, load_feed, parse_feed, resolve_format, write_feed
+from models import Event, HistoricalShow, ScraperOutput, ShowHistory, SourceStatus
+
+OUTPUT = ScraperOutput(
+    events=[
+        Event(id="theslowdown-2026-03-07-band", title="Band", date="2026-03-07", time="20:00",
+              venue="Slowdown", price="$15", source="theslowdown", category="music"),
+        Event(id="other-2026-03-08-café-show", title="Café Show", date="2026-03-08", venue="Café",
+              supportingArtists=["Opener"], source="other"),
+    ],
+    lastUpdated="2026-03-01T00:00:00+00:00",
+    sources=[SourceStatus(name="Slowdown", id="theslowdown", url="https://theslowdown.com/events/",
+                          status="ok", lastScraped="2026-03-01T00:00:00+00:00", eventCount=1)],
+)
+
+
+@pytest.mark.parametrize("format", ["compact", "pretty", "short"])
+def test_round_trip(format):
+    assert parse_feed(dump_feed(OUTPUT, format), ScraperOutput) == OUTPUT
+
+
+def test_compact_has_no_whitespace_or_nulls():
+    raw = dump_feed(OUTPUT, "compact")
+    assert b"null" not in raw
+    assert b"\n" not in raw and b": " not in raw
+    assert len(raw) < len(dump_feed(OUTPUT, "pretty"))
+    assert json.loads(raw)["events"][0]["title"] == "Band"
+
+
+def test_pretty_matches_previous_output():
+    assert dump_feed(OUTPUT, "pretty") == OUTPUT.model_dump_json(indent=2).encode()
+
+
+def test_short_keys_carry_their_own_map():
+    data = json.loads(dump_feed(OUTPUT, "short"))
+    assert data["events"][1] == {"i": "other-2026-03-08-café-show", "t": "Café Show", "d": "2026-03-08",
+                                 "v": "Café", "sa": ["Opener"], "s": "other"}
+    assert data["keyMap"]["t"] == "title"
+    assert data["sources"][0]["eventCount"] == 1  # Only events and shows are shortened
+    assert len(set(SHORT_KEYS.values())) == len(SHORT_KEYS)
+
+
+def test_history_round_trip_short(tmp_path):
+    history = ShowHistory(shows=[HistoricalShow(date="2025-01-01", title="Old Show", venue="Reverb")],
+                          lastUpdated="2026-03-01T00:00:00+00:00")
+    path = tmp_path / "history.json"
+    write_feed(path, history, "short")
+    assert load_feed(path, ShowHistory, ShowHistory(shows=[], lastUpdated="")) == history
+
+
+def test_load_missing_file_returns_default(tmp_path):
+    default = ScraperOutput(events=[], lastUpdated="", sources=[])
+    assert load_feed(tmp_path / "events.json", ScraperOutput, default) is default
+
+
+def test_invalid_feed_still_raises():
+    with pytest.raises(ValueError):
+        parse_feed(b'{"events": [{"title": "No id"}], "lastUpdated": "", "sources": []}', ScraperOutput)
+
+
+def test_format_from_environment(monkeypatch, caplog):
+    monkeypatch.setenv("SCRAPER_JSON_FORMAT", "Pretty")
+    assert resolve_format() == "pretty"
+    assert resolve_format("short") == "short"
+    monkeypatch.setenv("SCRAPER_JSON_FORMAT", "yaml")
+    assert resolve_format() == "compact"
+    assert "JSON format 'yaml' unknown" in caplog.text
+
+
+def test_write_skips_timestamp_only_changes(tmp_path):
+    path = tmp_path / "events.json"
+    assert write_feed(path, OUTPUT)
+    rerun = OUTPUT.model_copy(deep=True)
+    rerun.lastUpdated = "2026-03-02T00:00:00+00:00"
+    rerun.sources[0].lastScraped = "2026-03-02T00:00:00+00:00"
+    assert not write_feed(path, rerun)
+    assert load_feed(path, ScraperOutput, None) == OUTPUT
+
+    rerun.sources[0].eventCount = 2
+    assert write_feed(path, rerun)
+    assert load_feed(path, ScraperOutput, None) == rerun
+
+
+def test_write_rewrites_other_format(tmp_path):
+    path = tmp_path / "events.json"
+    write_feed(path, OUTPUT, "pretty")
+    assert write_feed(path, OUTPUT, "compact")
+    assert path.read_bytes() == dump_feed(OUTPUT, "compact")
+    assert not write_feed(path, OUTPUT, "compact")
@@ -0,0 +1,75 @@
+# scraper/tests/test_feed_shards.py
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from feed_json import parse_feed
+from feed_shards import write_shards
+from models import Event, ScraperOutput, SourceStatus
+
+
+def event(id_: str, date: str, source: str, added: str = "2026-02-01T00:00:00+00:00") -> Event:
+    return Event(id=id_, title=id_, date=date, venue=source.title(), source=source, addedAt=added)
+
+
+def output(events: list[Event], run: str = "2026-03-01T00:00:00+00:00") -> ScraperOutput:
+    return ScraperOutput(
+        events=events,
+        lastUpdated=run,
+        sources=[SourceStatus(name="Holland", id="holland", url="https://example.com", status="ok",
+                              lastScraped=run, eventCount=2)],
+    )
+
+
+EVENTS = [
+    event("a", "2026-03-05", "holland"),
+    event("b", "2026-03-20", "admiral"),
+    event("c", "2026-04-02", "holland"),
+]
+
+
+def test_shards_partition_by_month_and_venue(tmp_path):
+    manifest = write_shards(output(EVENTS), tmp_path)
+    shard_dir = tmp_path / "events"
+
+    assert manifest["count"] == 3
+    assert {k: v["count"] for k, v in manifest["months"].items()} == {"2026-03": 2, "2026-04": 1}
+    assert {k: v["count"] for k, v in manifest["venues"].items()} == {"admiral": 1, "holland": 2}
+    assert json.loads((shard_dir / "manifest.json").read_text()) == manifest
+
+    march = parse_feed((shard_dir / manifest["months"]["2026-03"]["path"]).read_bytes(), ScraperOutput)
+    assert [e.id for e in march.events] == ["a", "b"]
+    assert march.sources == []
+    assert march.lastUpdated == "2026-02-01T00:00:00+00:00"
+
+    holland = parse_feed((shard_dir / "by-venue" / "holland.json").read_bytes(), ScraperOutput)
+    assert [e.id for e in holland.events] == ["a", "c"]
+    assert [s["id"] for s in manifest["sources"]] == ["holland"]
+
+
+def test_hash_changes_only_for_touched_shards(tmp_path):
+    before = write_shards(output(EVENTS), tmp_path)
+    # A later run re-scrapes every source but only adds one April show
+    added = event("d", "2026-04-10", "admiral", added="2026-03-02T00:00:00+00:00")
+    after = write_shards(output(EVENTS + [added], run="2026-03-02T00:00:00+00:00"), tmp_path)
+    assert after["months"]["2026-03"]["hash"] == before["months"]["2026-03"]["hash"]
+    assert after["months"]["2026-04"]["hash"] != before["months"]["2026-04"]["hash"]
+    assert after["venues"]["holland"]["hash"] == before["venues"]["holland"]["hash"]
+
+
+def test_stale_shards_removed(tmp_path):
+    write_shards(output(EVENTS), tmp_path)
+    manifest = write_shards(output(EVENTS[2:]), tmp_path)
+    assert list(manifest["months"]) == ["2026-04"]
+    assert sorted(p.name for p in (tmp_path / "events" / "by-month").iterdir()) == ["2026-04.json"]
+    assert sorted(p.name for p in (tmp_path / "events" / "by-venue").iterdir()) == ["holland.json"]
+
+
+def test_rerun_without_changes_rewrites_nothing(tmp_path):
+    first = write_shards(output(EVENTS), tmp_path)
+    files = {p: p.stat().st_mtime_ns for p in (tmp_path / "events").rglob("*.json")}
+    again = write_shards(output(EVENTS, run="2026-03-02T00:00:00+00:00"), tmp_path)
+    assert again == first
+    assert {p: p.stat().st_mtime_ns for p in files} == files
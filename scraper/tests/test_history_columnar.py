@@ -0,0 +1,68 @@
+# scraper/tests/test_history_columnar.py
+import json
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from history_columnar import ColumnarHistory, encode_history, read_columnar, write_columnar
+from history_store import HistoryStore
+from models import HistoricalShow
+
+SHOWS = [
+    HistoricalShow(date="2026-03-02", title="Stateside", venue="Reverb Lounge", supportingArtists=["Firestarter"]),
+    HistoricalShow(date="2026-03-01", title="Scattered Hamlet", venue="Reverb Lounge",
+                   supportingArtists=["Molten", "Firestarter"]),
+    HistoricalShow(date="2026-02-24", title="Solo", venue="Slowdown"),
+    HistoricalShow(date="2026-02-24", title="Empty Bill", venue="Slowdown", supportingArtists=[]),
+]
+
+
+def test_columns_intern_and_delta_encode():
+    data = encode_history(SHOWS, "2026")
+    assert data["venues"] == ["Reverb Lounge", "Slowdown"]
+    assert data["artists"] == ["Firestarter", "Molten"]
+    assert data["start"] == "2026-03-02"
+    assert data["dates"] == [0, 1, 5, 0]
+    assert data["venue"] == [0, 0, 1, 1]
+    assert data["support"] == [[0], [1, 0], None, []]
+
+
+def test_round_trip():
+    history = ColumnarHistory(json.loads(json.dumps(encode_history(SHOWS, "2026"))))
+    assert len(history) == 4
+    assert history[1] == SHOWS[1]
+    assert history.to_history("t1").shows == SHOWS
+    assert history.year == "2026"
+
+
+def test_empty_history():
+    history = ColumnarHistory(encode_history([]))
+    assert len(history) == 0 and list(history) == []
+
+
+def test_requires_newest_first():
+    with pytest.raises(ValueError):
+        encode_history(list(reversed(SHOWS)))
+
+
+def test_write_per_year_and_only_touched_years(tmp_path):
+    store = HistoryStore(tmp_path / "history")
+    store.append(SHOWS + [HistoricalShow(date="2025-12-31", title="NYE", venue="Slowdown")], now="t1")
+    directory = tmp_path / "history" / "columnar"
+    assert write_columnar(store) == [directory / "2026.json", directory / "2025.json"]
+    assert [h.year for h in read_columnar(directory)] == ["2026", "2025"]
+    assert [s.title for h in read_columnar(directory) for s in h] == [
+        "Stateside", "Scattered Hamlet", "Empty Bill", "Solo", "NYE"]
+
+    # A fresh run that archives nothing re-encodes nothing, and never reads the partitions
+    reopened = HistoryStore(tmp_path / "history")
+    reopened.read_partition = None
+    assert write_columnar(reopened) == []
+
+    reopened = HistoryStore(tmp_path / "history")
+    reopened.append([HistoricalShow(date="2025-11-01", title="Late", venue="Slowdown")])
+    assert write_columnar(reopened) == [directory / "2025.json"]
+    assert len(ColumnarHistory.load(directory / "2025.json")) == 2
+    assert len(HistoryStore(tmp_path / "history")) == 6  # The store ignores the extra files
@@ -0,0 +1,146 @@
+# scraper/tests/test_history_store.py
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import history_store
+from artist_index import ArtistIndex
+from feed_json import write_feed
+from history_store import HistoryStore, open_store, show_of, split_past
+from models import Event, HistoricalShow, ShowHistory
+
+
+def show(date: str, title: str, venue: str = "Slowdown") -> HistoricalShow:
+    return HistoricalShow(date=date, title=title, venue=venue)
+
+
+def partition_files(root: Path) -> list[str]:
+    return sorted(str(p.relative_to(root)) for p in root.glob("*/*.jsonl"))
+
+
+def test_append_partitions_by_month_and_dedups(tmp_path):
+    store = HistoryStore(tmp_path)
+    added = store.append([show("2026-02-27", "Band A"), show("2026-03-01", "Band B"), show("2026-02-27", "Band A")])
+    assert added == 2
+    assert partition_files(tmp_path) == ["2026/2026-02.jsonl", "2026/2026-03.jsonl"]
+    assert ("2026-02-27", "Band A", "Slowdown") in store
+    assert store.append([show("2026-02-27", "Band A")]) == 0
+
+
+def test_append_only_touches_changed_partitions(tmp_path):
+    store = HistoryStore(tmp_path)
+    store.append([show("2026-01-10", "Old"), show("2026-02-10", "Newer")])
+    january = tmp_path / "2026" / "2026-01.jsonl"
+    before = january.stat().st_mtime_ns, january.read_bytes()
+
+    store.append([show("2026-02-20", "Newest")])
+    assert (january.stat().st_mtime_ns, january.read_bytes()) == before
+    assert len((tmp_path / "2026" / "2026-02.jsonl").read_text().splitlines()) == 2
+
+
+def partition_dates(root: Path, month: str) -> list[str]:
+    path = root / month[:4] / f"{month}.jsonl"
+    return [HistoricalShow.model_validate_json(line).date for line in path.read_text().splitlines()]
+
+
+def test_partitions_stay_sorted_on_disk(tmp_path):
+    store = HistoryStore(tmp_path)
+    store.append([show("2026-01-20", "C"), show("2026-01-02", "A")])
+    store.append([show("2026-01-25", "D")])  # Newer than the partition: appended
+    assert partition_dates(tmp_path, "2026-01") == ["2026-01-02", "2026-01-20", "2026-01-25"]
+
+    store.append([show("2026-01-10", "B"), show("2026-01-31", "E")])  # Backfill: merged
+    assert partition_dates(tmp_path, "2026-01") == ["2026-01-02", "2026-01-10", "2026-01-20",
+                                                    "2026-01-25", "2026-01-31"]
+    assert [s.title for s in HistoryStore(tmp_path).iter_shows()] == ["E", "D", "C", "B", "A"]
+
+
+def test_split_past_bisects_sorted_events():
+    events = [Event(id=d, title=d, date=d, venue="Slowdown", source="theslowdown", supportingArtists=["X"])
+              for d in ("2026-03-01", "2026-03-02", "2026-03-02", "2026-03-03")]
+    past, upcoming = split_past(events, "2026-03-02")
+    assert [e.date for e in past] == ["2026-03-01"]
+    assert [e.date for e in upcoming] == ["2026-03-02", "2026-03-02", "2026-03-03"]
+    assert split_past(events, "2026-04-01") == (events, [])
+    assert split_past([], "2026-03-02") == ([], [])
+    assert show_of(past[0]) == HistoricalShow(date="2026-03-01", title="2026-03-01", venue="Slowdown",
+                                              supportingArtists=["X"])
+
+
+def test_reopened_store_keeps_index_and_order(tmp_path):
+    HistoryStore(tmp_path).append([show("2025-12-31", "NYE"), show("2026-01-02", "B"), show("2026-01-20", "C")], now="t1")
+    store = HistoryStore(tmp_path)
+    assert len(store) == 3
+    assert store.last_updated == "t1"
+    assert store.partitions == {"2025-12": 1, "2026-01": 2}
+    assert [s.title for s in store.iter_shows()] == ["C", "B", "NYE"]
+
+
+def test_index_rebuilt_and_repeated_lines_skipped(tmp_path):
+    store = HistoryStore(tmp_path)
+    store.append([show("2026-03-01", "Band")])
+    partition = tmp_path / "2026" / "2026-03.jsonl"
+    partition.write_text(partition.read_text() * 2)  # Run died after shows, before keys
+    (tmp_path / "keys.txt").unlink()
+    (tmp_path / "meta.json").unlink()
+
+    store = HistoryStore(tmp_path)
+    assert len(store) == 1
+    assert [s.title for s in store.iter_shows()] == ["Band"]
+    assert store.append([show("2026-03-01", "Band")]) == 0
+
+
+def test_crash_before_keys_does_not_inflate_counts(tmp_path):
+    HistoryStore(tmp_path).append([show("2026-03-01", "A"), show("2026-03-02", "B")])
+    keys = tmp_path / "keys.txt"
+    keys.write_text("".join(keys.read_text().splitlines(keepends=True)[:1]))  # B's key never written
+
+    store = HistoryStore(tmp_path)
+    assert store.append([show("2026-03-02", "B")]) == 1  # Archived again by the next run
+    assert store.partitions == {"2026-03": 2}
+    assert HistoryStore(tmp_path).partitions == {"2026-03": 2}
+    assert [s.title for s in store.iter_shows()] == ["B", "A"]
+
+
+def test_rebuilt_keys_written_atomically(tmp_path, monkeypatch):
+    HistoryStore(tmp_path).append([show("2026-03-01", "A")])
+    (tmp_path / "keys.txt").unlink()
+    written = []
+    monkeypatch.setattr(history_store, "write_atomic", lambda path, raw: written.append(path))
+    HistoryStore(tmp_path)
+    assert written == [tmp_path / "keys.txt"]
+
+
+def test_meta_counts_rebuilt_when_only_meta_lost(tmp_path):
+    HistoryStore(tmp_path).append([show("2026-01-02", "A"), show("2026-01-05", "B"), show("2026-02-01", "C")])
+    (tmp_path / "meta.json").unlink()
+
+    store = HistoryStore(tmp_path)
+    assert store.partitions == {"2026-01": 2, "2026-02": 1}
+    assert HistoryStore(tmp_path).partitions == {"2026-01": 2, "2026-02": 1}  # Persisted, not zeros
+    assert len(store) == 3
+
+
+def test_open_store_imports_and_removes_legacy_history(tmp_path):
+    legacy = tmp_path / "history.json"
+    write_feed(legacy, ShowHistory(shows=[show("2025-05-01", "Legacy")], lastUpdated="old"))
+    store = open_store(tmp_path / "history", legacy_json=legacy)
+    assert [s.title for s in store.iter_shows()] == ["Legacy"]
+    assert store.last_updated == "old"
+    assert not legacy.exists()  # No stale copy left behind
+    assert len(open_store(tmp_path / "history", legacy_json=legacy)) == 1
+
+    # A history.json that reappears next to a populated store is merged, not ignored
+    write_feed(legacy, ShowHistory(shows=[show("2025-05-01", "Legacy"), show("2025-06-01", "Late")],
+                                   lastUpdated="older"))
+    store = open_store(tmp_path / "history", legacy_json=legacy)
+    assert [s.title for s in store.iter_shows()] == ["Late", "Legacy"]
+    assert store.last_updated == "old"
+    assert not legacy.exists()
+
+
+def test_artist_index_reads_store_directory(tmp_path):
+    HistoryStore(tmp_path / "history").append([show("2025-05-01", "The Band")])
+    index = ArtistIndex.from_files(tmp_path / "events.json", tmp_path / "history")
+    assert [s.venue for s in index.shows_for("The Band")] == ["Slowdown"]
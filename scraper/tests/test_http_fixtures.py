@@ -0,0 +1,108 @@
+# scraper/tests/test_http_fixtures.py
+import json
+import pytest
+import requests
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from http_fixtures import HttpRecorder, HttpReplayer, request_key
+from scrapers.theslowdown import SlowdownScraper
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def fake_response(url, body: bytes, status=200, content_type="text/html; charset=utf-8"):
+    response = requests.Response()
+    response.status_code = status
+    response.reason = "OK" if status == 200 else "Not Found"
+    response.url = url
+    response.headers["Content-Type"] = content_type
+    response.encoding = "utf-8"
+    response._content = body
+    return response
+
+
+@pytest.fixture
+def fake_network(monkeypatch):
+    """Route requests to an in-process site: url -> list of bodies served in turn."""
+    site: dict[str, list[bytes]] = {}
+    calls = []
+
+    def request(session, method, url, *args, params=None, **kwargs):
+        full = requests.Request(method, url, params=params).prepare().url
+        calls.append(full)
+        bodies = site.get(full)
+        if not bodies:
+            return fake_response(full, b"missing", status=404, content_type="text/plain")
+        return fake_response(full, bodies.pop(0) if len(bodies) > 1 else bodies[0])
+
+    monkeypatch.setattr(requests.sessions.Session, "request", request)
+    return site, calls
+
+
+def test_request_key_sorts_query_and_strips_api_keys():
+    key, url = request_key("get", "https://API.example.com/events.json?size=50&apikey=secret", {"page": 2})
+    assert key == "GET https://api.example.com/events.json?page=2&size=50"
+    assert "secret" not in url
+
+
+def test_record_then_replay_offline(tmp_path, fake_network):
+    site, calls = fake_network
+    html = (FIXTURES / "theslowdown_sample.html").read_bytes()
+    site[SlowdownScraper.url] = [html]
+
+    with HttpRecorder(tmp_path) as recorder:
+        recorded_events = SlowdownScraper().scrape()
+    assert len(recorder.entries) == 1
+
+    manifest = json.loads((tmp_path / "manifest.json").read_text())
+    assert manifest["version"] == 1
+    assert (tmp_path / manifest["entries"][0]["body"]).read_bytes() == html
+
+    site.clear()
+    calls.clear()
+    with HttpReplayer(tmp_path) as replayer:
+        replayed_events = SlowdownScraper().scrape()
+    assert calls == []  # Nothing reached the transport
+    assert replayer.hits == 1
+    assert [e.id for e in replayed_events] == [e.id for e in recorded_events]
+    assert len(replayed_events) > 0
+
+
+def test_replay_serves_repeats_in_order_and_errors(tmp_path, fake_network):
+    site, _ = fake_network
+    site["https://example.com/feed"] = [b"first", b"second"]
+
+    with HttpRecorder(tmp_path):
+        assert requests.get("https://example.com/feed").text == "first"
+        assert requests.get("https://example.com/feed").text == "second"
+        requests.get("https://example.com/gone")
+
+    with HttpReplayer(tmp_path) as replayer:
+        assert requests.get("https://example.com/feed").text == "first"
+        assert requests.get("https://example.com/feed").text == "second"
+        assert requests.get("https://example.com/feed").text == "second"
+        with pytest.raises(requests.HTTPError):
+            requests.get("https://example.com/gone").raise_for_status()
+        with pytest.raises(requests.ConnectionError):
+            requests.Session().get("https://example.com/never-recorded")
+    assert replayer.misses == ["GET https://example.com/never-recorded"]
+
+
+def test_replay_restores_transport(tmp_path, fake_network):
+    site, calls = fake_network
+    site["https://example.com/a"] = [b"a"]
+    with HttpRecorder(tmp_path):
+        requests.get("https://example.com/a")
+    with HttpReplayer(tmp_path):
+        pass
+    requests.get("https://example.com/a")
+    assert len(calls) == 2
+
+
+def test_rejects_unknown_bundle_version(tmp_path):
+    (tmp_path / "manifest.json").write_text(json.dumps({"version": 99, "entries": []}))
+    with pytest.raises(ValueError):
+        HttpReplayer(tmp_path)
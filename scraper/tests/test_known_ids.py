@@ -0,0 +1,95 @@
+# scraper/tests/test_known_ids.py
+import pytest
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import known_ids
+from known_ids import KnownEventIds
+
+
+class FakeEventsTable:
+    """Just enough of the supabase query builder for KnownEventIds."""
+
+    def __init__(self, ids, fail=False):
+        self.ids = sorted(ids)
+        self.fail = fail
+        self.range_calls = 0
+        self.in_calls = []
+        self._range = None
+        self._in = None
+
+    def table(self, name):
+        self._range = None
+        self._in = None
+        return self
+
+    def select(self, *args):
+        return self
+
+    def order(self, *args):
+        return self
+
+    def range(self, start, end):
+        self.range_calls += 1
+        self._range = (start, end)
+        return self
+
+    def in_(self, column, values):
+        self.in_calls.append(list(values))
+        self._in = set(values)
+        return self
+
+    def execute(self):
+        if self.fail:
+            raise RuntimeError("boom")
+        if self._range is not None:
+            start, end = self._range
+            rows = self.ids[start:end + 1]
+        else:
+            rows = [i for i in self.ids if i in self._in]
+        return SimpleNamespace(data=[{"id": i} for i in rows])
+
+
+def test_loads_all_pages(monkeypatch):
+    monkeypatch.setattr(known_ids, "PAGE_SIZE", 3)
+    db = FakeEventsTable([f"e{i}" for i in range(7)])
+    ids = KnownEventIds(db)
+    assert ids.loaded
+    assert len(ids) == 7
+    assert db.range_calls == 3
+
+
+def test_definite_misses_skip_database():
+    db = FakeEventsTable(["a", "b"])
+    ids = KnownEventIds(db)
+    assert ids.verify(["new-1", "new-2"]) == set()
+    assert db.in_calls == []
+
+
+def test_probable_hits_verified_in_one_query():
+    db = FakeEventsTable(["a", "b", "c"])
+    ids = KnownEventIds(db)
+    db.ids.remove("b")  # Deleted after the snapshot
+    assert ids.verify(["a", "b", "new"]) == {"a"}
+    assert db.in_calls == [["a", "b"]]
+    assert "a" in ids
+    assert "b" not in ids
+
+
+def test_add_marks_inserted_ids():
+    ids = KnownEventIds(FakeEventsTable([]))
+    ids.add("x")
+    assert "x" in ids
+
+
+def test_load_failure_falls_back_to_checking_everything():
+    db = FakeEventsTable(["a"], fail=True)
+    ids = KnownEventIds(db)
+    assert not ids.loaded
+    db.fail = False
+    assert ids.verify(["a", "b"]) == {"a"}
+    assert db.in_calls == [["a", "b"]]
+    assert "a" in ids
@@ -0,0 +1,33 @@
+# scraper/tests/test_log_config.py
+import logging
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from log_config import DEFAULT_LEVEL, configure_logging, log_level
+
+
+def test_level_names():
+    assert log_level("info") == logging.INFO
+    assert log_level(" DEBUG ") == logging.DEBUG
+    assert log_level("INFOO") is None
+    assert log_level("") is None
+    assert log_level(None) is None
+
+
+def test_bad_level_falls_back_with_warning(monkeypatch, caplog):
+    calls = []
+    monkeypatch.setattr(logging, "basicConfig", lambda **kwargs: calls.append(kwargs))
+    monkeypatch.setenv("LOG_LEVEL", "INFOO")
+    configure_logging()
+    assert calls[0]["level"] == DEFAULT_LEVEL
+    assert "LOG_LEVEL 'INFOO' unknown" in caplog.text
+
+    monkeypatch.setenv("LOG_LEVEL", "info")
+    configure_logging()
+    assert calls[1]["level"] == logging.INFO
+
+    monkeypatch.delenv("LOG_LEVEL")
+    configure_logging()
+    assert calls[2]["level"] == DEFAULT_LEVEL
@@ -120,3 +120,9 @@ def test_find_existing_empty_db():
     new_event = MockEvent("e1", "Some Event", "2026-03-10", "admiral")
     match = find_existing_event(new_event, db_events)
     assert match is None
+
+
+def test_find_existing_accepts_title_date_tuple():
+    db_events = [{"id": "1", "title": "The Band Name Tour"}]
+    assert find_existing_event(("The Band Name", "2026-03-15"), db_events) == db_events[0]
+    assert find_existing_event(("Someone Else", "2026-03-15"), db_events) is None
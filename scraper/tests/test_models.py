@@ -1,6 +1,6 @@
 # scraper/tests/test_models.py
 import pytest
-from models import Event
+from models import Event, EventRecord, validate_events
 
 def test_event_model_creates_valid_event():
     event = Event(
@@ -28,3 +28,24 @@ def test_event_model_optional_fields():
     assert event.time is None
     assert event.imageUrl is None
     assert event.ageRestriction is None
+
+def test_validate_events_converts_records_in_bulk():
+    records = [
+        EventRecord(id=f"v-2026-03-1{i}-band", title=f"Band {i}", date=f"2026-03-1{i}", venue="V", source="v")
+        for i in range(3)
+    ]
+    records[1].supportingArtists = ["Opener"]
+    events = validate_events(records)
+    assert all(isinstance(e, Event) for e in events)
+    assert [e.title for e in events] == ["Band 0", "Band 1", "Band 2"]
+    assert events[1].supportingArtists == ["Opener"]
+
+def test_validate_events_drops_only_invalid_records():
+    good = EventRecord(id="a", title="Good", date="2026-03-15", venue="V", source="v")
+    bad = EventRecord(id="b", title="Bad", date="2026-03-15", venue=None, source="v")
+    assert [e.id for e in validate_events([good, bad, good])] == ["a", "a"]
+
+def test_event_record_is_slotted():
+    record = EventRecord(id="a", title="T", date="2026-03-15", venue="V", source="v")
+    with pytest.raises(AttributeError):
+        record.unknown = 1
@@ -0,0 +1,159 @@
+# scraper/tests/test_pagination.py
+import pytest
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import scrapers.base
+import scrapers.opa
+from scrapers.opa import OPAScraper
+from scrapers.pagination import HostRateLimiter, ParsedPage, host_limiter, paginate
+from scrapers.ticketweb import TicketWebScraper
+
+
+def ticketweb_page(titles, next_page=None):
+    sections = "".join(f"""
+        <div class="tw-section">
+          <div class="tw-name"><a href="https://example.com/e/{i}">{title}</a></div>
+          <div class="tw-event-date">March {i + 1}, 2026</div>
+          <div class="tw-event-time">8:00 pm</div>
+        </div>""" for i, title in enumerate(titles))
+    nav = f'<a href="/events?twpage={next_page}">Next</a>' if next_page else ""
+    return f'<html><body>{sections}<div class="tw-pager"><a href="/events?twpage=0">Prev</a>{nav}</div></body></html>'
+
+
+def opa_page(titles, pages):
+    cards = "".join(f"""
+        <li class="eventCard">
+          <h3 class="title">{title}</h3>
+          <span class="start">Fri Mar {i + 1}</span>
+          <span class="time">7:30 PM</span>
+          <span>Orpheum Theater</span>
+          <a href="/events/{i}">Details</a>
+        </li>""" for i, title in enumerate(titles))
+    options = "".join(f"<option>{p}</option>" for p in range(1, pages + 1))
+    return f'<html><body><ul>{cards}</ul><select name="page">{options}</select></body></html>'
+
+
+@pytest.fixture
+def soup_calls(monkeypatch):
+    calls = []
+    for module in (scrapers.base, scrapers.opa):
+        original = module.make_soup
+
+        def counting(html, *args, _original=original, **kwargs):
+            calls.append(html)
+            return _original(html, *args, **kwargs)
+
+        monkeypatch.setattr(module, "make_soup", counting)
+    return calls
+
+
+def test_ticketweb_parse_page_reads_events_and_next_link(soup_calls):
+    scraper = TicketWebScraper("Test Venue", "test", "https://example.com/events")
+    page = scraper.parse_page(ticketweb_page(["Band A", "Band B"], next_page=2))
+    assert [e.title for e in page.items] == ["Band A", "Band B"]
+    assert page.next_page == 2
+    assert page.total_pages is None
+    assert len(soup_calls) == 1
+
+
+def test_ticketweb_last_page_has_no_next():
+    scraper = TicketWebScraper("Test Venue", "test", "https://example.com/events")
+    assert scraper.parse_page(ticketweb_page(["Band A"])).next_page is None
+
+
+def test_opa_parse_page_reads_cards_and_page_count(soup_calls):
+    page = OPAScraper._parse_page(opa_page(["Show A", "Show B"], pages=3))
+    assert [raw["title"] for raw in page.items] == ["Show A", "Show B"]
+    assert {raw["venue_id"] for raw in page.items} == {"orpheum"}
+    assert page.total_pages == 3
+    assert len(soup_calls) == 1
+
+
+def test_opa_page_without_dropdown():
+    page = OPAScraper._parse_page(opa_page(["Show A"], pages=0))
+    assert page.total_pages is None
+
+
+class FakeSite:
+    """Serves ParsedPages by number and records concurrency."""
+
+    def __init__(self, pages: dict, delay: float = 0.0):
+        self.pages = pages
+        self.delay = delay
+        self.requested = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, number):
+        with self._lock:
+            self.requested.append(number)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        return self.pages.get(number)
+
+
+def test_paginate_fetches_known_pages_concurrently_in_order():
+    site = FakeSite({n: ParsedPage(items=[f"p{n}a", f"p{n}b"], total_pages=5) for n in range(1, 6)}, delay=0.02)
+    assert paginate(site, first_page=1, workers=4) == [f"p{n}{s}" for n in range(1, 6) for s in "ab"]
+    assert site.requested[0] == 1
+    assert site.max_active > 1
+
+
+def test_paginate_stops_at_first_failed_page():
+    pages = {1: ParsedPage(items=["a"], total_pages=4), 2: ParsedPage(items=["b"]), 4: ParsedPage(items=["d"])}
+    assert paginate(FakeSite(pages), workers=4) == ["a", "b"]
+
+
+def test_paginate_follows_next_links_sequentially_without_total():
+    site = FakeSite({
+        0: ParsedPage(items=["a"], next_page=1),
+        1: ParsedPage(items=["b"], next_page=2),
+        2: ParsedPage(items=["c"], next_page=1),  # Pager pointing backwards ends the walk
+    }, delay=0.01)
+    assert paginate(site, first_page=0, workers=4) == ["a", "b", "c"]
+    assert site.requested == [0, 1, 2]
+    assert site.max_active == 1
+
+
+def test_paginate_single_worker_walks_known_pages_in_order():
+    site = FakeSite({n: ParsedPage(items=[n], total_pages=3) for n in range(1, 4)})
+    assert paginate(site, workers=1) == [1, 2, 3]
+    assert site.max_active == 1
+
+
+def test_paginate_empty_first_page():
+    assert paginate(FakeSite({1: ParsedPage(items=[], total_pages=3)})) == []
+
+
+def test_rate_limiter_spaces_requests_across_threads():
+    limiter = HostRateLimiter(0.02)
+    starts = []
+
+    def hit():
+        limiter.wait()
+        starts.append(time.monotonic())
+
+    threads = [threading.Thread(target=hit) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    # Four starts at 20ms spacing span at least 60ms however the threads wake
+    assert max(starts) - min(starts) >= 0.055
+
+
+def test_host_limiter_shared_per_host():
+    a = host_limiter("https://pager-test.example.com/events?page=1", 0.1)
+    b = host_limiter("https://PAGER-TEST.example.com/other", 0.3)
+    assert a is b
+    assert a.min_interval == 0.3
+    assert host_limiter("https://elsewhere.example.com/", 0.1) is not a
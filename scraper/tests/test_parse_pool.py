@@ -0,0 +1,99 @@
+# scraper/tests/test_parse_pool.py
+import os
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scrapers import parse_pool
+from scrapers.opa import OPAScraper
+from scrapers.pagination import paginate
+from scrapers.parse_pool import MAX_AUTO_WORKERS, ParseJob, get_parse_pool, parse_workers
+from scrapers.ticketweb import TicketWebScraper
+from tests.test_pagination import FakeSite, opa_page, ticketweb_page
+
+
+def worker_pid(_html):
+    return os.getpid()
+
+
+def fails_in_worker(parent_pid):
+    if os.getpid() != parent_pid:
+        raise TypeError("bug in the parse")
+    return "reran inline"
+
+
+@pytest.fixture
+def workers(monkeypatch):
+    """Set SCRAPER_PARSE_WORKERS and give each test a fresh pool."""
+    def use(value: str):
+        parse_pool.shutdown_parse_pool()
+        monkeypatch.setenv("SCRAPER_PARSE_WORKERS", value)
+
+    yield use
+    parse_pool.shutdown_parse_pool()
+
+
+def test_parse_workers_setting(workers):
+    workers("3")
+    assert parse_workers() == 3
+    workers("0")
+    assert parse_workers() == 0
+    workers("auto")
+    assert parse_workers() == min(os.cpu_count() or 1, MAX_AUTO_WORKERS)
+
+
+def test_jobs_run_in_worker_processes(workers):
+    workers("2")
+    assert ParseJob(worker_pid, "<html>").result() != os.getpid()
+
+
+def test_pool_never_forks(workers):
+    workers("2")
+    assert get_parse_pool()._mp_context.get_start_method() in ("forkserver", "spawn")
+
+
+def test_zero_workers_parses_inline(workers):
+    workers("0")
+    assert get_parse_pool() is None
+    assert ParseJob(worker_pid, "<html>").result() == os.getpid()
+
+
+def test_unpicklable_function_falls_back_inline(workers, caplog):
+    workers("2")
+    local = []
+    job = ParseJob(lambda html: local.append(html) or len(local), "<html>")
+    assert job.done()  # Never submitted
+    assert job.result() == 1
+    assert "could not run in the parse pool" in caplog.text
+
+
+def test_worker_type_errors_are_not_rerun_inline(workers, caplog):
+    workers("2")
+    with pytest.raises(TypeError, match="bug in the parse"):
+        ParseJob(fails_in_worker, os.getpid()).result()
+    assert "parsing inline" not in caplog.text
+
+
+def test_parse_errors_propagate(workers):
+    workers("2")
+    with pytest.raises(ValueError):
+        ParseJob(int, "not a number").result()
+
+
+def test_paginate_parses_known_pages_in_pool_in_order(workers):
+    workers("2")
+    site = FakeSite({n: opa_page([f"Show {n}a", f"Show {n}b"], pages=4) for n in range(1, 5)}, delay=0.01)
+    raw = paginate(site, first_page=1, workers=4, parse=OPAScraper._parse_page)
+    assert [r["title"] for r in raw] == [f"Show {n}{s}" for n in range(1, 5) for s in "ab"]
+    assert site.max_active > 1
+
+
+def test_paginate_with_parse_follows_next_links_and_stops_on_failure(workers):
+    workers("2")
+    scraper = TicketWebScraper("Test Venue", "test", "https://example.com/events")
+    site = FakeSite({0: ticketweb_page(["Band A"], next_page=1), 1: ticketweb_page(["Band B"], next_page=2)})
+    records = paginate(site, first_page=0, workers=4, parse=scraper.parse_page)
+    assert [r.title for r in records] == ["Band A", "Band B"]
+    assert site.requested == [0, 1, 2]
@@ -0,0 +1,80 @@
+# scraper/tests/test_parsing.py
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scrapers import parsing
+from scrapers.parsing import make_soup, resolve_parser
+
+
+def test_html_parser_always_available():
+    assert resolve_parser("html.parser") == "html.parser"
+
+
+def test_auto_prefers_lxml_when_installed(monkeypatch):
+    monkeypatch.setattr(parsing, "parser_available", lambda name: True)
+    assert resolve_parser("auto") == "lxml"
+    monkeypatch.setattr(parsing, "parser_available", lambda name: name == "html.parser")
+    assert resolve_parser("auto") == "html.parser"
+
+
+def test_env_var_selects_backend(monkeypatch):
+    monkeypatch.setenv("SCRAPER_HTML_PARSER", "lxml")
+    monkeypatch.setattr(parsing, "parser_available", lambda name: True)
+    assert resolve_parser() == "lxml"
+
+
+def test_default_is_html_parser_even_with_lxml_installed(monkeypatch):
+    monkeypatch.delenv("SCRAPER_HTML_PARSER", raising=False)
+    monkeypatch.setattr(parsing, "parser_available", lambda name: True)
+    assert resolve_parser() == "html.parser"
+
+
+def test_unknown_backend_falls_back(caplog):
+    assert resolve_parser("selectolax-ish") == "html.parser"
+    assert "unavailable" in caplog.text
+
+
+def test_make_soup_parses():
+    soup = make_soup('<div class="show"><h1>Band</h1></div>', "html.parser")
+    assert soup.select_one("div.show h1").get_text() == "Band"
+
+
+PAGE = """
+<html><body>
+<nav><a href="/">Home</a><a href="/events?twpage=2">Next</a></nav>
+<div class="eventWrapper rhpSingleEvent"><h2>Band A</h2><div class="eventWrapper">nested</div></div>
+<div class="eventWrapper"><h2>Not a card</h2></div>
+<script>var tracking = 1;</script>
+<footer>Footer text</footer>
+</body></html>
+"""
+
+
+@pytest.mark.parametrize("parser", ["html.parser", "lxml"])
+def test_containers_only_build_matching_subtrees(parser):
+    soup = make_soup(PAGE, parser, ("div.eventWrapper.rhpSingleEvent",))
+    assert [h.get_text() for h in soup.select("h2")] == ["Band A"]
+    assert soup.select_one("div.eventWrapper.rhpSingleEvent .eventWrapper").get_text() == "nested"
+    assert soup.find("script") is None
+    assert "Footer" not in soup.get_text()
+
+
+@pytest.mark.parametrize("parser", ["html.parser", "lxml"])
+def test_attribute_selector_container(parser):
+    soup = make_soup(PAGE, parser, ("a[href*=twpage]",))
+    assert [a["href"] for a in soup.find_all("a")] == ["/events?twpage=2"]
+
+
+def test_rejects_unsupported_selector():
+    with pytest.raises(ValueError):
+        make_soup(PAGE, "html.parser", ("div > h2",))
+
+
+def test_scraper_get_soup_uses_containers():
+    from scrapers.waitingroom import WaitingRoomScraper
+    scraper = WaitingRoomScraper()
+    assert scraper.get_soup(PAGE).find("nav") is None
+    assert scraper.get_soup(PAGE, containers=()).find("nav") is not None
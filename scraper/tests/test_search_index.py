@@ -0,0 +1,64 @@
+# scraper/tests/test_search_index.py
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from history_store import HistoryStore
+from models import Event, HistoricalShow
+from search_index import SearchIndex, build_index, tokenize, write_search_index
+
+EVENTS = [
+    Event(id="slowdown-2026-03-07-leilas-rose", title="Leila's Rose", date="2026-03-07", venue="Slowdown",
+          supportingArtists=["The Openers"], source="theslowdown"),
+    Event(id="admiral-2026-03-09-rose-city", title="Rose City Band", date="2026-03-09", venue="Admiral",
+          source="admiral"),
+]
+SHOWS = [HistoricalShow(date="2025-11-01", title="LEILAS ROSE", venue="Reverb")]
+
+
+def test_tokens_match_normalize_text():
+    assert tokenize("Leila's Rose (Live!)") == ["leilas", "rose", "live"]
+    assert tokenize("") == []
+
+
+def test_index_maps_tokens_to_docs():
+    index = build_index(EVENTS, SHOWS)
+    assert index["docs"] == [
+        ["2026-03-07", "Leila's Rose", "Slowdown", "slowdown-2026-03-07-leilas-rose"],
+        ["2026-03-09", "Rose City Band", "Admiral", "admiral-2026-03-09-rose-city"],
+        ["2025-11-01", "LEILAS ROSE", "Reverb"],
+    ]
+    assert index["tokens"]["rose"] == [0, 1, 2]
+    assert index["tokens"]["openers"] == [0]
+    assert list(index["tokens"]) == sorted(index["tokens"])
+
+
+def test_search_requires_all_tokens_with_prefix_last():
+    index = SearchIndex(build_index(EVENTS, SHOWS))
+    assert index.search("leila's ro") == [0, 2]
+    assert index.search("rose ci") == [1]
+    assert index.search("open") == [0]
+    assert index.search("ros") == [0, 1, 2]
+    assert index.search("nobody") == []
+    assert index.search("zz") == []
+    assert index.search("!!") == []
+
+
+def test_history_years_only_rebuilt_when_touched(tmp_path):
+    store = HistoryStore(tmp_path / "history")
+    store.append(SHOWS + [HistoricalShow(date="2026-01-05", title="New Year Band", venue="Slowdown")])
+    written = write_search_index(EVENTS, store, tmp_path)
+    assert written == [tmp_path / "search.json", tmp_path / "search" / "2026.json", tmp_path / "search" / "2025.json"]
+
+    upcoming = json.loads((tmp_path / "search.json").read_text())
+    assert upcoming["historyYears"] == ["2026", "2025"]
+    assert len(upcoming["docs"]) == 2
+    history_2025 = SearchIndex(json.loads((tmp_path / "search" / "2025.json").read_text()))
+    assert history_2025.docs == [["2025-11-01", "LEILAS ROSE", "Reverb"]]
+
+    # A run that archives nothing never touches the history files or the partitions
+    reopened = HistoryStore(tmp_path / "history")
+    reopened.read_partition = None
+    assert write_search_index(EVENTS, reopened, tmp_path) == []
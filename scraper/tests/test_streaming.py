@@ -0,0 +1,103 @@
+# scraper/tests/test_streaming.py
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from main import run_all_scrapers
+from models import Event
+from scrapers.base import BaseScraper
+from scrapers.pagination import ParsedPage, iter_pages
+from scrapers.ticketweb import TicketWebScraper
+from streaming import EventStream, batched
+from tests.test_pagination import FakeSite, ticketweb_page
+
+
+def event(n: int, date: str = "2026-03-01") -> Event:
+    return Event(id=f"test-{n}", title=f"Band {n}", date=date, venue="Test Venue", source="test")
+
+
+class StreamingScraper(BaseScraper):
+    name = "Streaming"
+    id = "streaming"
+    url = "https://example.com/"
+
+    def __init__(self, events, fail_after=None):
+        self.events = events
+        self.fail_after = fail_after
+        self.yielded = 0
+
+    def parse_events(self, html):
+        return []
+
+    def iter_events(self):
+        for e in self.events:
+            if self.yielded == self.fail_after:
+                raise RuntimeError("page 3 timed out")
+            self.yielded += 1
+            yield e
+
+
+def test_batched():
+    assert list(batched(range(5), 2)) == [[0, 1], [2, 3], [4]]
+    assert list(batched([], 3)) == []
+
+
+def test_event_stream_counts_and_filters():
+    scraper = StreamingScraper([event(1, "2026-01-01"), event(2, "2026-06-01"), event(3, "2026-07-01")])
+    stream = EventStream(scraper, keep=lambda e: e.date >= "2026-03-01")
+    assert [e.id for e in stream] == ["test-2", "test-3"]
+    assert stream.count == 2
+    assert stream.error is None
+
+
+def test_event_stream_captures_scraper_failure():
+    stream = EventStream(StreamingScraper([event(n) for n in range(5)], fail_after=2))
+    assert [e.id for e in stream] == ["test-0", "test-1"]
+    assert stream.error == "page 3 timed out"
+
+
+def test_batches_are_consumed_before_the_source_finishes():
+    scraper = StreamingScraper([event(n) for n in range(10)])
+    batches = batched(EventStream(scraper), 3)
+    assert len(next(batches)) == 3
+    assert scraper.yielded == 3
+
+
+def test_base_iter_events_yields_scrape_result():
+    class ListScraper(StreamingScraper):
+        iter_events = BaseScraper.iter_events
+
+        def scrape(self):
+            return self.events
+
+    assert [e.id for e in ListScraper([event(1), event(2)]).iter_events()] == ["test-1", "test-2"]
+
+
+def test_iter_pages_yields_each_page_before_fetching_the_next():
+    site = FakeSite({n: ParsedPage(items=[n], next_page=n + 1) for n in range(1, 4)})
+    pages = iter_pages(site)
+    assert next(pages).items == [1]
+    assert site.requested == [1]
+    assert [p.items for p in pages] == [[2], [3]]
+
+
+def test_ticketweb_streams_per_page(monkeypatch):
+    scraper = TicketWebScraper("Test Venue", "test", "https://example.com/events")
+    pages = {0: ticketweb_page(["Band A", "Band B"], next_page=1), 1: ticketweb_page(["Band A", "Band C"])}
+    site = FakeSite(pages)
+    monkeypatch.setattr(scraper, "_fetch_page", site)
+    monkeypatch.setenv("SCRAPER_PARSE_WORKERS", "0")
+
+    events = scraper.iter_events()
+    assert next(events).title == "Band A"
+    assert site.requested == [0]
+    # "Band A" repeats on page 1 with the same date and is skipped
+    assert [e.id for e in events] == ["test-2026-03-02-band-b", "test-2026-03-02-band-c"]
+
+
+def test_run_all_scrapers_keeps_events_before_a_failure():
+    output = run_all_scrapers([StreamingScraper([event(n) for n in range(4)], fail_after=3)])
+    assert len(output.events) == 3
+    source = output.sources[0]
+    assert (source.status, source.eventCount, source.error) == ("error", 3, "page 3 timed out")
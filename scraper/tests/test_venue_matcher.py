@@ -88,3 +88,28 @@ class TestVenueMatcher:
         assert result is not None
         assert result[0] == "reverblounge"
         assert result[1] == "name"
+
+    def test_match_does_not_print(self, matcher, capsys):
+        matcher.match("waiting room")
+        matcher.match("Completely Different Venue")
+        assert capsys.readouterr().out == ""
+
+    def test_stats_count_match_types(self, matcher):
+        matcher.match("waiting room")
+        matcher.match("The Slowdown")
+        matcher.match("Waiting Room Loung")
+        matcher.match("Nowhere Bar")
+        matcher.match("Nowhere Bar")
+        assert matcher.stats["alias"] == 1
+        assert matcher.stats["name"] == 1
+        assert matcher.stats["fuzzy"] == 1
+        assert matcher.stats["unmatched"] == 2
+        assert matcher.unmatched["Nowhere Bar"] == 2
+
+    def test_summary_lists_unmatched(self, matcher):
+        matcher.match("reverb")
+        matcher.match("Nowhere Bar")
+        summary = matcher.summary()
+        assert "2 lookups" in summary
+        assert "alias 1" in summary
+        assert "Nowhere Bar (1)" in summary
@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-"""Archive past events to history.json without running scrapers.
+"""Archive past events to the history store without running scrapers.
 
 Used by the daily history update GitHub Action to ensure history stays
 current even when no new shows are found.
@@ -7,36 +7,44 @@ current even when no new shows are found.
 import sys
 from datetime import datetime, timezone, date
 from pathlib import Path
-import json
 
 sys.path.insert(0, str(Path(__file__).parent))
 
-from models import Event, ScraperOutput, HistoricalShow, ShowHistory
+from models import Event, ScraperOutput
+from feed_json import load_feed, write_feed
+from feed_shards import write_shards
+from feed_delta import write_delta
+from feed_compress import precompress
+from feed_ics import write_calendars
+from history_store import HistoryStore, open_store, show_of, split_past
+from history_columnar import write_columnar
+from search_index import write_search_index
 
 # Use public/ as the source of truth (that's what gets committed by scrape workflow)
 PUBLIC_DIR = Path(__file__).parent.parent / "public"
 EVENTS_PATH = PUBLIC_DIR / "events.json"
-HISTORY_PATH = PUBLIC_DIR / "history.json"
+HISTORY_DIR = PUBLIC_DIR / "history"  # Partitioned store, see history_store.py
+HISTORY_PATH = PUBLIC_DIR / "history.json"  # Pre-store history, folded into the store and removed
 
 
 def load_events() -> ScraperOutput:
-    if EVENTS_PATH.exists():
-        return ScraperOutput(**json.loads(EVENTS_PATH.read_text(encoding="utf-8")))
-    return ScraperOutput(events=[], lastUpdated="", sources=[])
+    return load_feed(EVENTS_PATH, ScraperOutput, ScraperOutput(events=[], lastUpdated="", sources=[]))
 
 
-def load_history() -> ShowHistory:
-    if HISTORY_PATH.exists():
-        return ShowHistory(**json.loads(HISTORY_PATH.read_text(encoding="utf-8")))
-    return ShowHistory(shows=[], lastUpdated="")
+def load_history() -> HistoryStore:
+    return open_store(HISTORY_DIR, legacy_json=HISTORY_PATH)
 
 
-def save_events(output: ScraperOutput):
-    EVENTS_PATH.write_text(output.model_dump_json(indent=2), encoding="utf-8")
-
-
-def save_history(history: ShowHistory):
-    HISTORY_PATH.write_text(history.model_dump_json(indent=2), encoding="utf-8")
+def save_events(output: ScraperOutput, previous: list[Event], history: HistoryStore):
+    if not write_feed(EVENTS_PATH, output):
+        print("events.json unchanged apart from timestamps, not rewritten")
+    precompress(EVENTS_PATH)
+    write_shards(output, PUBLIC_DIR)
+    write_delta(previous, output, PUBLIC_DIR)
+    write_calendars(output.events, output.sources, PUBLIC_DIR)
+    # History files are only rebuilt for the years archival touched
+    for path in write_search_index(output.events, history, PUBLIC_DIR) + write_columnar(history):
+        precompress(path)
 
 
 def run():
@@ -46,50 +54,30 @@ def run():
     # Load existing data
     current = load_events()
     history = load_history()
-    history_set = {(h.date, h.title, h.venue) for h in history.shows}
-
-    # Archive past events
-    archived = 0
-    active_events = []
-
-    for event in current.events:
-        if event.date < today:
-            # Move to history (dedupe)
-            key = (event.date, event.title, event.venue)
-            if key not in history_set:
-                history.shows.append(HistoricalShow(
-                    date=event.date,
-                    title=event.title,
-                    venue=event.venue,
-                    supportingArtists=event.supportingArtists
-                ))
-                history_set.add(key)
-                archived += 1
-        else:
-            active_events.append(event)
+
+    # events.json is saved sorted by date, so past events are a prefix
+    past_events, active_events = split_past(current.events, today)
+
+    # The store skips shows it already has
+    archived = history.append(map(show_of, past_events), now=now)
 
     print(f"History Update - {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M UTC')}")
     print(f"Events checked: {len(current.events)}")
     print(f"Archived to history: {archived}")
     print(f"Active events remaining: {len(active_events)}")
-    print(f"Total history: {len(history.shows)}")
+    print(f"Total history: {len(history)}")
 
     if archived == 0:
         print("\nNo events to archive. Files unchanged.")
         return False
 
-    # Sort and save
-    active_events.sort(key=lambda e: e.date)
-    history.shows.sort(key=lambda h: h.date, reverse=True)
-    history.lastUpdated = now
-
+    # Save (still sorted)
     output = ScraperOutput(
         events=active_events,
         lastUpdated=now,
         sources=current.sources  # Preserve existing source info
     )
-    save_events(output)
-    save_history(history)
+    save_events(output, previous=current.events, history=history)
 
     print(f"\n✓ Archived {archived} events to history")
     return True
@@ -6,12 +6,21 @@ Match priority:
 1. Exact match against venue aliases (case-insensitive)
 2. Exact match against venue name (case-insensitive, normalized)
 3. Fuzzy match against venue name (85% threshold)
+
+Per-lookup logging goes through the module logger at DEBUG level and is
+sampled; callers get an aggregated per-run view from summary() instead.
 """
+import logging
+from collections import Counter
 from difflib import SequenceMatcher
 from typing import Optional
 
 
 FUZZY_THRESHOLD = 0.85
+LOG_SAMPLE_EVERY = 50  # At DEBUG, log one in every N lookups (plus each new unmatched name)
+SUMMARY_UNMATCHED_LIMIT = 10
+
+logger = logging.getLogger(__name__)
 
 
 def normalize_venue_name(name: str) -> str:
@@ -39,6 +48,10 @@ class VenueMatcher:
         self._venues: list[dict] = []
         self._alias_map: dict[str, str] = {}  # normalized alias -> venue_id
         self._name_map: dict[str, str] = {}   # normalized name -> venue_id
+        self._fuzzy_names: list[tuple[str, str]] = []  # (venue_id, normalized name)
+        self.stats: Counter = Counter()       # match type -> count
+        self.unmatched: Counter = Counter()   # raw venue name -> misses
+        self._lookups = 0
         self._load_venues()
 
     def _load_venues(self):
@@ -49,7 +62,7 @@ class VenueMatcher:
             # Filter out "other" venue in Python as well (safeguard for tests/edge cases)
             self._venues = [v for v in (result.data or []) if v.get("id") != "other"]
 
-            print(f"VenueMatcher: Loaded {len(self._venues)} venues")
+            logger.info("VenueMatcher: Loaded %d venues", len(self._venues))
 
             # Build lookup maps
             for venue in self._venues:
@@ -59,14 +72,15 @@ class VenueMatcher:
                 normalized_name = normalize_venue_name(venue_name)
                 if normalized_name:
                     self._name_map[normalized_name] = venue_id
-                    print(f"  - {venue_id}: '{venue_name}' -> '{normalized_name}'")
+                    self._fuzzy_names.append((venue_id, normalized_name))
+                    logger.debug("  - %s: '%s' -> '%s'", venue_id, venue_name, normalized_name)
                 # Map all aliases (if column exists)
                 for alias in venue.get("aliases") or []:
                     normalized_alias = normalize_venue_name(alias)
                     if normalized_alias:
                         self._alias_map[normalized_alias] = venue_id
         except Exception as e:
-            print(f"VenueMatcher: Error loading venues: {e}")
+            logger.warning("VenueMatcher: Error loading venues: %s", e)
             self._venues = []
 
     def match(self, venue_name: str) -> Optional[tuple[str, str]]:
@@ -87,28 +101,55 @@ class VenueMatcher:
         if not normalized:
             return None
 
+        self._lookups += 1
+        result = self._lookup(normalized)
+
+        if result is None:
+            self.stats["unmatched"] += 1
+            self.unmatched[venue_name] += 1
+            if self.unmatched[venue_name] == 1:
+                logger.debug("  VenueMatcher: '%s' -> '%s' NO MATCH", venue_name, normalized)
+            return None
+
+        match_type = result[1].split(":", 1)[0]
+        self.stats[match_type] += 1
+        if self._lookups % LOG_SAMPLE_EVERY == 1 and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("  VenueMatcher: '%s' -> '%s' matched %s -> %s", venue_name, normalized, result[1], result[0])
+        return result
+
+    def _lookup(self, normalized: str) -> Optional[tuple[str, str]]:
         # Priority 1: Exact alias match
-        if normalized in self._alias_map:
-            print(f"  VenueMatcher: '{venue_name}' -> '{normalized}' matched alias -> {self._alias_map[normalized]}")
-            return (self._alias_map[normalized], "alias")
+        venue_id = self._alias_map.get(normalized)
+        if venue_id:
+            return (venue_id, "alias")
 
         # Priority 2: Exact name match
-        if normalized in self._name_map:
-            print(f"  VenueMatcher: '{venue_name}' -> '{normalized}' matched name -> {self._name_map[normalized]}")
-            return (self._name_map[normalized], "name")
+        venue_id = self._name_map.get(normalized)
+        if venue_id:
+            return (venue_id, "name")
 
         # Priority 3: Fuzzy match against venue names
         best_match: Optional[tuple[str, float]] = None
-        for venue in self._venues:
-            venue_normalized = normalize_venue_name(venue["name"])
+        for venue_id, venue_normalized in self._fuzzy_names:
             ratio = SequenceMatcher(None, normalized, venue_normalized).ratio()
             if ratio >= FUZZY_THRESHOLD:
                 if best_match is None or ratio > best_match[1]:
-                    best_match = (venue["id"], ratio)
+                    best_match = (venue_id, ratio)
 
         if best_match:
-            print(f"  VenueMatcher: '{venue_name}' -> '{normalized}' fuzzy matched -> {best_match[0]} ({best_match[1]:.2f})")
             return (best_match[0], f"fuzzy:{best_match[1]:.2f}")
 
-        print(f"  VenueMatcher: '{venue_name}' -> '{normalized}' NO MATCH (known: {list(self._name_map.keys())[:5]}...)")
         return None
+
+    def summary(self) -> str:
+        """One-line-per-topic summary of this run's lookups, for the end-of-run report."""
+        counts = ", ".join(f"{kind} {self.stats[kind]}" for kind in ("alias", "name", "fuzzy", "unmatched"))
+        lines = [f"VenueMatcher: {self._lookups} lookups ({counts})"]
+        if self.unmatched:
+            top = self.unmatched.most_common(SUMMARY_UNMATCHED_LIMIT)
+            names = ", ".join(f"{name} ({count})" for name, count in top)
+            more = len(self.unmatched) - len(top)
+            if more > 0:
+                names += f", ... and {more} more"
+            lines.append(f"  Unmatched venues: {names}")
+        return "\n".join(lines)
@@ -132,17 +132,28 @@ async function migrateEvents() {
 }
 
 async function migrateHistory() {
-  console.log('Loading history.json...')
-  const historyPath = path.join(__dirname, '../public/history.json')
+  // History is an append-only store: public/history/YYYY/YYYY-MM.jsonl (see scraper/history_store.py)
+  console.log('Loading public/history/...')
+  const historyDir = path.join(__dirname, '../public/history')
 
-  if (!fs.existsSync(historyPath)) {
-    console.log('No history.json found, skipping...')
+  if (!fs.existsSync(historyDir)) {
+    console.log('No history store found, skipping...')
     return 0
   }
 
-  const historyData = JSON.parse(fs.readFileSync(historyPath, 'utf-8'))
+  const shows: any[] = []
+  for (const year of fs.readdirSync(historyDir)) {
+    const yearDir = path.join(historyDir, year)
+    if (!fs.statSync(yearDir).isDirectory()) continue
+    for (const file of fs.readdirSync(yearDir)) {
+      if (!file.endsWith('.jsonl')) continue
+      for (const line of fs.readFileSync(path.join(yearDir, file), 'utf-8').split('\n')) {
+        if (line.trim()) shows.push(JSON.parse(line))
+      }
+    }
+  }
 
-  const historyEvents = historyData.shows.map((h: any) => {
+  const historyEvents = shows.map((h: any) => {
     const venueId = getVenueId(h.venue)
     const slug = slugify(h.title)
     const id = `${venueId}-${h.date}-${slug}`
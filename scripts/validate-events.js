@@ -11,10 +11,18 @@ import { fileURLToPath } from 'url';
 const __dirname = path.dirname(fileURLToPath(import.meta.url));
 const eventsPath = path.join(__dirname, '../public/events.json');
 
+// SCRAPER_JSON_FORMAT=short writes one- or two-letter keys plus a keyMap (short -> field name)
+function expandShortKeys(data) {
+  const keyMap = data.keyMap;
+  if (!keyMap) return data;
+  const expand = (item) => Object.fromEntries(Object.entries(item).map(([k, v]) => [keyMap[k] ?? k, v]));
+  return { ...data, events: (data.events || []).map(expand) };
+}
+
 function validate() {
   console.log('Validating events.json...\n');
 
-  const data = JSON.parse(fs.readFileSync(eventsPath, 'utf8'));
+  const data = expandShortKeys(JSON.parse(fs.readFileSync(eventsPath, 'utf8')));
   const errors = [];
   const warnings = [];
 
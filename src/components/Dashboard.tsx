@@ -122,7 +122,7 @@ export function Dashboard({
             onClick={() => setShowHistoryJson(!showHistoryJson)}
             className="text-sm text-blue-400 hover:text-blue-300"
           >
-            {showHistoryJson ? "Hide" : "Show"} history.json ({historyShows.length} shows)
+            {showHistoryJson ? "Hide" : "Show"} history ({historyShows.length} shows)
           </button>
           {showHistoryJson && (
             <pre className="mt-2 bg-gray-900 p-3 rounded-lg text-xs text-gray-300 overflow-auto max-h-96">